@@ -7,7 +7,7 @@ from comicsdb.models import Character
 
 @admin.register(Character)
 class CharacterAdmin(AdminImageMixin, admin.ModelAdmin):
-    search_fields = ("name", "alias")
+    search_fields = ("name__search_contains", "alias__search_contains")
     prepopulated_fields = {"slug": ("name",)}
     list_filter = ("created_on", "modified")
     autocomplete_fields = ["creators", "teams", "universes"]
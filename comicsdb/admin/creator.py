@@ -7,7 +7,7 @@ from comicsdb.models import Creator
 
 @admin.register(Creator)
 class CreatorAdmin(AdminImageMixin, admin.ModelAdmin):
-    search_fields = ("name", "alias")
+    search_fields = ("name__search_contains", "alias__search_contains")
     prepopulated_fields = {"slug": ("name",)}
     list_filter = ("created_on", "modified")
     readonly_fields = ("modified",)
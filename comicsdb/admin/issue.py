@@ -7,9 +7,9 @@ from django.utils.translation import ngettext
 from sorl.thumbnail.admin.current import AdminImageMixin
 
 from comicsdb.admin.util import AttributionInline
-from comicsdb.models import Creator, Credits, Issue, Rating, Role, Variant
-
-MAX_STORIES = 1
+from comicsdb.issue_edits import add_credits, add_reprint_info
+from comicsdb.models import Creator, Credits, Issue, Variant
+from comicsdb.reference import get_rating, get_role
 
 
 class FutureStoreDateListFilter(admin.SimpleListFilter):
@@ -137,23 +137,15 @@ class IssueAdmin(AdminImageMixin, admin.ModelAdmin):
     def add_dc_credits(self, request, queryset) -> None:
         jim = Creator.objects.get(slug="jim-lee")
         marie = Creator.objects.get(slug="marie-javins")
-        eic = Role.objects.get(name__iexact="editor in chief")
-        pub = Role.objects.get(name__iexact="publisher")
-        prez = Role.objects.get(name__iexact="president")
-        chief = Role.objects.get(name__iexact="Chief Creative Officer")
-        count = 0
-        for i in queryset:
-            modified = False
-            jc, create = Credits.objects.get_or_create(issue=i, creator=jim)
-            if create:
-                jc.role.add(pub, chief, prez)
-                modified = True
-            mc, create = Credits.objects.get_or_create(issue=i, creator=marie)
-            if create:
-                mc.role.add(eic)
-                modified = True
-            if modified:
-                count += 1
+        roles = {
+            jim.pk: [
+                get_role("publisher"),
+                get_role("Chief Creative Officer"),
+                get_role("president"),
+            ],
+            marie.pk: [get_role("editor in chief")],
+        }
+        count = len(add_credits(queryset, roles).issues)
 
         self.message_user(
             request,
@@ -169,13 +161,7 @@ class IssueAdmin(AdminImageMixin, admin.ModelAdmin):
     @admin.action(description="Add current Marvel EIC")
     def add_marvel_credits(self, request, queryset) -> None:
         cb = Creator.objects.get(slug="c-b-cebulski")
-        eic = Role.objects.get(name__iexact="editor in chief")
-        count = 0
-        for i in queryset:
-            cred, create = Credits.objects.get_or_create(issue=i, creator=cb)
-            if create:
-                cred.role.add(eic)
-                count += 1
+        count = len(add_credits(queryset, {cb.pk: [get_role("editor in chief")]}).issues)
 
         self.message_user(
             request,
@@ -190,29 +176,7 @@ class IssueAdmin(AdminImageMixin, admin.ModelAdmin):
 
     @admin.action(description="Add info from reprints")
     def add_reprint_info(self, request, queryset) -> None:
-        count = 0
-        for i in queryset:
-            modified = False
-            for reprint in i.reprints.all():
-                # If reprint is not a single story let's bail.
-                if len(reprint.name) <= MAX_STORIES:
-                    modified = True
-                    # Add stories
-                    if reprint.name:
-                        for story in reprint.name:
-                            if story not in i.name:
-                                i.name.append(story)
-                        i.save()
-                    # Add characters
-                    for character in reprint.characters.all():
-                        if character not in i.characters.all():
-                            i.characters.add(character)
-                    # Add Teams
-                    for team in reprint.teams.all():
-                        if team not in i.teams.all():
-                            i.teams.add(team)
-            if modified:
-                count += 1
+        count = len(add_reprint_info(queryset).issues)
 
         self.message_user(
             request,
@@ -227,8 +191,8 @@ class IssueAdmin(AdminImageMixin, admin.ModelAdmin):
 
     @admin.action(description="Add teen rating")
     def add_teen_rating(self, request, queryset) -> None:
-        unknown = Rating.objects.get(name="Unknown")
-        teen = Rating.objects.get(name="Teen")
+        unknown = get_rating("Unknown")
+        teen = get_rating("Teen")
 
         for qs in queryset:
             if qs.rating == unknown:
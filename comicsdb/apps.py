@@ -1,7 +1,20 @@
 from django.apps import AppConfig
-from django.db.models.signals import pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 
-from comicsdb.signals import pre_delete_credit, pre_delete_image
+from comicsdb.signals import (
+    DETAIL_DEPENDENTS,
+    DETAIL_PAGES,
+    detail_page_cache,
+    issue_cache,
+    issue_child_cache,
+    issue_related_cache,
+    m2m_changed_credit_cache,
+    m2m_changed_detail_page_cache,
+    m2m_changed_issue_cache,
+    pre_delete_credit,
+    pre_delete_image,
+    reference_cache,
+)
 
 
 class ComicsdbConfig(AppConfig):
@@ -38,3 +51,273 @@ class ComicsdbConfig(AppConfig):
         pre_delete.connect(
             pre_delete_credit, sender=credits_, dispatch_uid="pre_delete_credits"
         )
+
+        series = self.get_model("Series")
+        universe = self.get_model("Universe")
+
+        # Invalidate the cached API representations of issues when they, or anything
+        # they embed, change. Deletions are handled before the relations are removed.
+        for signal in (post_save, pre_delete):
+            name = "save" if signal is post_save else "delete"
+            signal.connect(issue_cache, sender=issue, dispatch_uid=f"{name}_issue_cache")
+            for model in (credits_, variant):
+                signal.connect(
+                    issue_child_cache,
+                    sender=model,
+                    dispatch_uid=f"{name}_{model._meta.model_name}_issue_cache",
+                )
+            for model in (arc, character, creator, series, team, universe):
+                signal.connect(
+                    issue_related_cache,
+                    sender=model,
+                    dispatch_uid=f"{name}_{model._meta.model_name}_issue_cache",
+                )
+            for model_name in (
+                "Genre",
+                "Imprint",
+                "Publisher",
+                "Rating",
+                "Role",
+                "SeriesType",
+            ):
+                signal.connect(
+                    reference_cache,
+                    sender=self.get_model(model_name),
+                    dispatch_uid=f"{name}_{model_name.lower()}_issue_cache",
+                )
+
+        for field in ("arcs", "characters", "reprints", "teams", "universes"):
+            m2m_changed.connect(
+                m2m_changed_issue_cache,
+                sender=getattr(issue, field).through,
+                dispatch_uid=f"m2m_changed_issue_{field}_cache",
+            )
+        m2m_changed.connect(
+            m2m_changed_credit_cache,
+            sender=credits_.role.through,
+            dispatch_uid="m2m_changed_credits_role_cache",
+        )
+        m2m_changed.connect(
+            reference_cache,
+            sender=series.genres.through,
+            dispatch_uid="m2m_changed_series_genres_cache",
+        )
+
+        self.connect_change_log()
+        self.connect_counters()
+        self.connect_identifiers()
+        self.connect_search_index()
+        self.connect_rollups()
+        self.connect_detail_pages()
+        self.connect_reference_tables()
+        self.connect_thumbnails()
+
+    def connect_change_log(self):
+        from comicsdb.models import change  # noqa: PLC0415 - the module imports the models.
+
+        for model_name in (
+            "Arc",
+            "Character",
+            "Creator",
+            "Credits",
+            "Imprint",
+            "Issue",
+            "Publisher",
+            "Series",
+            "Team",
+            "Universe",
+        ):
+            name = model_name.lower()
+            post_save.connect(
+                change.post_save_change,
+                sender=self.get_model(model_name),
+                dispatch_uid=f"post_save_change_{name}",
+            )
+            post_delete.connect(
+                change.post_delete_change,
+                sender=self.get_model(model_name),
+                dispatch_uid=f"post_delete_change_{name}",
+            )
+        for model_name, fields in (
+            ("Character", ("creators", "teams", "universes")),
+            ("Credits", ("role",)),
+            ("Issue", ("arcs", "characters", "reprints", "teams", "universes")),
+            ("Series", ("associated", "genres")),
+            ("Team", ("creators", "universes")),
+        ):
+            model = self.get_model(model_name)
+            for field in fields:
+                through = getattr(model, field).through
+                m2m_changed.connect(
+                    change.m2m_changed_change,
+                    sender=through,
+                    dispatch_uid=f"m2m_changed_change_{through._meta.model_name}",
+                )
+
+    def connect_counters(self):
+        from comicsdb import counters  # noqa: PLC0415 - the module imports the models.
+
+        issue = self.get_model("Issue")
+        pre_save.connect(
+            counters.pre_save_issue_counts, sender=issue, dispatch_uid="pre_save_issue_counts"
+        )
+        post_save.connect(
+            counters.post_save_issue_counts,
+            sender=issue,
+            dispatch_uid="post_save_issue_counts",
+        )
+        pre_delete.connect(
+            counters.pre_delete_issue_counts,
+            sender=issue,
+            dispatch_uid="pre_delete_issue_counts",
+        )
+        post_delete.connect(
+            counters.post_delete_issue_counts,
+            sender=issue,
+            dispatch_uid="post_delete_issue_counts",
+        )
+        for name in counters.ISSUE_RELATIONS:
+            m2m_changed.connect(
+                counters.m2m_changed_issue_counts,
+                sender=getattr(issue, name).through,
+                dispatch_uid=f"m2m_changed_issue_{name}_counts",
+            )
+
+        credits_ = self.get_model("Credits")
+        post_save.connect(
+            counters.credit_counts, sender=credits_, dispatch_uid="post_save_credits_counts"
+        )
+        post_delete.connect(
+            counters.credit_counts, sender=credits_, dispatch_uid="post_delete_credits_counts"
+        )
+
+        series = self.get_model("Series")
+        pre_save.connect(
+            counters.pre_save_series_counts,
+            sender=series,
+            dispatch_uid="pre_save_series_counts",
+        )
+        post_save.connect(
+            counters.post_save_series_counts,
+            sender=series,
+            dispatch_uid="post_save_series_counts",
+        )
+        post_delete.connect(
+            counters.post_delete_series_counts,
+            sender=series,
+            dispatch_uid="post_delete_series_counts",
+        )
+
+    def connect_identifiers(self):
+        from comicsdb.models import identifier  # noqa: PLC0415 - the module imports the models.
+
+        for model_name in ("Issue", "Variant"):
+            name = model_name.lower()
+            pre_save.connect(
+                identifier.pre_save_identifiers,
+                sender=self.get_model(model_name),
+                dispatch_uid=f"pre_save_identifiers_{name}",
+            )
+            post_save.connect(
+                identifier.post_save_identifiers,
+                sender=self.get_model(model_name),
+                dispatch_uid=f"post_save_identifiers_{name}",
+            )
+
+    def connect_search_index(self):
+        from comicsdb import search_index  # noqa: PLC0415 - the module imports the models.
+
+        for model in search_index.SEARCH_MODELS:
+            name = model._meta.model_name
+            post_save.connect(
+                search_index.post_save_search_entry,
+                sender=model,
+                dispatch_uid=f"post_save_{name}_search_entry",
+            )
+            post_delete.connect(
+                search_index.post_delete_search_entry,
+                sender=model,
+                dispatch_uid=f"post_delete_{name}_search_entry",
+            )
+
+        series = self.get_model("Series")
+        pre_save.connect(
+            search_index.pre_save_series_search_entry,
+            sender=series,
+            dispatch_uid="pre_save_series_search_entry",
+        )
+        post_save.connect(
+            search_index.post_save_series_search_entry,
+            sender=series,
+            dispatch_uid="post_save_series_issues_search_entry",
+        )
+
+    def connect_rollups(self):
+        from comicsdb import rollups  # noqa: PLC0415 - the module imports the models.
+
+        for model in rollups.ROLLUP_MODELS:
+            name = model._meta.model_name
+            post_save.connect(
+                rollups.post_save_rollup, sender=model, dispatch_uid=f"post_save_{name}_rollup"
+            )
+            post_delete.connect(
+                rollups.post_delete_rollup,
+                sender=model,
+                dispatch_uid=f"post_delete_{name}_rollup",
+            )
+        pre_delete.connect(
+            rollups.pre_delete_issue_rollup,
+            sender=self.get_model("Issue"),
+            dispatch_uid="pre_delete_issue_rollup",
+        )
+
+    def connect_detail_pages(self):
+        # Deletions are handled before the relations are removed.
+        for model_name in DETAIL_PAGES | set(DETAIL_DEPENDENTS):
+            for signal in (post_save, pre_delete):
+                name = "save" if signal is post_save else "delete"
+                signal.connect(
+                    detail_page_cache,
+                    sender=self.get_model(model_name),
+                    dispatch_uid=f"{name}_{model_name}_detail_page_cache",
+                )
+        for model_name, fields in (
+            ("Character", ("creators", "teams", "universes")),
+            ("Credits", ("role",)),
+            ("Issue", ("arcs", "characters", "reprints", "teams", "universes")),
+            ("Team", ("creators", "universes")),
+        ):
+            model = self.get_model(model_name)
+            for field in fields:
+                m2m_changed.connect(
+                    m2m_changed_detail_page_cache,
+                    sender=getattr(model, field).through,
+                    dispatch_uid=f"m2m_changed_{model_name.lower()}_{field}_detail_page_cache",
+                )
+
+    def connect_reference_tables(self):
+        from comicsdb import reference  # noqa: PLC0415 - the module imports the models.
+
+        for name, table in reference.REFERENCE_TABLES.items():
+            for signal in (post_save, post_delete):
+                action = "save" if signal is post_save else "delete"
+                signal.connect(
+                    reference.reference_table_changed,
+                    sender=table.model,
+                    dispatch_uid=f"{action}_{name}_reference_table",
+                )
+        m2m_changed.connect(
+            reference.reference_table_changed,
+            sender=reference.FlatPage.sites.through,
+            dispatch_uid="m2m_changed_flatpages_sites_reference_table",
+        )
+
+    def connect_thumbnails(self):
+        from comicsdb import thumbnails  # noqa: PLC0415 - the module imports the models.
+
+        for model in thumbnails.THUMBNAILS:
+            post_save.connect(
+                thumbnails.post_save_thumbnails,
+                sender=model,
+                dispatch_uid=f"post_save_{model._meta.model_name}_thumbnails",
+            )
@@ -0,0 +1,191 @@
+"""
+Autocomplete lookups for the select widgets of the forms.
+
+Every word of the term has to be a substring of one of the `search_contains` fields,
+which is matched against their pg_trgm indexes (see `comicsdb.search`), and the results
+are ranked by trigram similarity. The ranked primary keys are cached for a short while
+in the `select2` cache, per lookup & normalized term. While a term is being typed, the
+narrower terms are refined from the cached results of its prefix, as long as those
+weren't cut off, instead of querying the database again.
+"""
+
+import hashlib
+import re
+import unicodedata
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.cache import caches
+from django.db.models import F, Func, IntegerField, Q, QuerySet, Value
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Greatest
+
+from comicsdb.search import SearchContains, SearchText
+
+AUTOCOMPLETE_CACHE_TTL = 60 * 5
+# Maximum number of ranked results kept for a term.
+MAX_CANDIDATES = 200
+WORD_RE = re.compile(r"[^\W_]+")
+
+
+class ArrayPosition(Func):
+    function = "array_position"
+    output_field = IntegerField()
+
+
+def normalize(value: str) -> str:
+    """Unaccent, upper-case & collapse the whitespace of a term, like `trigram_text`."""
+    value = unicodedata.normalize("NFKD", value)
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    return " ".join(value.upper().split())
+
+
+def trigrams(value: str) -> set[str]:
+    grams = set()
+    for word in WORD_RE.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """Trigram similarity of two strings, computed as pg_trgm's `similarity()` does."""
+    a_grams, b_grams = trigrams(a), trigrams(b)
+    shared = len(a_grams & b_grams)
+    total = len(a_grams) + len(b_grams) - shared
+    return shared / total if total else 0.0
+
+
+def parse_search_fields(search_fields) -> tuple[list[str], list[str]]:
+    """
+    Split select2 style search fields into the fields searched by substring (with the
+    `search_contains` lookup) and the fields that are matched exactly.
+    """
+    substring_fields, exact_fields = [], []
+    for search_field in search_fields:
+        path, _, lookup = search_field.rpartition(LOOKUP_SEP)
+        if lookup == SearchContains.lookup_name:
+            substring_fields.append(path)
+        else:
+            exact_fields.append(search_field.removesuffix(f"{LOOKUP_SEP}exact"))
+    return substring_fields, exact_fields
+
+
+def cache_key(key: str, term: str) -> str:
+    digest = hashlib.md5(term.encode(), usedforsecurity=False).hexdigest()
+    return f"autocomplete:{key}:{digest}"
+
+
+def matches(row, words: list[str]) -> bool:
+    """Python version of the condition built by `query_rows`, for cached rows."""
+    _, texts, exact = row
+    found = [any(word in text for text in texts) for word in words]
+    if exact and not any(found):
+        return False
+    return all(found[i] or word in exact for i, word in enumerate(words))
+
+
+def rank(rows, term: str) -> list:
+    return sorted(
+        rows, key=lambda row: -max((similarity(term, text) for text in row[1]), default=0)
+    )
+
+
+def query_rows(queryset: QuerySet, substring_fields, exact_fields, term: str) -> list:
+    texts = {
+        f"trgm_text_{i}": F(f"{path}{LOOKUP_SEP}{SearchText.lookup_name}")
+        for i, path in enumerate(substring_fields)
+    }
+    condition = Q()
+    any_substring = Q()
+    for word in term.split():
+        substring = Q()
+        for alias in texts:
+            substring |= Q(**{f"{alias}__contains": word})
+        word_condition = substring
+        for field in exact_fields:
+            word_condition |= Q(**{f"{field}__iexact": word})
+        condition &= word_condition
+        any_substring |= substring
+    if exact_fields:
+        # Exact fields can't narrow down the trigram index scan, so at least one word has
+        # to match a substring field.
+        condition &= any_substring
+
+    similarities = [TrigramSimilarity(F(alias), Value(term)) for alias in texts]
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    rows = (
+        queryset.annotate(**texts)
+        .filter(condition)
+        .annotate(
+            trgm_rank=similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+        )
+        .order_by("-trgm_rank", *ordering, "pk")
+        .values_list("pk", *texts, *exact_fields)[:MAX_CANDIDATES]
+    )
+    return [
+        (
+            row[0],
+            [text or "" for text in row[1 : len(texts) + 1]],
+            [normalize(str(value)) for value in row[len(texts) + 1 :] if value is not None],
+        )
+        for row in rows
+    ]
+
+
+def ranked_ids(queryset: QuerySet, key: str, search_fields, term: str) -> list[int]:
+    """
+    Return the primary keys of the objects of the queryset matching the term, best
+    matches first. The queryset must be the same for every call with the same key.
+    """
+    cache = caches["select2"]
+    substring_fields, exact_fields = parse_search_fields(search_fields)
+    # Cached results of the term itself, or of its prefixes, longest first.
+    prefixes = [term[:i].rstrip() for i in range(len(term), 0, -1)]
+    cached = cache.get_many([cache_key(key, prefix) for prefix in prefixes])
+
+    entry = None
+    for prefix in prefixes:
+        found = cached.get(cache_key(key, prefix))
+        if found is None:
+            continue
+        if prefix == term:
+            return [row[0] for row in found["rows"]]
+        # A word only matching an exact field can't be narrowed down from its prefix.
+        if found["complete"] and (not exact_fields or term[len(prefix)] == " "):
+            rows = rank([row for row in found["rows"] if matches(row, term.split())], term)
+            entry = {"complete": True, "rows": rows}
+            break
+
+    if entry is None:
+        rows = query_rows(queryset, substring_fields, exact_fields, term)
+        entry = {"complete": len(rows) < MAX_CANDIDATES, "rows": rows}
+    cache.set(cache_key(key, term), entry, AUTOCOMPLETE_CACHE_TTL)
+    return [row[0] for row in entry["rows"]]
+
+
+def autocomplete_queryset(queryset: QuerySet, key: str, search_fields, term: str) -> QuerySet:
+    """Filter the queryset to the objects matching the term, in order of similarity."""
+    term = normalize(term)
+    if not term:
+        return queryset
+    ids = ranked_ids(queryset, key, search_fields, term)
+    position = ArrayPosition(Value(ids, output_field=ArrayField(IntegerField())), F("pk"))
+    return queryset.filter(pk__in=ids).order_by(position)
+
+
+class AutocompleteWidgetMixin:
+    """
+    Search the `search_fields` of a django-select2 model widget with `autocomplete_queryset`,
+    instead of a sequential scan for every keystroke.
+    """
+
+    def filter_queryset(self, request, term, queryset=None, **dependent_fields):
+        if queryset is None:
+            queryset = self.get_queryset()
+        if dependent_fields:
+            queryset = queryset.filter(**dependent_fields)
+        key = type(self).__name__
+        if dependent_fields:
+            key += ":" + ",".join(f"{k}={v}" for k, v in sorted(dependent_fields.items()))
+        return autocomplete_queryset(queryset, key, self.get_search_fields(), term)
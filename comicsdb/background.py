@@ -0,0 +1,39 @@
+"""
+In-process pool of background threads, for the work that doesn't have to be done before
+the response is sent, like generating thumbnails or hashing covers.
+
+There's no task queue, so jobs are lost if the process stops before running them; the
+commands recomputing their results catch up with any that were.
+"""
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.db import connection, transaction
+
+LOGGER = logging.getLogger(__name__)
+
+BACKGROUND_WORKERS = 4
+
+_executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="background")
+
+
+def run_job(job: Callable, *args):
+    try:
+        return job(*args)
+    except Exception:
+        LOGGER.exception("Background job %s failed", job.__name__)
+        raise
+    finally:
+        # The threads outlive the jobs, so they don't keep a connection open.
+        connection.close()
+
+
+def run_in_background(job: Callable, *args) -> Future:
+    return _executor.submit(run_job, job, *args)
+
+
+def run_after_commit(job: Callable, *args) -> None:
+    """Run a job in the background once the current transaction commits."""
+    transaction.on_commit(lambda: run_in_background(job, *args))
@@ -0,0 +1,35 @@
+from django.db.models import Model
+
+BATCH_SIZE = 1000
+
+
+def bulk_add_m2m(instances: list[Model], field_name: str, related: list[list[Model]]) -> int:
+    """
+    Add the related objects for many instances of a many-to-many field with a single
+    insert into its through table, instead of calling `add()` for every instance.
+
+    `related` holds the objects to add for each instance, in the same order as `instances`.
+    Rows that already exist are skipped. Returns the number of rows written.
+    """
+    if not instances:
+        return 0
+
+    field = instances[0]._meta.get_field(field_name)
+    through = field.remote_field.through
+    source = through._meta.get_field(field.m2m_field_name()).attname
+    target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+
+    pairs = set()
+    for instance, objs in zip(instances, related, strict=True):
+        for obj in objs or []:
+            pairs.add((instance.pk, obj.pk))
+            # Symmetrical relations (like Issue.reprints) store a row for each direction.
+            if field.remote_field.symmetrical:
+                pairs.add((obj.pk, instance.pk))
+
+    through.objects.bulk_create(
+        [through(**{source: src, target: dst}) for src, dst in pairs],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    return len(pairs)
@@ -0,0 +1,167 @@
+"""
+Cache of the serialized representations returned by the API retrieve actions.
+
+Entries are keyed by model & primary key, and are deleted when the object, or anything
+embedded in its representation, changes. Changes to the small reference tables embedded
+everywhere (publishers, imprints, series types, genres, ratings & roles) bump a shared
+generation instead, which makes every cached entry stale at once.
+
+Also holds `get_or_refresh`, the stale-while-revalidate cache of the values computed by
+the aggregate views, like the home & statistics pages, and the versions keying the cached
+fragments of the detail pages.
+"""
+
+import math
+import random
+import time
+from collections.abc import Callable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+
+# Time to live of the cached representations, as a backstop for missed invalidations.
+RETRIEVE_CACHE_TTL = 60 * 60 * 24
+GENERATION_KEY = "api:retrieve:generation"
+DELETE_BATCH_SIZE = 1000
+
+
+def retrieve_cache_key(model_name: str, pk) -> str:
+    return f"api:retrieve:{model_name}:{pk}"
+
+
+def get_cached_representation(model_name: str, pk) -> tuple[dict | None, int]:
+    """
+    Return the cached entry for an object, if it's still current, along with the current
+    generation that a new entry has to be stored with.
+    """
+    key = retrieve_cache_key(model_name, pk)
+    values = cache.get_many([key, GENERATION_KEY])
+    generation = values.get(GENERATION_KEY, 0)
+    entry = values.get(key)
+    if entry is not None and entry["generation"] != generation:
+        entry = None
+    return entry, generation
+
+
+def set_cached_representation(model_name: str, pk, entry: dict) -> None:
+    cache.set(retrieve_cache_key(model_name, pk), entry, RETRIEVE_CACHE_TTL)
+
+
+def invalidate_representations(model_name: str, pks) -> None:
+    """Delete the cached entries of the objects, once the current transaction commits."""
+    keys = [retrieve_cache_key(model_name, pk) for pk in pks]
+    if not keys:
+        return
+
+    def delete():
+        for i in range(0, len(keys), DELETE_BATCH_SIZE):
+            cache.delete_many(keys[i : i + DELETE_BATCH_SIZE])
+
+    transaction.on_commit(delete)
+
+
+def invalidate_all_representations() -> None:
+    """Make every cached entry stale, once the current transaction commits."""
+    transaction.on_commit(lambda: cache.set(GENERATION_KEY, time.time_ns(), None))
+
+
+# Stale-while-revalidate cache of computed values.
+# Time a stale value is still served for after it expired, while it's being refreshed.
+STALE_TTL = 60 * 60
+REFRESH_LOCK_TTL = 60
+# How long a request without any value to serve waits for another one computing it.
+REFRESH_WAIT = 5
+REFRESH_POLL_INTERVAL = 0.05
+
+
+def refresh_cached_value(key: str, compute: Callable, ttl: int):
+    """Compute & cache a value, materializing it if it's a queryset."""
+    start = time.monotonic()
+    value = compute()
+    if isinstance(value, QuerySet):
+        value = list(value)
+    entry = {"value": value, "delta": time.monotonic() - start, "expires": time.time() + ttl}
+    cache.set(key, entry, ttl + STALE_TTL)
+    return value
+
+
+def get_or_refresh(key: str, compute: Callable, ttl: int, *, beta: float = 1.0):
+    """
+    Return the cached value of the key, calling `compute` to cache it again once it's
+    expired, without every concurrent request recomputing it at once.
+
+    A single request at a time refreshes a key, holding a lock in the cache, while the
+    others are served the stale value. To avoid having to serve it at all, a request
+    refreshes the value early with a probability increasing as the expiry gets closer,
+    scaled by how long the computation takes and by `beta` (the XFetch algorithm).
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        # 1 - random() is in (0, 1], so the logarithm is defined.
+        early = entry["delta"] * beta * -math.log(1 - random.random())  # noqa: S311
+        if time.time() + early < entry["expires"]:
+            return entry["value"]
+
+    lock = f"{key}:refresh"
+    if cache.add(lock, True, REFRESH_LOCK_TTL):
+        try:
+            return refresh_cached_value(key, compute, ttl)
+        finally:
+            cache.delete(lock)
+    if entry is not None:
+        return entry["value"]
+
+    # Nothing to serve yet, so wait for the request computing the value.
+    deadline = time.monotonic() + REFRESH_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(REFRESH_POLL_INTERVAL)
+        if (entry := cache.get(key)) is not None:
+            return entry["value"]
+    return refresh_cached_value(key, compute, ttl)
+
+
+# Rendered fragments of the detail pages.
+# Time to live of the fragments, which also bounds how long the navigation to the
+# neighbouring objects, that isn't tracked, can be stale for.
+DETAIL_CACHE_TTL = 60 * 60 * 24
+
+
+def detail_version_key(model_name: str, pk) -> str:
+    return f"detail:version:{model_name}:{pk}"
+
+
+def detail_fragment_key(obj, dependencies=(), variant: str = "") -> str:
+    """
+    Return the key of the cached fragments of an object's detail page. Besides the
+    object's identity, it's made of its `modified` timestamp, the shared generation & the
+    versions of the object and of the (model name, pk) pairs of the other objects the
+    page depends on, so bumping any of them makes the fragments stale.
+    """
+    keys = [
+        detail_version_key(model_name, pk)
+        for model_name, pk in [(obj._meta.model_name, obj.pk), *dependencies]
+    ]
+    versions = cache.get_many([GENERATION_KEY, *keys])
+    parts = [
+        obj._meta.model_name,
+        str(obj.pk),
+        obj.modified.isoformat(),
+        *(str(versions.get(key, 0)) for key in [GENERATION_KEY, *keys]),
+        variant,
+    ]
+    return ":".join(parts)
+
+
+def invalidate_detail_pages(model_name: str, pks) -> None:
+    """Bump the versions of the objects' detail pages, once the current transaction commits."""
+    keys = [detail_version_key(model_name, pk) for pk in set(pks) if pk is not None]
+    if not keys:
+        return
+
+    def bump():
+        version = time.time_ns()
+        for i in range(0, len(keys), DELETE_BATCH_SIZE):
+            cache.set_many(dict.fromkeys(keys[i : i + DELETE_BATCH_SIZE], version), None)
+
+    transaction.on_commit(bump)
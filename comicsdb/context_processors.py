@@ -1,5 +1,8 @@
-from comicsdb.models.announcement import Announcement
+from django.utils.functional import SimpleLazyObject
+
+from comicsdb.reference import active_announcements
 
 
 def announcement_context_processor(request):
-    return {"active_announcements": Announcement.active_announcements()}
+    # Only the pages showing the announcements read them.
+    return {"active_announcements": SimpleLazyObject(active_announcements)}
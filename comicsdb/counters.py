@@ -0,0 +1,136 @@
+"""
+Maintenance of the denormalized `num_issues` & `num_series` counter columns.
+
+The counters are recomputed from the relations with a single `UPDATE` for every set of
+affected objects, from the signal receivers connected in `ComicsdbConfig.ready()`, and
+for every object by the `update_counts` command as a periodic reconciliation.
+"""
+
+from django.db.models import Count, IntegerField, Model, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+from comicsdb.models import (
+    Arc,
+    Character,
+    Creator,
+    Credits,
+    Imprint,
+    Issue,
+    Publisher,
+    Series,
+    Team,
+    Universe,
+)
+
+# Model -> (counter field, queryset of the counted rows, field pointing to the model)
+COUNTERS: dict[type[Model], tuple[str, QuerySet, str]] = {
+    Series: ("num_issues", Issue.objects.all(), "series"),
+    Creator: ("num_issues", Credits.objects.all(), "creator"),
+    Arc: ("num_issues", Issue.arcs.through.objects.all(), "arc"),
+    Character: ("num_issues", Issue.characters.through.objects.all(), "character"),
+    Team: ("num_issues", Issue.teams.through.objects.all(), "team"),
+    Universe: ("num_issues", Issue.universes.through.objects.all(), "universe"),
+    Publisher: ("num_series", Series.objects.all(), "publisher"),
+    Imprint: ("num_series", Series.objects.all(), "imprint"),
+}
+# Many-to-many fields of Issue that are counted.
+ISSUE_RELATIONS = ("arcs", "characters", "teams", "universes")
+
+
+def count_subquery(queryset: QuerySet, field: str) -> Coalesce:
+    counts = (
+        queryset.order_by()
+        .filter(**{field: OuterRef("pk")})
+        .values(field)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def update_counts(model: type[Model], pks=None) -> int:
+    """
+    Recompute the counter of the given objects of the model, or of all of them if no
+    primary keys are given. Returns the number of updated rows.
+    """
+    counter, queryset, field = COUNTERS[model]
+    objects = model.objects.all()
+    if pks is not None:
+        pks = {pk for pk in pks if pk is not None}
+        if not pks:
+            return 0
+        objects = objects.filter(pk__in=pks)
+    return objects.update(**{counter: count_subquery(queryset, field)})
+
+
+def update_issue_relation_counts(issue_relations: dict[str, set]) -> None:
+    """Recompute the counters of the objects related to issues, by Issue field name."""
+    for name, pks in issue_relations.items():
+        update_counts(Issue._meta.get_field(name).related_model, pks)
+
+
+# Signal receivers
+def pre_save_issue_counts(sender, instance: Issue, **kwargs) -> None:
+    # Remember the previous series, so its counter is also updated if the issue moved.
+    instance._previous_series_id = instance.previous("series")
+
+
+def post_save_issue_counts(sender, instance: Issue, created, **kwargs) -> None:
+    previous = getattr(instance, "_previous_series_id", None)
+    if created or previous != instance.series_id:
+        update_counts(Series, [instance.series_id, previous])
+
+
+def pre_delete_issue_counts(sender, instance: Issue, **kwargs) -> None:
+    # The relations are deleted without sending m2m_changed, so they're saved beforehand.
+    instance._previous_relations = {
+        name: set(getattr(instance, name).values_list("pk", flat=True))
+        for name in ISSUE_RELATIONS
+    }
+
+
+def post_delete_issue_counts(sender, instance: Issue, **kwargs) -> None:
+    update_counts(Series, [instance.series_id])
+    update_issue_relation_counts(getattr(instance, "_previous_relations", {}))
+
+
+def credit_counts(sender, instance: Credits, **kwargs) -> None:
+    update_counts(Creator, [instance.creator_id])
+
+
+def pre_save_series_counts(sender, instance: Series, **kwargs) -> None:
+    instance._previous_publishers = {
+        "publisher_id": instance.previous("publisher"),
+        "imprint_id": instance.previous("imprint"),
+    }
+
+
+def post_save_series_counts(sender, instance: Series, created, **kwargs) -> None:
+    previous = getattr(instance, "_previous_publishers", {})
+    if created or previous.get("publisher_id") != instance.publisher_id:
+        update_counts(Publisher, [instance.publisher_id, previous.get("publisher_id")])
+    if created or previous.get("imprint_id") != instance.imprint_id:
+        update_counts(Imprint, [instance.imprint_id, previous.get("imprint_id")])
+
+
+def post_delete_series_counts(sender, instance: Series, **kwargs) -> None:
+    update_counts(Publisher, [instance.publisher_id])
+    update_counts(Imprint, [instance.imprint_id])
+
+
+def m2m_changed_issue_counts(sender, instance, action, **kwargs) -> None:
+    name = next(name for name in ISSUE_RELATIONS if getattr(Issue, name).through is sender)
+    related_model = Issue._meta.get_field(name).related_model
+    if action == "pre_clear":
+        if not kwargs["reverse"]:
+            instance._cleared_pks = set(getattr(instance, name).values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if kwargs["reverse"]:
+        update_counts(related_model, [instance.pk])
+    elif action == "post_clear":
+        update_counts(related_model, getattr(instance, "_cleared_pks", set()))
+    else:
+        update_counts(related_model, kwargs["pk_set"] or set())
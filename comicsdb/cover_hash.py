@@ -0,0 +1,95 @@
+"""
+Helpers to find issues with similar covers.
+
+Covers are compared by the Hamming distance of their 64-bit perceptual hashes. To avoid
+comparing against every issue, the hashes are split into four 16-bit chunks that are
+indexed separately (multi-index hashing). Two hashes within a distance `d` must have at
+least one chunk within `d // 4` bits of each other, so only the issues that match one of
+those chunk variants need to be compared.
+"""
+
+import itertools
+
+import imagehash
+from django.db.models import F, Q, QuerySet
+from PIL import Image
+
+HASH_BITS = 64
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+NUM_CHUNKS = HASH_BITS // CHUNK_BITS
+MAX_DISTANCE = 11
+# Size of the image the perceptual hash is computed from (8 bits * its frequency factor).
+HASH_IMAGE_SIZE = 32
+
+
+def hash_to_int(cover_hash: str) -> int | None:
+    """Convert a hex hash to the signed 64-bit integer stored in Postgres."""
+    if not cover_hash:
+        return None
+    try:
+        value = int(cover_hash, 16)
+    except ValueError:
+        return None
+    if value >= 1 << HASH_BITS:
+        return None
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def hash_image(image) -> str:
+    """Return the perceptual hash of an image file, as a hex string."""
+    with Image.open(image) as img:
+        # The hash only needs a small grayscale image, so JPEGs are decoded at a reduced
+        # scale, which is much faster for full-size covers.
+        img.draft("L", (HASH_IMAGE_SIZE, HASH_IMAGE_SIZE))
+        return str(imagehash.phash(img))
+
+
+def chunk_expression(index: int):
+    """Expression of the 16-bit chunk `index` of the hash, matching its database index."""
+    return F("cover_hash_value").bitrightshift(index * CHUNK_BITS).bitand(CHUNK_MASK)
+
+
+def hash_chunks(value: int) -> list[int]:
+    return [(value >> (i * CHUNK_BITS)) & CHUNK_MASK for i in range(NUM_CHUNKS)]
+
+
+def chunk_variants(chunk: int, radius: int) -> list[int]:
+    """Return every chunk value within `radius` bits of `chunk`."""
+    variants = []
+    for r in range(radius + 1):
+        for bits in itertools.combinations(range(CHUNK_BITS), r):
+            variant = chunk
+            for bit in bits:
+                variant ^= 1 << bit
+            variants.append(variant)
+    return variants
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return ((a ^ b) & ((1 << HASH_BITS) - 1)).bit_count()
+
+
+def similar_issues(queryset: QuerySet, cover_hash: str, max_distance: int, limit: int) -> list:
+    """
+    Return up to `limit` issues from `queryset` whose cover hash is within `max_distance`
+    of `cover_hash`, closest first. Each issue has its distance set as `distance`.
+    """
+    value = hash_to_int(cover_hash)
+    if value is None:
+        return []
+
+    radius = min(max_distance, MAX_DISTANCE) // NUM_CHUNKS
+    aliases = {f"hash_chunk_{i}": chunk_expression(i) for i in range(NUM_CHUNKS)}
+    condition = Q()
+    for i, chunk in enumerate(hash_chunks(value)):
+        condition |= Q(**{f"hash_chunk_{i}__in": chunk_variants(chunk, radius)})
+
+    candidates = queryset.alias(**aliases).filter(condition).order_by()
+    matches = []
+    for issue in candidates:
+        issue.distance = hamming_distance(value, issue.cover_hash_value)
+        if issue.distance <= max_distance:
+            matches.append(issue)
+    matches.sort(key=lambda issue: (issue.distance, issue.pk))
+    return matches[:limit]
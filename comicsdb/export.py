@@ -0,0 +1,167 @@
+"""
+Full database exports, written as gzip-compressed NDJSON snapshots.
+
+Each snapshot is saved in the default storage under `exports/<version>/`, with one file per
+entity and a `manifest.json` describing them. The manifest of the latest snapshot is also
+saved as `exports/latest.json` and cached, so the API can hand it out without touching the
+storage.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import tempfile
+from datetime import UTC, datetime
+
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import FileField, Model, Prefetch, QuerySet
+
+from comicsdb.models import (
+    Arc,
+    Character,
+    Creator,
+    Credits,
+    Imprint,
+    Issue,
+    Publisher,
+    Series,
+    Team,
+    Universe,
+    Variant,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+EXPORT_DIR = "exports"
+LATEST_MANIFEST = f"{EXPORT_DIR}/latest.json"
+MANIFEST_CACHE_KEY = "export:manifest"
+CHUNK_SIZE = 2000
+# Internal fields that aren't part of the exported data.
+EXCLUDED_FIELDS = {"created_by", "edited_by", "cover_hash_value", "search_vector"}
+
+
+def export_querysets() -> dict[str, QuerySet]:
+    return {
+        "publishers": Publisher.objects.all(),
+        "imprints": Imprint.objects.all(),
+        "series": Series.objects.prefetch_related("genres", "associated"),
+        "creators": Creator.objects.all(),
+        "characters": Character.objects.prefetch_related("creators", "teams", "universes"),
+        "teams": Team.objects.prefetch_related("creators", "universes"),
+        "arcs": Arc.objects.all(),
+        "universes": Universe.objects.all(),
+        "issues": Issue.objects.prefetch_related(
+            "arcs",
+            "characters",
+            "teams",
+            "universes",
+            "reprints",
+            Prefetch("credits_set", queryset=Credits.objects.prefetch_related("role")),
+        ),
+        "variants": Variant.objects.all(),
+    }
+
+
+def to_dict(obj: Model) -> dict:
+    data = {}
+    for field in obj._meta.concrete_fields:
+        if field.name in EXCLUDED_FIELDS:
+            continue
+        value = getattr(obj, field.attname)
+        if isinstance(field, FileField):
+            value = value.name or ""
+        data[field.name] = value
+    for field in obj._meta.many_to_many:
+        if field.name in EXCLUDED_FIELDS or field.remote_field.through is Credits:
+            continue
+        data[field.name] = [related.pk for related in getattr(obj, field.name).all()]
+    if isinstance(obj, Issue):
+        data["credits"] = [
+            {"creator": credit.creator_id, "roles": [role.pk for role in credit.role.all()]}
+            for credit in obj.credits_set.all()
+        ]
+    return data
+
+
+def write_ndjson(queryset: QuerySet, file) -> int:
+    """
+    Write every object of the queryset to the file as gzip-compressed NDJSON, reading
+    them through a server-side cursor so memory use doesn't grow with the table size.
+    """
+    count = 0
+    with gzip.open(file, "wt", encoding="utf-8") as out:
+        for obj in queryset.order_by("pk").iterator(chunk_size=CHUNK_SIZE):
+            out.write(json.dumps(to_dict(obj), cls=DjangoJSONEncoder))
+            out.write("\n")
+            count += 1
+    return count
+
+
+def sha256sum(file) -> str:
+    file.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(1 << 20), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_file(name: str, file) -> str:
+    # The media storage doesn't overwrite files, so replace them explicitly.
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    file.seek(0)
+    return default_storage.save(name, File(file, name=name))
+
+
+def create_export() -> dict:
+    """Write a new snapshot of every entity and publish its manifest."""
+    created = datetime.now(tz=UTC)
+    version = created.strftime("%Y%m%dT%H%M%SZ")
+    manifest = {"version": version, "created": created.isoformat(), "files": {}}
+
+    for name, queryset in export_querysets().items():
+        with tempfile.TemporaryFile() as tmp:
+            count = write_ndjson(queryset, tmp)
+            size = tmp.tell()
+            checksum = sha256sum(tmp)
+            path = save_file(f"{EXPORT_DIR}/{version}/{name}.ndjson.gz", tmp)
+        manifest["files"][name] = {
+            "path": path,
+            "count": count,
+            "size": size,
+            "sha256": checksum,
+        }
+        LOGGER.info("Exported %d %s to '%s'", count, name, path)
+
+    content = json.dumps(manifest, indent=2).encode()
+    with tempfile.TemporaryFile() as tmp:
+        tmp.write(content)
+        save_file(f"{EXPORT_DIR}/{version}/manifest.json", tmp)
+        save_file(LATEST_MANIFEST, tmp)
+    cache.set(MANIFEST_CACHE_KEY, manifest, None)
+    return manifest
+
+
+def get_manifest() -> dict | None:
+    """Return the manifest of the latest snapshot, or `None` if there isn't one."""
+    manifest = cache.get(MANIFEST_CACHE_KEY)
+    if manifest is None and default_storage.exists(LATEST_MANIFEST):
+        with default_storage.open(LATEST_MANIFEST) as f:
+            manifest = json.load(f)
+        cache.set(MANIFEST_CACHE_KEY, manifest, None)
+    return manifest
+
+
+def delete_old_exports(keep: int) -> list[str]:
+    """Delete all but the `keep` most recent snapshots. Returns the deleted versions."""
+    versions, _ = default_storage.listdir(EXPORT_DIR)
+    deleted = sorted(versions, reverse=True)[keep:]
+    for version in deleted:
+        _, files = default_storage.listdir(f"{EXPORT_DIR}/{version}")
+        for name in files:
+            default_storage.delete(f"{EXPORT_DIR}/{version}/{name}")
+    return deleted
@@ -0,0 +1,32 @@
+from django_filters import rest_framework as filters
+
+from comicsdb.models import Change
+
+
+class ChangeFilter(filters.FilterSet):
+    since = filters.NumberFilter(
+        label="Changes after token", field_name="id", lookup_expr="gt"
+    )
+    entity_type = filters.ChoiceFilter(
+        label="Entity Type",
+        field_name="content_type__model",
+        choices=[
+            (model, model)
+            for model in (
+                "arc",
+                "character",
+                "creator",
+                "credits",
+                "imprint",
+                "issue",
+                "publisher",
+                "series",
+                "team",
+                "universe",
+            )
+        ],
+    )
+
+    class Meta:
+        model = Change
+        fields = ["since", "entity_type"]
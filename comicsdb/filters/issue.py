@@ -1,22 +1,23 @@
-import operator
-from functools import reduce
-
 import django_filters as df
-from django.db.models import Q
 
-from comicsdb.models import Issue
+from comicsdb.filters.name import TextSearchFilter
+from comicsdb.identifiers import IDENTIFIER_KEYS
+from comicsdb.models import Identifier, Issue
+
 
+class IdentifierFilter(df.CharFilter):
+    """
+    Match the issues with the identifier, either their own or one of their variants'. A
+    UPC without its add-on matches every add-on, like the barcode & batch lookups.
+    """
 
-class IssueSeriesName(df.rest_framework.CharFilter):
     def filter(self, qs, value):
-        if value:
-            query_list = value.split()
-            return qs.filter(
-                reduce(
-                    operator.and_, (Q(series__name__unaccent__icontains=q) for q in query_list)
-                )
-            )
-        return super().filter(qs, value)
+        if not value:
+            return qs
+        if (key := IDENTIFIER_KEYS[self.field_name](value)) is None:
+            return qs.none()
+        identifiers = Identifier.objects.lookup(self.field_name, *key)
+        return qs.filter(pk__in=identifiers.values("issue_id"))
 
 
 class IssueFilter(df.rest_framework.FilterSet):
@@ -38,9 +39,7 @@ class IssueFilter(df.rest_framework.FilterSet):
     imprint_id = df.rest_framework.NumberFilter(
         label="Imprint Metron ID", field_name="series__imprint__id", lookup_expr="exact"
     )
-    series_name = IssueSeriesName(
-        label="Series Name", field_name="series__name", lookup_expr="icontains"
-    )
+    series_name = TextSearchFilter(label="Series Name", field_name="series__search_vector")
     series_id = df.rest_framework.NumberFilter(
         label="Series Metron ID", field_name="series__id", lookup_expr="exact"
     )
@@ -57,12 +56,8 @@ class IssueFilter(df.rest_framework.FilterSet):
     rating = df.rest_framework.CharFilter(
         label="Rating", field_name="rating__name", lookup_expr="iexact"
     )
-    sku = df.rest_framework.CharFilter(
-        label="Distributor SKU", field_name="sku", lookup_expr="iexact"
-    )
-    upc = df.rest_framework.CharFilter(
-        label="UPC Code", field_name="upc", lookup_expr="iexact"
-    )
+    sku = IdentifierFilter(label="Distributor SKU", field_name="sku")
+    upc = IdentifierFilter(label="UPC Code", field_name="upc")
     cv_id = df.rest_framework.NumberFilter(
         label="Comic Vine ID", field_name="cv_id", lookup_expr="exact"
     )
@@ -89,9 +84,7 @@ class IssueViewFilter(df.FilterSet):
     publisher_id = df.NumberFilter(
         label="Publisher Metron ID", field_name="series__publisher__id", lookup_expr="exact"
     )
-    series_name = IssueSeriesName(
-        label="Series Name", field_name="series__name", lookup_expr="icontains"
-    )
+    series_name = TextSearchFilter(label="Series Name", field_name="series__search_vector")
     series_id = df.NumberFilter(
         label="Series Metron ID", field_name="series__id", lookup_expr="exact"
     )
@@ -105,8 +98,8 @@ class IssueViewFilter(df.FilterSet):
     series_year_began = df.NumberFilter(
         label="Series Beginning Year", field_name="series__year_began", lookup_expr="exact"
     )
-    sku = df.CharFilter(label="Distributor SKU", field_name="sku", lookup_expr="iexact")
-    upc = df.CharFilter(label="UPC Code", field_name="upc", lookup_expr="iexact")
+    sku = IdentifierFilter(label="Distributor SKU", field_name="sku")
+    upc = IdentifierFilter(label="UPC Code", field_name="upc")
     cv_id = df.rest_framework.NumberFilter(
         label="Comic Vine ID", field_name="cv_id", lookup_expr="exact"
     )
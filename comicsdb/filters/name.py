@@ -1,5 +1,7 @@
 from django_filters import rest_framework as filters
 
+from comicsdb.search import search
+
 
 class NameFilter(filters.FilterSet):
     name = filters.CharFilter(lookup_expr="unaccent__icontains")
@@ -14,5 +16,18 @@ class ComicVineFilter(NameFilter):
     )
 
 
+class TextSearchFilter(filters.CharFilter):
+    """Match every word of the value as a prefix of a word of the name."""
+
+    def filter(self, qs, value):
+        if value:
+            return search(qs, value, self.field_name)
+        return qs
+
+
+class ComicVineSearchFilter(ComicVineFilter):
+    name = TextSearchFilter(field_name="search_vector")
+
+
 class UniverseFilter(NameFilter):
     designation = filters.CharFilter(lookup_expr="icontains")
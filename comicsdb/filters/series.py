@@ -1,24 +1,11 @@
-import operator
-from functools import reduce
-
-from django.db.models import Q
 from django_filters import rest_framework as filters
 
+from comicsdb.filters.name import TextSearchFilter
 from comicsdb.models import Series
 
 
-class SeriesNameFilter(filters.CharFilter):
-    def filter(self, qs, value):
-        if value:
-            query_list = value.split()
-            qs = qs.filter(
-                reduce(operator.and_, (Q(name__unaccent__icontains=q) for q in query_list))
-            )
-        return qs
-
-
 class SeriesFilter(filters.FilterSet):
-    name = SeriesNameFilter(lookup_expr="icontains")
+    name = TextSearchFilter(field_name="search_vector")
     publisher_id = filters.filters.NumberFilter(
         field_name="publisher__id", lookup_expr="exact"
     )
@@ -1,13 +1,14 @@
 from django.forms import ClearableFileInput, ModelForm
 from django_select2 import forms as s2forms
 
+from comicsdb.autocomplete import AutocompleteWidgetMixin
 from comicsdb.models import Creator
 
 
-class CreatorsWidget(s2forms.ModelSelect2MultipleWidget):
+class CreatorsWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2MultipleWidget):
     search_fields = [
-        "name__icontains",
-        "alias__icontains",
+        "name__search_contains",
+        "alias__search_contains",
     ]
 
 
@@ -8,23 +8,24 @@ from django.forms import (
 from django_select2 import forms as s2forms
 from isbnlib import canonical, is_isbn10, is_isbn13
 
+from comicsdb.autocomplete import AutocompleteWidgetMixin
 from comicsdb.forms.team import TeamsWidget
 from comicsdb.forms.universe import UniversesWidget
 from comicsdb.models import Issue, Rating, Series
 
 
-class ArcsWidget(s2forms.ModelSelect2MultipleWidget):
+class ArcsWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2MultipleWidget):
     search_fields = [
-        "name__icontains",
+        "name__search_contains",
     ]
 
 
-class CharactersWidget(s2forms.ModelSelect2MultipleWidget):
-    search_fields = ["name__icontains", "alias__icontains"]
+class CharactersWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2MultipleWidget):
+    search_fields = ["name__search_contains", "alias__search_contains"]
 
 
-class IssuesWidget(s2forms.ModelSelect2MultipleWidget):
-    search_fields = ["series__name__icontains", "number"]
+class IssuesWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2MultipleWidget):
+    search_fields = ["series__name__search_contains", "number"]
 
 
 class IssueForm(ModelForm):
@@ -1,11 +1,12 @@
 from django.forms import ClearableFileInput, ModelForm
 from django_select2 import forms as s2forms
 
+from comicsdb.autocomplete import AutocompleteWidgetMixin
 from comicsdb.models import Publisher
 
 
-class PublisherWidget(s2forms.ModelSelect2Widget):
-    search_fields = ["name__icontains"]
+class PublisherWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2Widget):
+    search_fields = ["name__search_contains"]
 
 
 class PublisherForm(ModelForm):
@@ -1,6 +1,7 @@
 from django.forms import ModelChoiceField, ModelForm, ValidationError
 from django_select2 import forms as s2forms
 
+from comicsdb.autocomplete import AutocompleteWidgetMixin
 from comicsdb.models import Imprint, Publisher, Series
 
 # Series_Type objects id's
@@ -8,19 +9,21 @@ TPB = 10
 HC = 8
 
 
-class SeriesWidget(s2forms.ModelSelect2Widget):
-    search_fields = ["name__icontains"]
+class SeriesWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2Widget):
+    search_fields = ["name__search_contains"]
 
 
-class MultiSeriesWidget(s2forms.ModelSelect2MultipleWidget):
-    search_fields = ["name__icontains"]
+class MultiSeriesWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2MultipleWidget):
+    search_fields = ["name__search_contains"]
 
 
 class SeriesForm(ModelForm):
     publisher = ModelChoiceField(
         queryset=Publisher.objects.all(),
         label="Publisher",
-        widget=s2forms.ModelSelect2Widget(model=Publisher, search_fields=["name__icontains"]),
+        widget=s2forms.ModelSelect2Widget(
+            model=Publisher, search_fields=["name__search_contains"]
+        ),
     )
     imprint = ModelChoiceField(
         queryset=Imprint.objects.all(),
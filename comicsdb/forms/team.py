@@ -1,13 +1,14 @@
 from django.forms import ClearableFileInput, ModelForm
 from django_select2 import forms as s2forms
 
+from comicsdb.autocomplete import AutocompleteWidgetMixin
 from comicsdb.forms.creator import CreatorsWidget
 from comicsdb.forms.universe import UniversesWidget
 from comicsdb.models import Team
 
 
-class TeamsWidget(s2forms.ModelSelect2MultipleWidget):
-    search_fields = ["name__icontains"]
+class TeamsWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2MultipleWidget):
+    search_fields = ["name__search_contains"]
 
 
 class TeamForm(ModelForm):
@@ -1,11 +1,12 @@
 from django.forms import ClearableFileInput, ModelForm
 from django_select2 import forms as s2forms
 
+from comicsdb.autocomplete import AutocompleteWidgetMixin
 from comicsdb.models import Universe
 
 
-class UniversesWidget(s2forms.ModelSelect2MultipleWidget):
-    search_fields = ["name__icontains", "designation__icontains"]
+class UniversesWidget(AutocompleteWidgetMixin, s2forms.ModelSelect2MultipleWidget):
+    search_fields = ["name__search_contains", "designation__search_contains"]
 
 
 class UniverseForm(ModelForm):
@@ -0,0 +1,86 @@
+"""
+Normalization of the identifiers objects can be looked up by.
+
+Each normalizer turns an id given by a client into the keys it can be stored as, so that
+lookups are exact matches that can use the indexes on those columns. An invalid value
+has no keys.
+
+The barcodes of issues & variants are stored in the `Identifier` table in a single
+canonical form, a main code & add-on, computed by the `IDENTIFIER_KEYS` functions, which
+the values given by clients are looked up in too.
+"""
+
+from isbnlib import canonical, is_isbn10, is_isbn13, to_isbn13
+
+UPC_LENGTH = 12
+EAN_LENGTH = 13
+
+
+def normalize_id(value: str) -> list[int]:
+    value = value.strip()
+    return [int(value)] if value.isdigit() else []
+
+
+# Kind of identifier -> (model field, normalizer)
+IDENTIFIERS = {
+    "id": ("pk", normalize_id),
+    "cv_id": ("cv_id", normalize_id),
+}
+
+
+def valid_check_digit(code: str) -> bool:
+    """Whether the last digit of a UPC-A or EAN-13 code is its (GTIN mod 10) check digit."""
+    digits = [int(char) for char in code]
+    total = sum(
+        digit * (3 if i % 2 == 0 else 1) for i, digit in enumerate(reversed(digits[:-1]))
+    )
+    return (10 - total % 10) % 10 == digits[-1]
+
+
+def upc_key(value: str) -> tuple[str, str] | None:
+    """
+    Split a UPC-A or EAN-13 barcode, optionally followed by its 2 or 5 digit add-on, into
+    the main code & add-on. EAN-13 codes of UPC-A ones (with a leading zero) are shortened
+    to UPC-A. Codes that can't be split on a valid check digit are only kept, whole, if
+    they have the length of one.
+    """
+    digits = value.replace("-", "").replace(" ", "")
+    if not digits.isdigit():
+        return None
+    for length in (UPC_LENGTH, EAN_LENGTH):
+        code, addon = digits[:length], digits[length:]
+        if len(code) == length and len(addon) in (0, 2, 5) and valid_check_digit(code):
+            return code.removeprefix("0") if length == EAN_LENGTH else code, addon
+    if len(digits) in (UPC_LENGTH, EAN_LENGTH):
+        return digits, ""
+    return None
+
+
+def isbn_key(value: str) -> tuple[str, str] | None:
+    isbn = canonical(value)
+    if not (is_isbn13(isbn) or is_isbn10(isbn)) and (key := upc_key(value)):
+        # The EAN-13 barcode of a book, without its price add-on.
+        isbn = key[0]
+    if is_isbn13(isbn):
+        return isbn, ""
+    if is_isbn10(isbn):
+        return to_isbn13(isbn), ""
+    return None
+
+
+def sku_key(value: str) -> tuple[str, str] | None:
+    sku = value.strip().upper()
+    return (sku, "") if sku.isalnum() else None
+
+
+# Kind of identifier -> function returning the (code, add-on) it's stored as
+IDENTIFIER_KEYS = {"upc": upc_key, "isbn": isbn_key, "sku": sku_key}
+
+
+def barcode_keys(value: str) -> list[tuple[str, str, str]]:
+    """
+    Return the kinds, codes & add-ons a scanned barcode, an ISBN or a UPC, can be stored
+    as. The EAN-13 barcodes of books (978 & 979 codes) are saved as either, so they have
+    both.
+    """
+    return [(kind, *key) for kind in ("isbn", "upc") if (key := IDENTIFIER_KEYS[kind](value))]
@@ -0,0 +1,192 @@
+"""
+Edits applied to many issues at once, by the admin actions and the commands.
+
+The credits & relations missing from the issues are found with set operations over one
+query of the rows they already have, and added with batched bulk inserts, instead of
+queries by issue. Bulk inserts don't send the signals, so the changes are logged, and
+the counters & caches depending on them updated, here. Every edit can be a dry run,
+which only counts what it would add.
+"""
+
+import itertools
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+
+from comicsdb.bulk import BATCH_SIZE, bulk_add_m2m
+from comicsdb.cache import invalidate_representations
+from comicsdb.counters import ISSUE_RELATIONS, update_counts, update_issue_relation_counts
+from comicsdb.models import Change, Creator, Credits, Issue, Role
+from comicsdb.search_index import update_entries
+from comicsdb.signals import invalidate_detail_dependents
+
+# Reprints with more stories than this aren't copied into the issues reprinting them.
+MAX_STORIES = 1
+
+
+class Applied(NamedTuple):
+    """Keys of the issues an edit changed, and the number of rows or stories it added."""
+
+    issues: set[int]
+    rows: int
+
+
+def issue_keys(issues: QuerySet | Iterable[int]) -> set[int]:
+    if isinstance(issues, QuerySet):
+        return set(issues.values_list("pk", flat=True))
+    return set(issues)
+
+
+def m2m_columns(field_name: str) -> tuple[type[Model], str, str]:
+    """Through model of a many-to-many field of Issue, and its issue & related columns."""
+    field = Issue._meta.get_field(field_name)
+    through = field.remote_field.through
+    source = through._meta.get_field(field.m2m_field_name()).attname
+    target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+    return through, source, target
+
+
+# Logging the changes and updating the counters & caches
+def credits_written(created: list[Credits], updated: list[Credits] | None = None) -> None:
+    """Log the credits written with bulk queries, and update what depends on them."""
+    updated = updated or []
+    Change.objects.log(Credits, [c.pk for c in created], Change.Operation.CREATE)
+    Change.objects.log(Credits, [c.pk for c in updated], Change.Operation.UPDATE)
+    credits_ = [*created, *updated]
+    update_counts(Creator, {c.creator_id for c in credits_})
+    invalidate_representations("issue", {c.issue_id for c in credits_})
+    invalidate_detail_dependents(Credits, [c.pk for c in credits_])
+
+
+def issues_written(pks: set[int]) -> None:
+    """Log the issues updated with bulk queries, and update what depends on them."""
+    Change.objects.log(Issue, pks, Change.Operation.UPDATE)
+    invalidate_representations("issue", pks)
+    invalidate_detail_dependents(Issue, pks)
+
+
+# Edits
+def add_credits(
+    issues: QuerySet | Iterable[int],
+    roles: dict[int, Iterable[Role]],
+    *,
+    dry_run: bool = False,
+) -> Applied:
+    """
+    Give the issues a credit for each creator of `roles` (creator key -> roles) they
+    don't have one for yet, with its roles. Existing credits are left as they are.
+    """
+    issue_ids = issue_keys(issues)
+    existing = set(
+        Credits.objects.filter(issue_id__in=issue_ids, creator_id__in=roles).values_list(
+            "issue_id", "creator_id"
+        )
+    )
+    missing = sorted(set(itertools.product(issue_ids, roles)) - existing)
+    if missing and not dry_run:
+        credits_ = [Credits(issue_id=issue, creator_id=creator) for issue, creator in missing]
+        with transaction.atomic():
+            Credits.objects.bulk_create(credits_, batch_size=BATCH_SIZE)
+            bulk_add_m2m(credits_, "role", [roles[c.creator_id] for c in credits_])
+            credits_written(credits_)
+    return Applied({issue for issue, _ in missing}, len(missing))
+
+
+def add_relations(
+    field_name: str, pairs: set[tuple[int, int]], *, dry_run: bool = False
+) -> Applied:
+    """Add the (issue key, related key) pairs missing from a many-to-many field of Issue."""
+    if not pairs:
+        return Applied(set(), 0)
+    through, source, target = m2m_columns(field_name)
+    existing = set(
+        through.objects.filter(
+            **{
+                f"{source}__in": {issue for issue, _ in pairs},
+                f"{target}__in": {related for _, related in pairs},
+            }
+        ).values_list(source, target)
+    )
+    missing = pairs - existing
+    if missing and not dry_run:
+        issue_ids = {issue for issue, _ in missing}
+        related_ids = {related for _, related in missing}
+        with transaction.atomic():
+            through.objects.bulk_create(
+                [through(**{source: issue, target: related}) for issue, related in missing],
+                batch_size=BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            issues_written(issue_ids)
+            if field_name in ISSUE_RELATIONS:
+                update_issue_relation_counts({field_name: related_ids})
+            invalidate_detail_dependents(
+                Issue._meta.get_field(field_name).related_model, related_ids
+            )
+    return Applied({issue for issue, _ in missing}, len(missing))
+
+
+def add_stories(stories: dict[int, list[str]], *, dry_run: bool = False) -> Applied:
+    """Append the stories (issue key -> story titles) missing from the names of issues."""
+    changed = []
+    count = 0
+    now = timezone.now()
+    for issue in Issue.objects.filter(pk__in=stories).only("pk", "name"):
+        names = issue.name or []
+        new = [story for story in dict.fromkeys(stories[issue.pk]) if story not in names]
+        if new:
+            issue.name = [*names, *new]
+            issue.modified = now
+            changed.append(issue)
+            count += len(new)
+    if changed and not dry_run:
+        pks = {issue.pk for issue in changed}
+        with transaction.atomic():
+            Issue.objects.bulk_update(changed, ["name", "modified"], batch_size=BATCH_SIZE)
+            issues_written(pks)
+            update_entries(Issue, pks)
+    return Applied({issue.pk for issue in changed}, count)
+
+
+def add_reprint_info(issues: QuerySet | Iterable[int], *, dry_run: bool = False) -> Applied:
+    """
+    Copy the story, characters & teams of the single story issues reprinted by the
+    issues, usually trade paperbacks, into them.
+    """
+    through, source, target = m2m_columns("reprints")
+    # Reprinted issue key -> keys of the issues reprinting it
+    reprinted_by = defaultdict(set)
+    for issue, reprint in through.objects.filter(
+        **{f"{source}__in": issue_keys(issues)}
+    ).values_list(source, target):
+        reprinted_by[reprint].add(issue)
+
+    # The reprints are read in the order of the issues, which the stories are added in.
+    stories = defaultdict(list)
+    reprints = []
+    for reprint, name in Issue.objects.filter(pk__in=reprinted_by).values_list("pk", "name"):
+        if len(name or []) <= MAX_STORIES:
+            reprints.append(reprint)
+            for issue in reprinted_by[reprint]:
+                stories[issue].extend(name or [])
+
+    with transaction.atomic():
+        results = [add_stories(stories, dry_run=dry_run)]
+        for field_name in ("characters", "teams"):
+            through, source, target = m2m_columns(field_name)
+            pairs = {
+                (issue, related)
+                for reprint, related in through.objects.filter(
+                    **{f"{source}__in": reprints}
+                ).values_list(source, target)
+                for issue in reprinted_by[reprint]
+            }
+            results.append(add_relations(field_name, pairs, dry_run=dry_run))
+    return Applied(
+        set().union(*(result.issues for result in results)),
+        sum(result.rows for result in results),
+    )
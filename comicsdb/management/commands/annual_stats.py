@@ -1,6 +1,9 @@
+from datetime import date
+
 from django.core.management.base import BaseCommand, CommandParser
 
 from comicsdb.models import Arc, Character, Creator, Issue, Publisher, Series, Team
+from comicsdb.rollups import created_between
 from users.models import CustomUser
 
 
@@ -13,12 +16,10 @@ class Command(BaseCommand):
 
     def handle(self, *args: any, **options: any) -> None:
         results: list[dict] = []
-        users = CustomUser.objects.filter(date_joined__year=options["year"]).count()
-        results.append({"model": CustomUser, "count": users})
-
-        models = [Arc, Character, Creator, Issue, Publisher, Series, Team]
+        start, end = date(options["year"], 1, 1), date(options["year"] + 1, 1, 1)
+        models = [CustomUser, Arc, Character, Creator, Issue, Publisher, Series, Team]
         for mod in models:
-            count = mod.objects.filter(created_on__year=options["year"]).count()
+            count = created_between(mod, start, end)
             results.append({"model": mod, "count": count})
 
         title = f"{options['year']} New Additions Statistics"
@@ -1,6 +1,8 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
-from comicsdb.models import Credits, Issue, Role
+from comicsdb.issue_edits import add_credits
+from comicsdb.models import Credits, Issue
+from comicsdb.reference import get_role
 
 
 class Command(BaseCommand):
@@ -10,7 +12,7 @@ class Command(BaseCommand):
     Explanation:
     - Retrieves base credits from a specified issue and duplicates them to other target issues.
     - Skips adding possible variant cover credits and adds new credits to target issues with
-      the same creator and roles.
+      the same creator and roles, with a bulk insert. Existing credits are left as they are.
 
     Args:
     - parser: The parser for command-line arguments.
@@ -26,6 +28,8 @@ class Command(BaseCommand):
     Examples:
     - To duplicate credits from issue with ID 123 to issues with IDs 456 and 789:
         python manage.py dup_credits --from 123 --to 456 789
+    - To count the credits that would be added, without adding them:
+        python manage.py dup_credits --from 123 --to 456 789 --dry-run
     """
 
     help = "Duplicate issue credits issue to other issues"
@@ -35,7 +39,8 @@ class Command(BaseCommand):
         Add arguments to the parser.
 
         Explanation:
-        - Adds command-line arguments for specifying the source issue ID and target issue IDs.
+        - Adds command-line arguments for specifying the source issue ID, target issue IDs
+          and whether it's a dry run.
 
         Args:
         - parser: The parser to which arguments are added.
@@ -46,6 +51,9 @@ class Command(BaseCommand):
 
         parser.add_argument("--from", type=int, required=True)
         parser.add_argument("--to", nargs="+", type=int, required=True)
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Count the credits without adding them."
+        )
 
     def handle(self, *args, **options):
         """
@@ -63,32 +71,39 @@ class Command(BaseCommand):
         - None.
 
         Raises:
-        - Does not raise any exceptions.
+        - CommandError: If a target issue doesn't exist.
         """
         max_credits = 2
-        base_credits = Credits.objects.filter(issue__id=options["from"])
-        cover = Role.objects.get(name="Cover")
-        target_issues = []
-        for target_issue in options["to"]:
-            issue = Issue.objects.get(pk=target_issue)
-            target_issues.append(issue)
-
-        for issue in target_issues:
-            for credit in base_credits:
-                # Check if credit is possible variant cover, and if so let's slip it.
-                roles = credit.role.all()
-                if len(roles) < max_credits and cover in roles:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"Not adding possible variant cover credit for '{credit.creator}'"
-                        )
+        base_credits = (
+            Credits.objects.filter(issue__id=options["from"])
+            .select_related("creator")
+            .prefetch_related("role")
+        )
+        cover = get_role("Cover")
+        target_issues = set(
+            Issue.objects.filter(pk__in=options["to"]).values_list("pk", flat=True)
+        )
+        if missing := set(options["to"]) - target_issues:
+            msg = f"Issues not found: {', '.join(map(str, sorted(missing)))}"
+            raise CommandError(msg)
+
+        roles = {}
+        for credit in base_credits:
+            # Check if credit is possible variant cover, and if so let's slip it.
+            credit_roles = credit.role.all()
+            if len(credit_roles) < max_credits and cover in credit_roles:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Not adding possible variant cover credit for '{credit.creator}'"
                     )
-                    continue
-
-                new_credit, create = Credits.objects.get_or_create(
-                    issue=issue, creator=credit.creator
                 )
-                if create:
-                    for role in roles:
-                        new_credit.role.add(role)
-                    self.stdout.write(self.style.SUCCESS(f"Added: '{new_credit}'"))
+                continue
+            roles[credit.creator_id] = credit_roles
+
+        applied = add_credits(target_issues, roles, dry_run=options["dry_run"])
+        verb = "Would add" if options["dry_run"] else "Added"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {applied.rows} credits to {len(applied.issues)} issues."
+            )
+        )
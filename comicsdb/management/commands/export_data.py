@@ -0,0 +1,23 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from comicsdb.export import create_export, delete_old_exports
+
+
+class Command(BaseCommand):
+    help = "Export the whole database as gzip-compressed NDJSON snapshot files."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--keep", type=int, default=3, help="Number of snapshots to keep. (default: 3)"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        manifest = create_export()
+        for name, info in manifest["files"].items():
+            self.stdout.write(f"{name}: {info['count']} rows ({info['size']} bytes)")
+        self.stdout.write(self.style.SUCCESS(f"Created export '{manifest['version']}'"))
+
+        for version in delete_old_exports(max(options["keep"], 1)):
+            self.stdout.write(self.style.WARNING(f"Deleted export '{version}'"))
@@ -3,6 +3,7 @@ from datetime import date
 from django.core.management.base import BaseCommand
 
 from comicsdb.models import Character, Creator, Issue
+from comicsdb.rollups import created_between
 from users.models import CustomUser
 
 
@@ -19,15 +20,12 @@ class Command(BaseCommand):
         month = options["month"]
         year = options["year"]
         results: list[dict] = []
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1)
 
-        users = CustomUser.objects.filter(
-            date_joined__month=month, date_joined__year=year
-        ).count()
-        results.append({"model": CustomUser, "count": users})
-
-        models = [Character, Creator, Issue]
+        models = [CustomUser, Character, Creator, Issue]
         for mod in models:
-            count = mod.objects.filter(created_on__month=month, created_on__year=year).count()
+            count = created_between(mod, start, end)
             results.append({"model": mod, "count": count})
 
         title = f"Stats for {date(year, month, 1).strftime('%B %Y')}"
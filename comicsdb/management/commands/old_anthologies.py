@@ -5,6 +5,7 @@ from django.core.management.base import BaseCommand, CommandParser
 from comicsdb.models import Series
 from comicsdb.models.credits import Credits, Role
 from comicsdb.models.issue import Issue
+from comicsdb.reference import get_role
 
 
 class Command(BaseCommand):
@@ -33,11 +34,11 @@ class Command(BaseCommand):
         return fix
 
     def _fix_credits(self, series: Series) -> None:
-        writer = Role.objects.get(name__iexact="writer")
-        story = Role.objects.get(name__iexact="story")
-        pencil = Role.objects.get(name__iexact="penciller")
-        ink = Role.objects.get(name__iexact="inker")
-        artist = Role.objects.get(name__iexact="artist")
+        writer = get_role("writer")
+        story = get_role("story")
+        pencil = get_role("penciller")
+        ink = get_role("inker")
+        artist = get_role("artist")
 
         qs = Credits.objects.filter(issue__series=series)
 
@@ -0,0 +1,20 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from comicsdb.search_index import SEARCH_MODELS, delete_orphan_entries, update_entries
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search entries of every searchable object."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for model in SEARCH_MODELS:
+            count = update_entries(model, None)
+            deleted = delete_orphan_entries(model)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Indexed {count} {model._meta.verbose_name_plural}, "
+                    f"deleted {deleted} stale entries"
+                )
+            )
@@ -0,0 +1,16 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from comicsdb.counters import COUNTERS, update_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the issue & series counters of every object."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for model in COUNTERS:
+            count = update_counts(model)
+            self.stdout.write(
+                self.style.SUCCESS(f"Updated {count} {model._meta.verbose_name_plural}")
+            )
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from comicsdb.background import BACKGROUND_WORKERS
+from comicsdb.bulk import BATCH_SIZE
+from comicsdb.cache import invalidate_representations
+from comicsdb.cover_hash import hash_image, hash_to_int
+from comicsdb.models import Change, Issue
+
+
+def cover_hash(issue: Issue) -> str | None:
+    try:
+        return hash_image(issue.image)
+    except OSError:
+        return None
+
+
+class Command(BaseCommand):
+    help = "Compute the cover hashes of the issues missing one, or of every issue."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--all", action="store_true", help="Recompute the hash of every cover."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=BACKGROUND_WORKERS,
+            help="Number of covers hashed at once.",
+        )
+
+    def update_batch(self, executor: ThreadPoolExecutor, batch: list[Issue]) -> int:
+        updated = []
+        for issue, value in zip(batch, executor.map(cover_hash, batch), strict=True):
+            if value is None:
+                self.stderr.write(f"Unable to hash the cover of issue {issue.pk}")
+            elif value != issue.cover_hash:
+                issue.cover_hash = value
+                issue.cover_hash_value = hash_to_int(value)
+                issue.modified = timezone.now()
+                updated.append(issue)
+        pks = [issue.pk for issue in updated]
+        # The bulk update skips the signals, so the changes are logged here.
+        Change.objects.log(Issue, pks, Change.Operation.UPDATE)
+        invalidate_representations("issue", pks)
+        return Issue.objects.bulk_update(
+            updated, ["cover_hash", "cover_hash_value", "modified"], batch_size=BATCH_SIZE
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        issues = Issue.objects.exclude(image="").only("pk", "image", "cover_hash")
+        if not options["all"]:
+            issues = issues.filter(cover_hash="")
+
+        count = 0
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            batch = []
+            for issue in issues.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+                batch.append(issue)
+                if len(batch) == BATCH_SIZE:
+                    count += self.update_batch(executor, batch)
+                    batch = []
+            count += self.update_batch(executor, batch)
+        self.stdout.write(self.style.SUCCESS(f"Updated the cover hashes of {count} issues"))
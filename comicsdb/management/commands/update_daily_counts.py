@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from comicsdb.rollups import ROLLUP_MODELS, rebuild_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the daily rollups of the objects created, behind the statistics."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for model in ROLLUP_MODELS:
+            count = rebuild_counts(model)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Rebuilt {count} days of {model._meta.verbose_name_plural}"
+                )
+            )
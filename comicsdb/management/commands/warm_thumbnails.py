@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from comicsdb.background import BACKGROUND_WORKERS
+from comicsdb.bulk import BATCH_SIZE
+from comicsdb.thumbnails import THUMBNAILS, generate_thumbnails
+
+MODELS = {model._meta.model_name: model for model in THUMBNAILS}
+
+
+class Command(BaseCommand):
+    help = "Generate the missing thumbnails of every image."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--model", choices=sorted(MODELS), help="Only warm the images of this model."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=BACKGROUND_WORKERS,
+            help="Number of thumbnails generated at once.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        models = [MODELS[options["model"]]] if options["model"] else list(THUMBNAILS)
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            for model in models:
+                generate = partial(generate_thumbnails, model)
+                objects = model.objects.exclude(image="").only("pk", "image")
+                count = 0
+                batch = []
+                for obj in objects.iterator(chunk_size=BATCH_SIZE):
+                    batch.append(obj.image)
+                    if len(batch) == BATCH_SIZE:
+                        count += sum(executor.map(generate, batch))
+                        batch = []
+                count += sum(executor.map(generate, batch))
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Warmed {count} thumbnails of {model._meta.verbose_name_plural}"
+                    )
+                )
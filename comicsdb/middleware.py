@@ -0,0 +1,19 @@
+from http import HTTPStatus
+
+from django.contrib.flatpages.middleware import (
+    FlatpageFallbackMiddleware as BaseFlatpageFallbackMiddleware,
+)
+
+from comicsdb.reference import is_flatpage
+
+
+class FlatpageFallbackMiddleware(BaseFlatpageFallbackMiddleware):
+    """
+    Only look a flatpage up for the 404s of the urls that have one, which are known from
+    the reference cache, rather than querying the flatpages on every 404.
+    """
+
+    def process_response(self, request, response):
+        if response.status_code == HTTPStatus.NOT_FOUND and not is_flatpage(request.path_info):
+            return response
+        return super().process_response(request, response)
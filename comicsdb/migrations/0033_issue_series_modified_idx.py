@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0032_add_created_by_fields"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["modified", "id"], name="issue_modified_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="series",
+            index=models.Index(fields=["modified", "id"], name="series_modified_id_idx"),
+        ),
+    ]
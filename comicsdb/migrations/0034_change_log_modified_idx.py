@@ -0,0 +1,77 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:15
+
+import django.db.models.deletion
+import django.db.models.functions.datetime
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0033_issue_series_modified_idx"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Change",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("object_id", models.PositiveIntegerField()),
+                (
+                    "operation",
+                    models.CharField(
+                        choices=[("C", "create"), ("U", "update"), ("D", "delete")],
+                        max_length=1,
+                    ),
+                ),
+                (
+                    "modified",
+                    models.DateTimeField(db_default=django.db.models.functions.datetime.Now()),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="arc",
+            index=models.Index(fields=["modified", "id"], name="arc_modified_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=models.Index(fields=["modified", "id"], name="character_modified_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="creator",
+            index=models.Index(fields=["modified", "id"], name="creator_modified_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="imprint",
+            index=models.Index(fields=["modified", "id"], name="imprint_modified_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="publisher",
+            index=models.Index(fields=["modified", "id"], name="publisher_modified_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(fields=["modified", "id"], name="team_modified_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="universe",
+            index=models.Index(fields=["modified", "id"], name="universe_modified_id_idx"),
+        ),
+        migrations.AddField(
+            model_name="change",
+            name="content_type",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="change",
+            index=models.Index(fields=["content_type", "id"], name="change_ct_id_idx"),
+        ),
+    ]
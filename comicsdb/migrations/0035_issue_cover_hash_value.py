@@ -0,0 +1,80 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:16
+
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0034_change_log_modified_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issue",
+            name="cover_hash_value",
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE comicsdb_issue "
+                "SET cover_hash_value = ('x' || cover_hash)::bit(64)::bigint "
+                "WHERE cover_hash ~ '^[0-9a-fA-F]{16}$'"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        models.F("cover_hash_value"), ">>", models.Value(0)
+                    ),
+                    "&",
+                    models.Value(65535),
+                ),
+                name="issue_cover_hash_chunk_0_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        models.F("cover_hash_value"), ">>", models.Value(16)
+                    ),
+                    "&",
+                    models.Value(65535),
+                ),
+                name="issue_cover_hash_chunk_1_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        models.F("cover_hash_value"), ">>", models.Value(32)
+                    ),
+                    "&",
+                    models.Value(65535),
+                ),
+                name="issue_cover_hash_chunk_2_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        models.F("cover_hash_value"), ">>", models.Value(48)
+                    ),
+                    "&",
+                    models.Value(65535),
+                ),
+                name="issue_cover_hash_chunk_3_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:21
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, field):
+    counts = (
+        queryset.order_by()
+        .filter(**{field: OuterRef("pk")})
+        .values(field)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def add_counts(apps, schema_editor):
+    issue = apps.get_model("comicsdb", "Issue")
+    credits_ = apps.get_model("comicsdb", "Credits")
+    series = apps.get_model("comicsdb", "Series")
+    counters = [
+        ("Series", "num_issues", issue.objects.all(), "series"),
+        ("Creator", "num_issues", credits_.objects.all(), "creator"),
+        ("Publisher", "num_series", series.objects.all(), "publisher"),
+        ("Imprint", "num_series", series.objects.all(), "imprint"),
+    ]
+    for name in ("arcs", "characters", "teams", "universes"):
+        field = issue._meta.get_field(name)
+        through = field.remote_field.through
+        counters.append(
+            (
+                field.related_model._meta.object_name,
+                "num_issues",
+                through.objects.all(),
+                field.m2m_reverse_field_name(),
+            )
+        )
+    for model_name, counter, queryset, field in counters:
+        model = apps.get_model("comicsdb", model_name)
+        model.objects.update(**{counter: count_subquery(queryset, field)})
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0035_issue_cover_hash_value"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="arc",
+            name="num_issues",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Issues"
+            ),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="num_issues",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Issues"
+            ),
+        ),
+        migrations.AddField(
+            model_name="creator",
+            name="num_issues",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Issues"
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprint",
+            name="num_series",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Series"
+            ),
+        ),
+        migrations.AddField(
+            model_name="publisher",
+            name="num_series",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Series"
+            ),
+        ),
+        migrations.AddField(
+            model_name="series",
+            name="num_issues",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Issues"
+            ),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="num_issues",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Issues"
+            ),
+        ),
+        migrations.AddField(
+            model_name="universe",
+            name="num_issues",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Number of Issues"
+            ),
+        ),
+        migrations.RunPython(add_counts, migrations.RunPython.noop),
+    ]
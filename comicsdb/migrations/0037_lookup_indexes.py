@@ -0,0 +1,62 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0036_counter_columns"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="arc",
+            index=models.Index(fields=["cv_id"], name="arc_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=models.Index(fields=["cv_id"], name="character_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="creator",
+            index=models.Index(fields=["cv_id"], name="creator_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="imprint",
+            index=models.Index(fields=["cv_id"], name="imprint_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["cv_id"], name="issue_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["upc"], name="issue_upc_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["isbn"], name="issue_isbn_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["sku"], name="issue_sku_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="publisher",
+            index=models.Index(fields=["cv_id"], name="publisher_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="series",
+            index=models.Index(fields=["cv_id"], name="series_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(fields=["cv_id"], name="team_cv_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="universe",
+            index=models.Index(fields=["cv_id"], name="universe_cv_id_idx"),
+        ),
+    ]
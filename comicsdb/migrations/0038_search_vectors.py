@@ -0,0 +1,148 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:27
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+import comicsdb.search
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0037_lookup_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Generated columns can only use immutable functions, which unaccent() and
+        # array_to_string() aren't as they depend on settings. The wrappers pin them down.
+        migrations.RunSQL(
+            sql=[
+                (
+                    "CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text AS "
+                    "$$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$ "
+                    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT"
+                ),
+                (
+                    "CREATE OR REPLACE FUNCTION immutable_array_to_string(text[], text) "
+                    "RETURNS text AS $$ SELECT array_to_string($1, $2) $$ "
+                    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT"
+                ),
+            ],
+            reverse_sql=[
+                "DROP FUNCTION IF EXISTS immutable_unaccent(text)",
+                "DROP FUNCTION IF EXISTS immutable_array_to_string(text[], text)",
+            ],
+        ),
+        migrations.AddField(
+            model_name="arc",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    comicsdb.search.ImmutableUnaccent("name"), config="simple"
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    comicsdb.search.ImmutableUnaccent("name"),
+                    comicsdb.search.ImmutableUnaccent(
+                        comicsdb.search.ImmutableArrayToString("alias")
+                    ),
+                    config="simple",
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="creator",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    comicsdb.search.ImmutableUnaccent("name"),
+                    comicsdb.search.ImmutableUnaccent(
+                        comicsdb.search.ImmutableArrayToString("alias")
+                    ),
+                    config="simple",
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="publisher",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    comicsdb.search.ImmutableUnaccent("name"), config="simple"
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="series",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    comicsdb.search.ImmutableUnaccent("name"), config="simple"
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    comicsdb.search.ImmutableUnaccent("name"), config="simple"
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="arc",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="arc_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="character_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creator",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="creator_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publisher",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="publisher_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="series",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="series_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="team_search_idx"
+            ),
+        ),
+    ]
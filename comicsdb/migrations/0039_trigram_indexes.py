@@ -0,0 +1,142 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:30
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+import comicsdb.search
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0038_search_vectors"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="arc",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("name"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="arc_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("name"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="character_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(
+                            comicsdb.search.ImmutableArrayToString("alias")
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="character_alias_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creator",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("name"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="creator_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creator",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(
+                            comicsdb.search.ImmutableArrayToString("alias")
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="creator_alias_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publisher",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("name"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="publisher_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="series",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("name"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="series_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("name"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="team_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="universe",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("name"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="universe_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="universe",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        comicsdb.search.ImmutableUnaccent(models.F("designation"))
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="universe_designation_trgm_idx",
+            ),
+        ),
+    ]
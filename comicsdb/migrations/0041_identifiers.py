@@ -0,0 +1,154 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:37
+
+import itertools
+
+import django.db.models.deletion
+from django.db import migrations, models
+from isbnlib import canonical, is_isbn10, is_isbn13, to_isbn13
+
+BATCH_SIZE = 1000
+UPC_LENGTH = 12
+EAN_LENGTH = 13
+
+
+def valid_check_digit(code):
+    digits = [int(char) for char in code]
+    total = sum(
+        digit * (3 if i % 2 == 0 else 1) for i, digit in enumerate(reversed(digits[:-1]))
+    )
+    return (10 - total % 10) % 10 == digits[-1]
+
+
+def upc_key(value):
+    digits = value.replace("-", "").replace(" ", "")
+    if not digits.isdigit():
+        return None
+    for length in (UPC_LENGTH, EAN_LENGTH):
+        code, addon = digits[:length], digits[length:]
+        if len(code) == length and len(addon) in (0, 2, 5) and valid_check_digit(code):
+            return code.removeprefix("0") if length == EAN_LENGTH else code, addon
+    if len(digits) in (UPC_LENGTH, EAN_LENGTH):
+        return digits, ""
+    return None
+
+
+def isbn_key(value):
+    isbn = canonical(value)
+    if not (is_isbn13(isbn) or is_isbn10(isbn)) and (key := upc_key(value)):
+        isbn = key[0]
+    if is_isbn13(isbn):
+        return isbn, ""
+    if is_isbn10(isbn):
+        return to_isbn13(isbn), ""
+    return None
+
+
+def sku_key(value):
+    sku = value.strip().upper()
+    return (sku, "") if sku.isalnum() else None
+
+
+# The keys the identifiers are stored as, as of this migration.
+IDENTIFIER_KEYS = {"upc": upc_key, "isbn": isbn_key, "sku": sku_key}
+
+
+def add_identifiers(apps, schema_editor):
+    identifier = apps.get_model("comicsdb", "Identifier")
+    issues = (
+        apps.get_model("comicsdb", "Issue")
+        .objects.annotate(variant_id=models.Value(None, models.IntegerField()))
+        .values("pk", "variant_id", "upc", "isbn", "sku")
+        .order_by()
+    )
+    variants = (
+        apps.get_model("comicsdb", "Variant")
+        .objects.annotate(variant_id=models.F("pk"))
+        .values("issue_id", "variant_id", "upc", "sku")
+        .order_by()
+    )
+    batch = []
+    for row in itertools.chain(
+        issues.iterator(chunk_size=BATCH_SIZE), variants.iterator(chunk_size=BATCH_SIZE)
+    ):
+        for kind, key in IDENTIFIER_KEYS.items():
+            if row.get(kind) and (found := key(row[kind])):
+                batch.append(
+                    identifier(
+                        issue_id=row.get("issue_id", row.get("pk")),
+                        variant_id=row["variant_id"],
+                        kind=kind,
+                        value=found[0],
+                        addon=found[1],
+                    )
+                )
+        if len(batch) >= BATCH_SIZE:
+            identifier.objects.bulk_create(batch)
+            batch = []
+    identifier.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0040_search_entries"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Identifier",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("upc", "UPC"), ("isbn", "ISBN"), ("sku", "SKU")],
+                        max_length=4,
+                    ),
+                ),
+                ("value", models.CharField(max_length=20)),
+                ("addon", models.CharField(blank=True, max_length=5)),
+                (
+                    "issue",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="identifiers",
+                        to="comicsdb.issue",
+                    ),
+                ),
+                (
+                    "variant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="identifiers",
+                        to="comicsdb.variant",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "value", "addon"], name="identifier_lookup_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("variant", None)),
+                        fields=("kind", "value", "addon", "issue"),
+                        name="identifier_issue_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("variant__isnull", False)),
+                        fields=("kind", "value", "addon", "variant"),
+                        name="identifier_variant_unique",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(add_identifiers, migrations.RunPython.noop),
+    ]
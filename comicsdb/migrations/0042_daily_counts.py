@@ -0,0 +1,96 @@
+# Generated by Django 5.1.2 on 2026-10-18 20:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+
+BATCH_SIZE = 1000
+
+
+def created_counts(queryset, date_field, publisher_field=None):
+    fields = {"day": TruncDate(date_field)}
+    if publisher_field is not None:
+        fields["publisher_id"] = F(publisher_field)
+    return queryset.order_by().annotate(**fields).values(*fields).annotate(count=Count("*"))
+
+
+def add_daily_counts(apps, schema_editor):
+    content_type = apps.get_model("contenttypes", "ContentType")
+    daily_count = apps.get_model("comicsdb", "DailyCount")
+    rollup_models = [
+        ("comicsdb", name, "created_on")
+        for name in ("Arc", "Character", "Creator", "Issue", "Publisher", "Series", "Team")
+    ]
+    rollup_models.append(("users", "CustomUser", "date_joined"))
+    for app_label, name, date_field in rollup_models:
+        model = apps.get_model(app_label, name)
+        publisher_field = "series__publisher" if name == "Issue" else None
+        ct, _ = content_type.objects.get_or_create(
+            app_label=app_label, model=model._meta.model_name
+        )
+        daily_count.objects.bulk_create(
+            [
+                daily_count(content_type=ct, **row)
+                for row in created_counts(model.objects.all(), date_field, publisher_field)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0041_identifiers"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "publisher",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="comicsdb.publisher",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["content_type", "day"],
+                "indexes": [
+                    models.Index(fields=["content_type", "day"], name="daily_count_ct_day_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("publisher", None)),
+                        fields=("content_type", "day"),
+                        name="daily_count_day_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("publisher__isnull", False)),
+                        fields=("content_type", "day", "publisher"),
+                        name="daily_count_publisher_day_unique",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(add_daily_counts, migrations.RunPython.noop),
+    ]
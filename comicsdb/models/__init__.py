@@ -1,32 +1,40 @@
 from comicsdb.models.announcement import Announcement
 from comicsdb.models.arc import Arc
 from comicsdb.models.attribution import Attribution
+from comicsdb.models.change import Change
 from comicsdb.models.character import Character
 from comicsdb.models.creator import Creator
 from comicsdb.models.credits import Credits, Role
+from comicsdb.models.daily_count import DailyCount
 from comicsdb.models.genre import Genre
 from comicsdb.models.issue import Issue
 from comicsdb.models.publisher import Publisher
 from comicsdb.models.rating import Rating
+from comicsdb.models.search_entry import SearchEntry
 from comicsdb.models.series import Series, SeriesType
 from comicsdb.models.team import Team
 from comicsdb.models.universe import Universe
 from comicsdb.models.variant import Variant
 from comicsdb.models.imprint import Imprint  # This need to be *after* Publisher model.
+from comicsdb.models.identifier import Identifier
 
 __all__ = [
     "Arc",
     "Announcement",
     "Attribution",
+    "Change",
     "Character",
     "Creator",
     "Credits",
+    "DailyCount",
     "Genre",
+    "Identifier",
     "Imprint",
     "Issue",
     "Publisher",
     "Rating",
     "Role",
+    "SearchEntry",
     "Series",
     "SeriesType",
     "Team",
@@ -1,21 +1,26 @@
-import contextlib
 import logging
 
 from django.contrib.contenttypes.fields import GenericRelation
-from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from sorl.thumbnail import ImageField
 
 from comicsdb.models.attribution import Attribution
-from comicsdb.models.common import CommonInfo, pre_save_slug
+from comicsdb.models.common import (
+    CommonInfo,
+    CounterFieldsMixin,
+    TrackedFieldsMixin,
+    pre_save_slug,
+)
+from comicsdb.search import search_vector_field, trigram_index
 from users.models import CustomUser
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Arc(CommonInfo):
+class Arc(CounterFieldsMixin, TrackedFieldsMixin, CommonInfo):
     image = ImageField(upload_to="arc/%Y/%m/%d/", blank=True)
     attribution = GenericRelation(Attribution, related_query_name="arcs")
     created_by = models.ForeignKey(
@@ -24,22 +29,26 @@ class Arc(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="arcs_edited"
     )
+    num_issues = models.PositiveIntegerField("Number of Issues", default=0, editable=False)
+    search_vector = search_vector_field("name")
+
+    counter_fields = ("num_issues",)
+    tracked_fields = ("image",)
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
-        with contextlib.suppress(ObjectDoesNotExist):
-            this = Arc.objects.get(id=self.id)
-            if this.image and this.image != self.image:
-                if self.image:
-                    LOGGER.info("Replacing '%s' with '%s'", this.image, self.image)
-                else:
-                    LOGGER.info("Replacing '%s' with 'None'.", this.image)
-                this.image.delete(save=False)
+        if self.has_changed("image") and (previous := self.previous("image")):
+            if self.image:
+                LOGGER.info("Replacing '%s' with '%s'", previous, self.image)
+            else:
+                LOGGER.info("Replacing '%s' with 'None'.", previous)
+            self.image.storage.delete(previous)
         return super().save(*args, **kwargs)
 
     @property
     def issue_count(self):
-        return self.issues.all().count()
+        """The stored counter, stale on an instance loaded before its issues changed."""
+        return self.num_issues
 
     def get_absolute_url(self):
         return reverse("arc:detail", args=[self.slug])
@@ -48,7 +57,13 @@ class Arc(CommonInfo):
         return self.name
 
     class Meta:
-        indexes = [models.Index(fields=["name"], name="arc_name_idx")]
+        indexes = [
+            models.Index(fields=["name"], name="arc_name_idx"),
+            models.Index(fields=["modified", "id"], name="arc_modified_id_idx"),
+            trigram_index("name", "arc_name_trgm_idx"),
+            GinIndex(fields=["search_vector"], name="arc_search_idx"),
+            models.Index(fields=["cv_id"], name="arc_cv_id_idx"),
+        ]
         ordering = ["name"]
 
 
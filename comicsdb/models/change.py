@@ -0,0 +1,69 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models.functions import Now
+
+
+class ChangeManager(models.Manager):
+    def log(self, model, pks, operation) -> list["Change"]:
+        """
+        Record the same operation for the objects of a model, with a single insert.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        return self.bulk_create(
+            [
+                self.model(content_type=content_type, object_id=pk, operation=operation)
+                for pk in pks
+            ]
+        )
+
+
+class Change(models.Model):
+    """
+    Append-only log of the objects that were created, updated or deleted. The primary key
+    is used as the high-water-mark token by clients syncing the database incrementally.
+    """
+
+    class Operation(models.TextChoices):
+        CREATE = "C", "create"
+        UPDATE = "U", "update"
+        DELETE = "D", "delete"
+
+    id = models.BigAutoField(primary_key=True)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    operation = models.CharField(max_length=1, choices=Operation.choices)
+    modified = models.DateTimeField(db_default=Now())
+
+    objects = ChangeManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["content_type", "id"], name="change_ct_id_idx")]
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"{self.get_operation_display()} {self.content_type.model}: {self.object_id}"
+
+
+def post_save_change(sender, instance, created, raw=False, **kwargs) -> None:
+    # Don't log objects loaded from fixtures.
+    if raw:
+        return
+    operation = Change.Operation.CREATE if created else Change.Operation.UPDATE
+    Change.objects.log(sender, [instance.pk], operation)
+
+
+def post_delete_change(sender, instance, **kwargs) -> None:
+    Change.objects.log(sender, [instance.pk], Change.Operation.DELETE)
+
+
+def m2m_changed_change(sender, instance, action, **kwargs) -> None:
+    # Changing a many-to-many relation doesn't save the object that owns the field, so
+    # it's logged as an update of that object.
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    reverse, model, pk_set = kwargs["reverse"], kwargs["model"], kwargs["pk_set"]
+    if not reverse:
+        Change.objects.log(type(instance), [instance.pk], Change.Operation.UPDATE)
+    # The other side is also an owner in reverse & symmetrical (like Issue.reprints) changes.
+    if (reverse or model is type(instance)) and pk_set:
+        Change.objects.log(model, pk_set, Change.Operation.UPDATE)
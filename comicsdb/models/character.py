@@ -1,25 +1,30 @@
-import contextlib
 import logging
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.postgres.fields import ArrayField
-from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from sorl.thumbnail import ImageField
 
 from comicsdb.models.attribution import Attribution
-from comicsdb.models.common import CommonInfo, pre_save_slug
+from comicsdb.models.common import (
+    CommonInfo,
+    CounterFieldsMixin,
+    TrackedFieldsMixin,
+    pre_save_slug,
+)
 from comicsdb.models.creator import Creator
 from comicsdb.models.team import Team
 from comicsdb.models.universe import Universe
+from comicsdb.search import search_vector_field, trigram_index
 from users.models import CustomUser
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Character(CommonInfo):
+class Character(CounterFieldsMixin, TrackedFieldsMixin, CommonInfo):
     image = ImageField(upload_to="character/%Y/%m/%d/", blank=True)
     alias = ArrayField(models.CharField(max_length=100), null=True, blank=True)
     creators = models.ManyToManyField(Creator, blank=True, related_name="characters")
@@ -32,17 +37,20 @@ class Character(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="characters_edited"
     )
+    num_issues = models.PositiveIntegerField("Number of Issues", default=0, editable=False)
+    search_vector = search_vector_field("name", array_fields=("alias",))
+
+    counter_fields = ("num_issues",)
+    tracked_fields = ("image",)
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
-        with contextlib.suppress(ObjectDoesNotExist):
-            this = Character.objects.get(id=self.id)
-            if this.image and this.image != self.image:
-                if self.image:
-                    LOGGER.info("Replacing '%s' with '%s'", this.image, self.image)
-                else:
-                    LOGGER.info("Replacing '%s' with 'None'.", this.image)
-                this.image.delete(save=False)
+        if self.has_changed("image") and (previous := self.previous("image")):
+            if self.image:
+                LOGGER.info("Replacing '%s' with '%s'", previous, self.image)
+            else:
+                LOGGER.info("Replacing '%s' with 'None'.", previous)
+            self.image.storage.delete(previous)
         return super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -50,7 +58,8 @@ class Character(CommonInfo):
 
     @property
     def issue_count(self):
-        return self.issues.all().count()
+        """The stored counter, stale on an instance loaded before its issues changed."""
+        return self.num_issues
 
     @property
     def first_appearance(self):
@@ -72,7 +81,14 @@ class Character(CommonInfo):
         return self.name
 
     class Meta:
-        indexes = [models.Index(fields=["name"], name="character_name_idx")]
+        indexes = [
+            models.Index(fields=["name"], name="character_name_idx"),
+            models.Index(fields=["modified", "id"], name="character_modified_id_idx"),
+            trigram_index("name", "character_name_trgm_idx"),
+            trigram_index("alias", "character_alias_trgm_idx", array=True),
+            GinIndex(fields=["search_vector"], name="character_search_idx"),
+            models.Index(fields=["cv_id"], name="character_cv_id_idx"),
+        ]
         ordering = ["name"]
 
 
@@ -1,19 +1,46 @@
 import itertools
+import re
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.db.models.fields.files import FieldFile
 from django.db.models.functions import Now
 from django.utils.text import slugify
 
+# Saves of new objects retried when a concurrent save took their slug.
+SLUG_ATTEMPTS = 3
 
-def generate_slug_from_name(instance):
-    slug_candidate = slug_original = slugify(instance.name)
-    klass = instance.__class__
-    for i in itertools.count(1):
-        if not klass.objects.filter(slug=slug_candidate).exists():
-            break
-        slug_candidate = f"{slug_original}-{i}"
 
-    return slug_candidate
+def allocate_slugs(model: type[models.Model], bases: list[str]) -> list[str]:
+    """
+    Return a free slug of the model for each base slug, reading the taken ones with a
+    single query. A taken base gets the first free `-1`, `-2`... suffix, and bases
+    repeated in the list get different ones.
+    """
+    if not bases:
+        return []
+    query = Q()
+    for base in set(bases):
+        # The prefix uses the index of the slugs, the pattern only keeps the numbered ones.
+        query |= Q(slug=base) | Q(
+            slug__startswith=f"{base}-", slug__regex=rf"^{re.escape(base)}-[0-9]+$"
+        )
+    taken = set(model._base_manager.filter(query).order_by().values_list("slug", flat=True))
+
+    slugs = []
+    for base in bases:
+        slug = base
+        for i in itertools.count(1):
+            if slug not in taken:
+                break
+            slug = f"{base}-{i}"
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def generate_slug_from_name(instance):
+    return allocate_slugs(instance.__class__, [slugify(instance.name)])[0]
 
 
 def pre_save_slug(sender, instance, **kwargs):
@@ -21,6 +48,91 @@ def pre_save_slug(sender, instance, **kwargs):
         instance.slug = generate_slug_from_name(instance)
 
 
+class CounterFieldsMixin:
+    """
+    Leaves the `counter_fields` out of the updates made by saves, since they're maintained
+    in the database by `comicsdb.counters` and the values the object loaded may be stale.
+    """
+
+    counter_fields: tuple[str, ...] = ()
+
+    def save(self, *args, **kwargs) -> None:
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not (field.primary_key or field.generated)
+                and field.name not in self.counter_fields
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+
+class TrackedFieldsMixin:
+    """
+    Remembers the values the `tracked_fields` had when the object was loaded from, or last
+    saved to, the database, so a save can tell what changed without reading the row again.
+    Files are remembered by name and foreign keys by id.
+    """
+
+    tracked_fields: tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_fields()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None) -> None:
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self._remember_fields(fields)
+
+    def save(self, *args, **kwargs) -> None:
+        super().save(*args, **kwargs)
+        self._remember_fields(kwargs.get("update_fields"))
+
+    def _remember_fields(self, names=None) -> None:
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        for name in self.tracked_fields:
+            attname = self._meta.get_field(name).attname
+            # Deferred fields are only read if they're asked for.
+            if (names is None or name in names or attname in names) and (
+                attname in self.__dict__
+            ):
+                loaded[name] = self._tracked_value(name)
+
+    def _tracked_value(self, name: str):
+        value = getattr(self, self._meta.get_field(name).attname)
+        return value.name or "" if isinstance(value, FieldFile) else value
+
+    def previous(self, name: str):
+        """The value of a tracked field in the database, None if the object is unsaved."""
+        if name not in self.tracked_fields:
+            msg = f"{type(self).__name__}.{name} isn't tracked."
+            raise ValueError(msg)
+        if self._state.adding:
+            return None
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        if name not in loaded:
+            loaded[name] = (
+                type(self)
+                ._base_manager.filter(pk=self.pk)
+                .values_list(self._meta.get_field(name).attname, flat=True)
+                .first()
+            )
+        return loaded[name]
+
+    def has_changed(self, name: str) -> bool:
+        """Whether a tracked field differs from the database, always true when unsaved."""
+        if self._state.adding:
+            return True
+        if self._meta.get_field(name).attname not in self.__dict__:
+            # Still deferred, so it wasn't set.
+            return False
+        return self._tracked_value(name) != self.previous(name)
+
+
 class CommonInfo(models.Model):
     name = models.CharField(max_length=255)
     slug = models.SlugField(max_length=255, unique=True)
@@ -31,3 +143,19 @@ class CommonInfo(models.Model):
 
     class Meta:
         abstract = True
+
+    def save(self, *args, **kwargs) -> None:
+        if self.slug:
+            return super().save(*args, **kwargs)
+        # The slug is allocated by a pre_save receiver, so another object saved meanwhile
+        # can take it first. It's then allocated again.
+        for attempt in range(1, SLUG_ATTEMPTS + 1):
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                taken = type(self)._base_manager.filter(slug=self.slug).exists()
+                if attempt == SLUG_ATTEMPTS or not taken:
+                    raise
+                self.slug = ""
+        return None
@@ -1,22 +1,27 @@
-import contextlib
 import logging
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.postgres.fields import ArrayField
-from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from sorl.thumbnail import ImageField
 
 from comicsdb.models.attribution import Attribution
-from comicsdb.models.common import CommonInfo, pre_save_slug
+from comicsdb.models.common import (
+    CommonInfo,
+    CounterFieldsMixin,
+    TrackedFieldsMixin,
+    pre_save_slug,
+)
+from comicsdb.search import search_vector_field, trigram_index
 from users.models import CustomUser
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Creator(CommonInfo):
+class Creator(CounterFieldsMixin, TrackedFieldsMixin, CommonInfo):
     birth = models.DateField("Date of Birth", null=True, blank=True)
     death = models.DateField("Date of Death", null=True, blank=True)
     image = ImageField(upload_to="creator/%Y/%m/%d/", blank=True)
@@ -28,22 +33,26 @@ class Creator(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="creator_edited"
     )
+    num_issues = models.PositiveIntegerField("Number of Issues", default=0, editable=False)
+    search_vector = search_vector_field("name", array_fields=("alias",))
+
+    counter_fields = ("num_issues",)
+    tracked_fields = ("image",)
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
-        with contextlib.suppress(ObjectDoesNotExist):
-            this = Creator.objects.get(id=self.id)
-            if this.image and this.image != self.image:
-                if self.image:
-                    LOGGER.info("Replacing '%s' with '%s'", this.image, self.image)
-                else:
-                    LOGGER.info("Replacing '%s' with 'None'.", this.image)
-                this.image.delete(save=False)
+        if self.has_changed("image") and (previous := self.previous("image")):
+            if self.image:
+                LOGGER.info("Replacing '%s' with '%s'", previous, self.image)
+            else:
+                LOGGER.info("Replacing '%s' with 'None'.", previous)
+            self.image.storage.delete(previous)
         return super().save(*args, **kwargs)
 
     @property
     def issue_count(self):
-        return self.credits_set.all().count()
+        """The stored counter, stale on an instance loaded before its issues changed."""
+        return self.num_issues
 
     @property
     def recent_issues(self):
@@ -64,7 +73,14 @@ class Creator(CommonInfo):
         return self.name
 
     class Meta:
-        indexes = [models.Index(fields=["name"], name="creator_name_idx")]
+        indexes = [
+            models.Index(fields=["name"], name="creator_name_idx"),
+            models.Index(fields=["modified", "id"], name="creator_modified_id_idx"),
+            trigram_index("name", "creator_name_trgm_idx"),
+            trigram_index("alias", "creator_alias_trgm_idx", array=True),
+            GinIndex(fields=["search_vector"], name="creator_search_idx"),
+            models.Index(fields=["cv_id"], name="creator_cv_id_idx"),
+        ]
         ordering = ["name"]
 
 
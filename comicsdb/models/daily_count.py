@@ -0,0 +1,53 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, models, transaction
+
+from comicsdb.models.publisher import Publisher
+
+
+class DailyCountManager(models.Manager):
+    def add(self, content_type: ContentType, day, count: int, publisher_id=None) -> None:
+        """Add to the count of a day, creating its row if it's the first of the day."""
+        rows = self.filter(content_type=content_type, day=day, publisher_id=publisher_id)
+        if rows.update(count=models.F("count") + count):
+            return
+        try:
+            with transaction.atomic():
+                self.create(
+                    content_type=content_type, day=day, publisher_id=publisher_id, count=count
+                )
+        except IntegrityError:
+            # Created by a concurrent transaction in the meantime.
+            rows.update(count=models.F("count") + count)
+
+
+class DailyCount(models.Model):
+    """
+    Number of the objects of a type created on a day which still exist, maintained by
+    `comicsdb.rollups`. Issues are counted by publisher, other types without one.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    publisher = models.ForeignKey(Publisher, on_delete=models.CASCADE, null=True, blank=True)
+    day = models.DateField()
+    count = models.IntegerField(default=0)
+
+    objects = DailyCountManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "day"],
+                condition=models.Q(publisher=None),
+                name="daily_count_day_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["content_type", "day", "publisher"],
+                condition=models.Q(publisher__isnull=False),
+                name="daily_count_publisher_day_unique",
+            ),
+        ]
+        indexes = [models.Index(fields=["content_type", "day"], name="daily_count_ct_day_idx")]
+        ordering = ["content_type", "day"]
+
+    def __str__(self) -> str:
+        return f"{self.content_type.model} {self.day}: {self.count}"
@@ -0,0 +1,137 @@
+from collections import defaultdict
+
+from django.db import models
+
+from comicsdb.bulk import BATCH_SIZE
+from comicsdb.identifiers import IDENTIFIER_KEYS
+from comicsdb.models.issue import Issue
+from comicsdb.models.variant import Variant
+
+
+class IdentifierManager(models.Manager):
+    def for_object(self, obj: Issue | Variant) -> list["Identifier"]:
+        """Return the unsaved identifiers of the `upc`, `isbn` & `sku` of an object."""
+        is_variant = isinstance(obj, Variant)
+        identifiers = []
+        for kind, key in IDENTIFIER_KEYS.items():
+            value = getattr(obj, kind, "")
+            if value and (found := key(value)):
+                identifiers.append(
+                    self.model(
+                        issue_id=obj.issue_id if is_variant else obj.pk,
+                        variant=obj if is_variant else None,
+                        kind=kind,
+                        value=found[0],
+                        addon=found[1],
+                    )
+                )
+        return identifiers
+
+    def index(self, objects) -> None:
+        """Replace the identifiers of issues, or of variants, with their current ones."""
+        objects = list(objects)
+        if not objects:
+            return
+        if isinstance(objects[0], Variant):
+            self.filter(variant__in=objects).delete()
+        else:
+            self.filter(issue__in=objects, variant=None).delete()
+        self.bulk_create(
+            [identifier for obj in objects for identifier in self.for_object(obj)],
+            batch_size=BATCH_SIZE,
+        )
+
+    def lookup(self, kind: str, value: str, addon: str = "") -> models.QuerySet:
+        """Identifiers with the code, and the add-on unless it's empty."""
+        return self.lookup_keys([(kind, value, addon)])
+
+    def lookup_keys(self, keys: list[tuple[str, str, str]]) -> models.QuerySet:
+        """Identifiers matching any of the (kind, code, add-on) keys, like `lookup`."""
+        query = models.Q(pk__in=[])
+        for kind, value, addon in keys:
+            query |= models.Q(kind=kind, value=value, **({"addon": addon} if addon else {}))
+        return self.filter(query)
+
+    def match(self, kind: str, keys: dict[str, tuple[str, str]]) -> dict[str, list[int]]:
+        """
+        Return the keys of the issues matching each (code, add-on) of `keys`, by their key
+        in it, with a single query. Like `lookup`, a code without an add-on matches every
+        add-on.
+        """
+        by_code = defaultdict(list)
+        for name, (value, addon) in keys.items():
+            by_code[value].append((name, addon))
+        matches = {name: [] for name in keys}
+        identifiers = (
+            self.filter(kind=kind, value__in=by_code)
+            .order_by("issue_id")
+            .values_list("issue_id", "value", "addon")
+        )
+        for issue_id, value, addon in identifiers:
+            for name, wanted in by_code[value]:
+                if wanted in ("", addon) and issue_id not in matches[name]:
+                    matches[name].append(issue_id)
+        return matches
+
+
+class Identifier(models.Model):
+    """
+    Normalized UPCs, ISBNs & SKUs of the issues and of their variants, so that a barcode
+    is found with a single index lookup. Rows are replaced whenever the issue or variant
+    has a code changed, and variant rows also point to their issue.
+    """
+
+    class Kind(models.TextChoices):
+        UPC = "upc", "UPC"
+        ISBN = "isbn", "ISBN"
+        SKU = "sku", "SKU"
+
+    issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name="identifiers")
+    variant = models.ForeignKey(
+        Variant,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="identifiers",
+    )
+    kind = models.CharField(max_length=4, choices=Kind.choices)
+    value = models.CharField(max_length=20)
+    # The 2 or 5 digit add-on of a UPC, which tells the issues of a series apart.
+    addon = models.CharField(max_length=5, blank=True)
+
+    objects = IdentifierManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "value", "addon", "issue"],
+                condition=models.Q(variant=None),
+                name="identifier_issue_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["kind", "value", "addon", "variant"],
+                condition=models.Q(variant__isnull=False),
+                name="identifier_variant_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "value", "addon"], name="identifier_lookup_idx")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()}: {self.value}{self.addon}"
+
+
+def pre_save_identifiers(sender, instance, **kwargs) -> None:
+    # The identifiers are only replaced when a code changed, which is checked before the
+    # save remembers the new values.
+    instance._index_identifiers = any(
+        instance.has_changed(kind)
+        for kind in IDENTIFIER_KEYS
+        if kind in instance.tracked_fields
+    )
+
+
+def post_save_identifiers(sender, instance, **kwargs) -> None:
+    if getattr(instance, "_index_identifiers", True):
+        Identifier.objects.index([instance])
@@ -1,22 +1,25 @@
-import contextlib
 import logging
 
 from django.contrib.contenttypes.fields import GenericRelation
-from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from sorl.thumbnail import ImageField
 
 from comicsdb.models.attribution import Attribution
-from comicsdb.models.common import CommonInfo, pre_save_slug
+from comicsdb.models.common import (
+    CommonInfo,
+    CounterFieldsMixin,
+    TrackedFieldsMixin,
+    pre_save_slug,
+)
 from comicsdb.models.publisher import Publisher
 from users.models import CustomUser
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Imprint(CommonInfo):
+class Imprint(CounterFieldsMixin, TrackedFieldsMixin, CommonInfo):
     publisher = models.ForeignKey(Publisher, on_delete=models.CASCADE, related_name="imprints")
     founded = models.PositiveSmallIntegerField("Year Founded", null=True, blank=True)
     image = ImageField("Logo", upload_to="imprint/%Y/%m/%d", null=True, blank=True)
@@ -27,17 +30,19 @@ class Imprint(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="imprints_edited"
     )
+    num_series = models.PositiveIntegerField("Number of Series", default=0, editable=False)
+
+    counter_fields = ("num_series",)
+    tracked_fields = ("image",)
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
-        with contextlib.suppress(ObjectDoesNotExist):
-            this = Imprint.objects.get(id=self.id)
-            if this.image and this.image != self.image:
-                if self.image:
-                    LOGGER.info("Replacing '%s' with '%s'", this.image, self.image)
-                else:
-                    LOGGER.info("Replacing '%s' with 'None'.", this.image)
-                this.image.delete(save=False)
+        if self.has_changed("image") and (previous := self.previous("image")):
+            if self.image:
+                LOGGER.info("Replacing '%s' with '%s'", previous, self.image)
+            else:
+                LOGGER.info("Replacing '%s' with 'None'.", previous)
+            self.image.storage.delete(previous)
         return super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -45,7 +50,8 @@ class Imprint(CommonInfo):
 
     @property
     def series_count(self):
-        return self.series.all().count()
+        """The stored counter, stale on an instance loaded before its series changed."""
+        return self.num_series
 
     @property
     def wikipedia(self):
@@ -59,7 +65,11 @@ class Imprint(CommonInfo):
         return self.name
 
     class Meta:
-        indexes = [models.Index(fields=["name"], name="imprint_name_idx")]
+        indexes = [
+            models.Index(fields=["name"], name="imprint_name_idx"),
+            models.Index(fields=["modified", "id"], name="imprint_modified_id_idx"),
+            models.Index(fields=["cv_id"], name="imprint_cv_id_idx"),
+        ]
         ordering = ["name"]
 
 
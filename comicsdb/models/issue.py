@@ -1,22 +1,22 @@
-import contextlib
-import itertools
 import logging
 
-import imagehash
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.postgres.fields import ArrayField
-from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_save, pre_save
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.text import slugify
-from PIL import Image
 from sorl.thumbnail import ImageField
 
+from comicsdb.background import run_after_commit
+from comicsdb.cache import invalidate_representations
+from comicsdb.cover_hash import NUM_CHUNKS, chunk_expression, hash_image, hash_to_int
 from comicsdb.models.arc import Arc
 from comicsdb.models.attribution import Attribution
+from comicsdb.models.change import Change
 from comicsdb.models.character import Character
-from comicsdb.models.common import CommonInfo
+from comicsdb.models.common import CommonInfo, TrackedFieldsMixin, allocate_slugs
 from comicsdb.models.creator import Creator
 from comicsdb.models.rating import Rating
 from comicsdb.models.series import Series
@@ -37,7 +37,7 @@ class TradePaperbackManager(models.Manager):
         return super().get_queryset().filter(series__series_type__name="Trade Paperback")
 
 
-class Issue(CommonInfo):
+class Issue(TrackedFieldsMixin, CommonInfo):
     series = models.ForeignKey(Series, on_delete=models.CASCADE, related_name="issues")
     name = ArrayField(models.CharField("Story Title", max_length=150), null=True, blank=True)
     title = models.CharField("Collection Title", max_length=255, blank=True)
@@ -54,6 +54,7 @@ class Issue(CommonInfo):
     page = models.PositiveSmallIntegerField("Page Count", null=True, blank=True)
     image = ImageField("Cover", upload_to="issue/%Y/%m/%d/", blank=True)
     cover_hash = models.CharField("Cover Hash", max_length=16, blank=True)
+    cover_hash_value = models.BigIntegerField(null=True, blank=True, editable=False)
     arcs = models.ManyToManyField(Arc, blank=True, related_name="issues")
     creators = models.ManyToManyField(
         Creator, through="Credits", blank=True, related_name="issues"
@@ -74,6 +75,8 @@ class Issue(CommonInfo):
     graphic_novels = GraphicNovelManager()
     tpb = TradePaperbackManager()
 
+    tracked_fields = ("image", "series", "upc", "isbn", "sku")
+
     def get_absolute_url(self):
         return reverse("issue:detail", args=[self.slug])
 
@@ -87,14 +90,12 @@ class Issue(CommonInfo):
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
-        with contextlib.suppress(ObjectDoesNotExist):
-            this: Issue = Issue.objects.get(id=self.id)
-            if this.image and this.image != self.image:
-                if self.image:
-                    LOGGER.info("Replacing '%s' with '%s'", this.image, self.image)
-                else:
-                    LOGGER.info("Replacing '%s' with 'None'.", this.image)
-                this.image.delete(save=False)
+        if self.has_changed("image") and (previous := self.previous("image")):
+            if self.image:
+                LOGGER.info("Replacing '%s' with '%s'", previous, self.image)
+            else:
+                LOGGER.info("Replacing '%s' with 'None'.", previous)
+            self.image.storage.delete(previous)
         return super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -111,19 +112,26 @@ class Issue(CommonInfo):
                 name="series_cover_store_num_idx",
             ),
             models.Index(fields=["series", "number"], name="series_number_idx"),
+            models.Index(fields=["modified", "id"], name="issue_modified_id_idx"),
+            models.Index(fields=["cv_id"], name="issue_cv_id_idx"),
+            models.Index(fields=["upc"], name="issue_upc_idx"),
+            models.Index(fields=["isbn"], name="issue_isbn_idx"),
+            models.Index(fields=["sku"], name="issue_sku_idx"),
+            *[
+                models.Index(chunk_expression(i), name=f"issue_cover_hash_chunk_{i}_idx")
+                for i in range(NUM_CHUNKS)
+            ],
         ]
         ordering = ["series__sort_name", "cover_date", "store_date", "number"]
         unique_together = ["series", "number"]
 
 
-def generate_issue_slug(instance: Issue):
-    slug_candidate = slug_original = slugify(f"{instance.series.slug}-{instance.number}")
-    for i in itertools.count(1):
-        if not Issue.objects.filter(slug=slug_candidate).exists():
-            break
-        slug_candidate = f"{slug_original}-{i}"
+def issue_slug_base(instance: Issue) -> str:
+    return slugify(f"{instance.series.slug}-{instance.number}")
 
-    return slug_candidate
+
+def generate_issue_slug(instance: Issue):
+    return allocate_slugs(Issue, [issue_slug_base(instance)])[0]
 
 
 def pre_save_issue_slug(sender, instance: Issue, *args, **kwargs) -> None:
@@ -131,36 +139,53 @@ def pre_save_issue_slug(sender, instance: Issue, *args, **kwargs) -> None:
         instance.slug = generate_issue_slug(instance)
 
 
-def generate_cover_hash(instance: Issue) -> str:
-    with Image.open(instance.image) as img:
-        try:
-            cover_hash = str(imagehash.phash(img))
-        except OSError as e:
-            cover_hash = ""
-            LOGGER.error("Unable to generate cover hash for '%s': %s", instance, e)
-    return cover_hash
-
-
-def pre_save_cover_hash(sender, instance: Issue, *args, **kwargs) -> None:
-    if instance.image:
-        ch = generate_cover_hash(instance)
-        if instance.cover_hash != ch:
-            LOGGER.info(
-                "Updating cover hash from '%s' to '%s' for %s",
-                instance.cover_hash,
-                ch,
-                instance,
-            )
-            instance.cover_hash = ch
+def hash_cover(pk: int, image: str) -> None:
+    """Hash the cover of an issue and store it, unless the cover was replaced meanwhile."""
+    issue = Issue.objects.filter(pk=pk, image=image).only("pk", "image").first()
+    if issue is None:
         return
-
-    if instance.cover_hash:
+    try:
+        cover_hash = hash_image(issue.image)
+    except OSError as e:
+        LOGGER.error("Unable to generate cover hash for issue %s: %s", pk, e)
+        return
+    updated = Issue.objects.filter(pk=pk, image=image).update(
+        cover_hash=cover_hash,
+        cover_hash_value=hash_to_int(cover_hash),
+        modified=timezone.now(),
+    )
+    if updated:
+        LOGGER.info("Updated cover hash to '%s' for issue %s", cover_hash, pk)
+        # The update skips the signals, so the change is logged here.
+        Change.objects.log(Issue, [pk], Change.Operation.UPDATE)
+        invalidate_representations("issue", [pk])
+
+
+def pre_save_cover_hash(sender, instance: Issue, raw=False, **kwargs) -> None:
+    # Hashing means downloading & decoding the cover, so it's only done when it changed,
+    # in the background after the save. Meanwhile the hash of the previous cover is cleared.
+    instance._hash_cover = (
+        bool(instance.image)
+        and not raw
+        and (instance.has_changed("image") or not instance.cover_hash)
+    )
+    if instance.cover_hash and (instance._hash_cover or not instance.image):
         LOGGER.info(
             "Updating cover hash from '%s' to '' for %s", instance.cover_hash, instance
         )
         instance.cover_hash = ""
-        return
+
+
+def post_save_cover_hash(sender, instance: Issue, *args, **kwargs) -> None:
+    if getattr(instance, "_hash_cover", False):
+        run_after_commit(hash_cover, instance.pk, instance.image.name)
+
+
+def pre_save_cover_hash_value(sender, instance: Issue, *args, **kwargs) -> None:
+    instance.cover_hash_value = hash_to_int(instance.cover_hash)
 
 
 pre_save.connect(pre_save_issue_slug, sender=Issue)
 pre_save.connect(pre_save_cover_hash, sender=Issue)
+pre_save.connect(pre_save_cover_hash_value, sender=Issue)
+post_save.connect(post_save_cover_hash, sender=Issue)
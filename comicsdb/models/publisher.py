@@ -1,21 +1,26 @@
-import contextlib
 import logging
 
 from django.contrib.contenttypes.fields import GenericRelation
-from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from sorl.thumbnail import ImageField
 
 from comicsdb.models.attribution import Attribution
-from comicsdb.models.common import CommonInfo, pre_save_slug
+from comicsdb.models.common import (
+    CommonInfo,
+    CounterFieldsMixin,
+    TrackedFieldsMixin,
+    pre_save_slug,
+)
+from comicsdb.search import search_vector_field, trigram_index
 from users.models import CustomUser
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Publisher(CommonInfo):
+class Publisher(CounterFieldsMixin, TrackedFieldsMixin, CommonInfo):
     founded = models.PositiveSmallIntegerField("Year Founded", null=True, blank=True)
     image = ImageField("Logo", upload_to="publisher/%Y/%m/%d/", blank=True)
     attribution = GenericRelation(Attribution, related_query_name="publishers")
@@ -25,17 +30,20 @@ class Publisher(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="publishers_edited"
     )
+    num_series = models.PositiveIntegerField("Number of Series", default=0, editable=False)
+    search_vector = search_vector_field("name")
+
+    counter_fields = ("num_series",)
+    tracked_fields = ("image",)
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
-        with contextlib.suppress(ObjectDoesNotExist):
-            this = Publisher.objects.get(id=self.id)
-            if this.image and this.image != self.image:
-                if self.image:
-                    LOGGER.info("Replacing '%s' with '%s'", this.image, self.image)
-                else:
-                    LOGGER.info("Replacing '%s' with 'None'.", this.image)
-                this.image.delete(save=False)
+        if self.has_changed("image") and (previous := self.previous("image")):
+            if self.image:
+                LOGGER.info("Replacing '%s' with '%s'", previous, self.image)
+            else:
+                LOGGER.info("Replacing '%s' with 'None'.", previous)
+            self.image.storage.delete(previous)
         return super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -43,7 +51,8 @@ class Publisher(CommonInfo):
 
     @property
     def series_count(self):
-        return self.series.all().count()
+        """The stored counter, stale on an instance loaded before its series changed."""
+        return self.num_series
 
     @property
     def wikipedia(self):
@@ -57,7 +66,13 @@ class Publisher(CommonInfo):
         return self.name
 
     class Meta:
-        indexes = [models.Index(fields=["name"], name="publisher_name_idx")]
+        indexes = [
+            models.Index(fields=["name"], name="publisher_name_idx"),
+            models.Index(fields=["modified", "id"], name="publisher_modified_id_idx"),
+            trigram_index("name", "publisher_name_trgm_idx"),
+            GinIndex(fields=["search_vector"], name="publisher_search_idx"),
+            models.Index(fields=["cv_id"], name="publisher_cv_id_idx"),
+        ]
         ordering = ["name"]
 
 
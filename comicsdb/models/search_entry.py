@@ -0,0 +1,39 @@
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+from django.urls import reverse
+
+from comicsdb.search import search_vector_field
+
+
+class SearchEntry(models.Model):
+    """
+    Consolidated & indexed text of the searchable objects of every type, maintained by
+    `comicsdb.search_index`, so that the site-wide search is a single indexed query.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    name = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255)
+    document = models.TextField()
+    search_vector = search_vector_field("document")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"], name="search_entry_object_unique"
+            )
+        ]
+        indexes = [GinIndex(fields=["search_vector"], name="search_entry_search_idx")]
+        verbose_name_plural = "Search entries"
+
+    def __str__(self) -> str:
+        return f"{self.model_name}: {self.name}"
+
+    def get_absolute_url(self):
+        return reverse(f"{self.model_name}:detail", args=[self.slug])
+
+    @property
+    def model_name(self) -> str:
+        return ContentType.objects.get_for_id(self.content_type_id).model
@@ -1,16 +1,21 @@
-import itertools
-
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from django.utils.text import slugify
 
 from comicsdb.models.attribution import Attribution
-from comicsdb.models.common import CommonInfo
+from comicsdb.models.common import (
+    CommonInfo,
+    CounterFieldsMixin,
+    TrackedFieldsMixin,
+    allocate_slugs,
+)
 from comicsdb.models.genre import Genre
 from comicsdb.models.imprint import Imprint
 from comicsdb.models.publisher import Publisher
+from comicsdb.search import search_vector_field, trigram_index
 from users.models import CustomUser
 
 
@@ -26,7 +31,7 @@ class SeriesType(models.Model):
         return self.name
 
 
-class Series(CommonInfo):
+class Series(CounterFieldsMixin, TrackedFieldsMixin, CommonInfo):
     class Status(models.IntegerChoices):
         CANCELLED = 1
         COMPLETED = 2
@@ -58,6 +63,12 @@ class Series(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="series_edited"
     )
+    num_issues = models.PositiveIntegerField("Number of Issues", default=0, editable=False)
+    search_vector = search_vector_field("name")
+
+    counter_fields = ("num_issues",)
+    # The counters & search entries of the issues depend on them.
+    tracked_fields = ("imprint", "name", "publisher", "series_type", "year_began")
 
     def get_absolute_url(self):
         return reverse("series:detail", args=[self.slug])
@@ -83,12 +94,17 @@ class Series(CommonInfo):
 
     @property
     def issue_count(self) -> int:
-        return self.issues.all().count()
+        """The stored counter, stale on an instance loaded before its issues changed."""
+        return self.num_issues
 
     class Meta:
         indexes = [
             models.Index(fields=["sort_name", "year_began"], name="sort_year_began_idx"),
             models.Index(fields=["name"], name="series_name_idx"),
+            models.Index(fields=["modified", "id"], name="series_modified_id_idx"),
+            trigram_index("name", "series_name_trgm_idx"),
+            GinIndex(fields=["search_vector"], name="series_search_idx"),
+            models.Index(fields=["cv_id"], name="series_cv_id_idx"),
         ]
         ordering = ["sort_name", "year_began"]
         unique_together = ["publisher", "imprint", "name", "volume", "series_type"]
@@ -96,14 +112,9 @@ class Series(CommonInfo):
 
 
 def generate_series_slug(instance):
-    slug_candidate = slug_original = slugify(f"{instance.name}-{instance.year_began}")
-    klass = instance.__class__
-    for i in itertools.count(1):
-        if not klass.objects.filter(slug=slug_candidate).exists():
-            break
-        slug_candidate = f"{slug_original}-{i}"
-
-    return slug_candidate
+    return allocate_slugs(
+        instance.__class__, [slugify(f"{instance.name}-{instance.year_began}")]
+    )[0]
 
 
 def pre_save_series_slug(sender, instance, **kwargs):
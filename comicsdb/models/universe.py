@@ -1,22 +1,26 @@
-import contextlib
 import logging
 
 from django.contrib.contenttypes.fields import GenericRelation
-from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from sorl.thumbnail import ImageField
 
 from comicsdb.models.attribution import Attribution
-from comicsdb.models.common import CommonInfo, pre_save_slug
+from comicsdb.models.common import (
+    CommonInfo,
+    CounterFieldsMixin,
+    TrackedFieldsMixin,
+    pre_save_slug,
+)
 from comicsdb.models.publisher import Publisher
+from comicsdb.search import trigram_index
 from users.models import CustomUser
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Universe(CommonInfo):
+class Universe(CounterFieldsMixin, TrackedFieldsMixin, CommonInfo):
     publisher = models.ForeignKey(
         Publisher, on_delete=models.CASCADE, related_name="universes"
     )
@@ -29,17 +33,19 @@ class Universe(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="universes_edited"
     )
+    num_issues = models.PositiveIntegerField("Number of Issues", default=0, editable=False)
+
+    counter_fields = ("num_issues",)
+    tracked_fields = ("image",)
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
-        with contextlib.suppress(ObjectDoesNotExist):
-            this = Universe.objects.get(id=self.id)
-            if this.image and this.image != self.image:
-                if self.image:
-                    LOGGER.info("Replacing '%s' with '%s'", this.image, self.image)
-                else:
-                    LOGGER.info("Replacing '%s' with 'None'.", this.image)
-                this.image.delete(save=False)
+        if self.has_changed("image") and (previous := self.previous("image")):
+            if self.image:
+                LOGGER.info("Replacing '%s' with '%s'", previous, self.image)
+            else:
+                LOGGER.info("Replacing '%s' with 'None'.", previous)
+            self.image.storage.delete(previous)
         return super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -47,7 +53,8 @@ class Universe(CommonInfo):
 
     @property
     def issue_count(self):
-        return self.issues.all().count()
+        """The stored counter, stale on an instance loaded before its issues changed."""
+        return self.num_issues
 
     @property
     def first_appearance(self):
@@ -71,7 +78,13 @@ class Universe(CommonInfo):
         return self.universe_name
 
     class Meta:
-        indexes = [models.Index(fields=["name"], name="universe_name_idx")]
+        indexes = [
+            models.Index(fields=["name"], name="universe_name_idx"),
+            models.Index(fields=["modified", "id"], name="universe_modified_id_idx"),
+            trigram_index("name", "universe_name_trgm_idx"),
+            trigram_index("designation", "universe_designation_trgm_idx"),
+            models.Index(fields=["cv_id"], name="universe_cv_id_idx"),
+        ]
         ordering = ["name", "designation"]
         unique_together = ["publisher", "name", "designation"]
         db_table_comment = "Publisher Universes"
@@ -0,0 +1,154 @@
+"""
+Process-local cache of the small reference tables read on most requests, or looked up by
+name over & over by the admin actions and commands.
+
+Each process keeps the tables it read for `REFERENCE_TTL` seconds at most. Saving or
+deleting a row bumps the version of its table in the shared cache, from the receivers
+connected in `ComicsdbConfig.ready()`, which the processes check at most every
+`VERSION_CHECK_INTERVAL` seconds, so they reload a table shortly after it changes.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from django.conf import settings
+from django.contrib.flatpages.models import FlatPage
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from comicsdb.models import Announcement, Rating, Role, SeriesType
+
+REFERENCE_TTL = 60 * 5
+VERSION_CHECK_INTERVAL = 5
+
+
+class ReferenceTable(NamedTuple):
+    model: type[Model]
+    load: Callable[[], Any]
+
+
+class Entry(NamedTuple):
+    value: Any
+    version: int
+    loaded: float
+    checked: float
+
+
+def by_name(model: type[Model]) -> dict[str, Model]:
+    return {obj.name.lower(): obj for obj in model.objects.all()}
+
+
+REFERENCE_TABLES: dict[str, ReferenceTable] = {
+    # The dates are checked when they're read, so the active announcements don't go stale.
+    "announcements": ReferenceTable(
+        Announcement, lambda: list(Announcement.objects.filter(active=True).order_by("pk"))
+    ),
+    "flatpages": ReferenceTable(
+        FlatPage,
+        lambda: set(
+            FlatPage.objects.filter(sites=settings.SITE_ID).values_list("url", flat=True)
+        ),
+    ),
+    "ratings": ReferenceTable(Rating, lambda: by_name(Rating)),
+    "roles": ReferenceTable(Role, lambda: by_name(Role)),
+    "series_types": ReferenceTable(
+        SeriesType, lambda: list(SeriesType.objects.values("id", "name"))
+    ),
+}
+
+# Table name -> its entry in this process
+_entries: dict[str, Entry] = {}
+
+
+def version_key(name: str) -> str:
+    return f"reference:version:{name}"
+
+
+def get_table(name: str):
+    """Return the cached value of a reference table, loading it when it's stale."""
+    now = time.monotonic()
+    entry = _entries.get(name)
+    if entry is not None and now - entry.loaded < REFERENCE_TTL:
+        if now - entry.checked < VERSION_CHECK_INTERVAL:
+            return entry.value
+        version = cache.get(version_key(name), 0)
+        if version == entry.version:
+            _entries[name] = entry._replace(checked=now)
+            return entry.value
+    else:
+        version = cache.get(version_key(name), 0)
+
+    # The version is read first, so a change made while loading is picked up next time.
+    value = REFERENCE_TABLES[name].load()
+    _entries[name] = Entry(value, version, now, now)
+    return value
+
+
+def invalidate_table(name: str) -> None:
+    """Make every process reload a table, once the current transaction commits."""
+
+    def bump():
+        _entries.pop(name, None)
+        cache.set(version_key(name), time.time_ns(), None)
+
+    transaction.on_commit(bump)
+
+
+def clear_tables() -> None:
+    """Forget the tables cached in this process."""
+    _entries.clear()
+
+
+# Lookups
+def active_announcements() -> list[Announcement]:
+    """Announcements that should be displayed."""
+    today = timezone.now().date()
+    return [
+        announcement
+        for announcement in get_table("announcements")
+        if (announcement.start_date is None or announcement.start_date <= today)
+        and (announcement.end_date is None or announcement.end_date >= today)
+    ]
+
+
+def is_flatpage(url: str) -> bool:
+    """Whether the flatpage fallback would find a page, or a redirect to one, for the url."""
+    urls = get_table("flatpages")
+    return url in urls or (settings.APPEND_SLASH and f"{url}/" in urls)
+
+
+def get_rating(name: str) -> Rating:
+    """The rating with the name, ignoring case."""
+    try:
+        return get_table("ratings")[name.lower()]
+    except KeyError:
+        msg = f"No rating named {name!r}."
+        raise Rating.DoesNotExist(msg) from None
+
+
+def get_role(name: str) -> Role:
+    """The role with the name, ignoring case."""
+    try:
+        return get_table("roles")[name.lower()]
+    except KeyError:
+        msg = f"No role named {name!r}."
+        raise Role.DoesNotExist(msg) from None
+
+
+def series_types() -> list[dict]:
+    """The id & name of every series type, for the search boxes of the issue lists."""
+    return get_table("series_types")
+
+
+# Signal receivers
+def reference_table_changed(sender, **kwargs) -> None:
+    if not kwargs.get("action", "post_").startswith("post_"):
+        return
+    # The m2m changes are sent by the through model, auto created by the table's model.
+    model = sender._meta.auto_created or sender
+    for name, table in REFERENCE_TABLES.items():
+        if table.model is model:
+            invalidate_table(name)
@@ -0,0 +1,154 @@
+"""
+Daily rollups of the number of objects created, behind the site statistics.
+
+`DailyCount` holds the number of objects of every type created on each day that still
+exist, by publisher for issues. The rows are adjusted from the signal receivers connected
+in `ComicsdbConfig.ready()`, and recomputed by the `update_daily_counts` command as a
+periodic reconciliation, which also catches the issues whose series changed publisher.
+The statistics only read the rollups, so their cost doesn't grow with the catalogue.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count, F, Model, QuerySet, Sum
+from django.db.models.functions import TruncDate, TruncMonth, TruncYear
+from django.utils import timezone
+
+from comicsdb.bulk import BATCH_SIZE
+from comicsdb.models import (
+    Arc,
+    Character,
+    Creator,
+    DailyCount,
+    Issue,
+    Publisher,
+    Series,
+    Team,
+)
+from users.models import CustomUser
+
+# Model -> field of its creation time
+ROLLUP_MODELS: dict[type[Model], str] = {
+    Arc: "created_on",
+    Character: "created_on",
+    Creator: "created_on",
+    Issue: "created_on",
+    Publisher: "created_on",
+    Series: "created_on",
+    Team: "created_on",
+    CustomUser: "date_joined",
+}
+# The rollups are already by day.
+PERIODS = {"day": F, "month": TruncMonth, "year": TruncYear}
+
+
+def created_counts(queryset: QuerySet, date_field: str, publisher_field: str | None = None):
+    """Rows of the number of objects of the queryset created on each day (& publisher)."""
+    fields = {"day": TruncDate(date_field)}
+    if publisher_field is not None:
+        fields["publisher_id"] = F(publisher_field)
+    return queryset.order_by().annotate(**fields).values(*fields).annotate(count=Count("*"))
+
+
+def rebuild_counts(model: type[Model]) -> int:
+    """Recompute the rollups of the model from its table. Returns the number of rows."""
+    content_type = ContentType.objects.get_for_model(model)
+    publisher_field = "series__publisher" if model is Issue else None
+    rows = [
+        DailyCount(content_type=content_type, **row)
+        for row in created_counts(model.objects.all(), ROLLUP_MODELS[model], publisher_field)
+    ]
+    with transaction.atomic():
+        DailyCount.objects.filter(content_type=content_type).delete()
+        DailyCount.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return len(rows)
+
+
+def add_counts(model: type[Model], objects: Iterable[Model], count: int = 1) -> None:
+    """Add `count` to the rollups of the days (& publishers) the objects were created."""
+    keys = Counter()
+    for obj in objects:
+        created = getattr(obj, ROLLUP_MODELS[model], None)
+        day = timezone.localdate(created if isinstance(created, datetime) else None)
+        publisher_id = getattr(obj, "_rollup_publisher_id", None)
+        if model is Issue and publisher_id is None:
+            publisher_id = obj.series.publisher_id
+        keys[day, publisher_id] += count
+    content_type = ContentType.objects.get_for_model(model)
+    for (day, publisher_id), total in keys.items():
+        DailyCount.objects.add(content_type, day, total, publisher_id)
+
+
+# Queries of the statistics
+def rollups(model: type[Model]) -> QuerySet:
+    return DailyCount.objects.filter(content_type=ContentType.objects.get_for_model(model))
+
+
+def totals() -> dict[type[Model], int]:
+    """Number of objects of every model."""
+    content_types = ContentType.objects.get_for_models(*ROLLUP_MODELS)
+    counts = dict(
+        DailyCount.objects.filter(content_type__in=content_types.values())
+        .order_by()
+        .values_list("content_type")
+        .annotate(total=Sum("count"))
+    )
+    return {model: counts.get(ct.pk, 0) for model, ct in content_types.items()}
+
+
+def created_between(model: type[Model], start: date, end: date) -> int:
+    """Number of objects of the model created from the start day, up to the end day."""
+    total = rollups(model).filter(day__gte=start, day__lt=end).aggregate(total=Sum("count"))
+    return total["total"] or 0
+
+
+def created_by_period(model: type[Model], period: str, limit: int | None = None) -> list:
+    """Number of objects created by day, month or year, the latest `limit` of them."""
+    rows = (
+        rollups(model)
+        .exclude(count=0)
+        .annotate(period=PERIODS[period]("day"))
+        .order_by("-period")
+        .values("period")
+        .annotate(c=Sum("count"))
+    )
+    if limit is not None:
+        rows = rows[:limit]
+    return list(reversed(rows))
+
+
+def issues_by_publisher() -> dict[str, int]:
+    return dict(
+        rollups(Issue)
+        .order_by("publisher__name")
+        .values_list("publisher__name")
+        .annotate(total=Sum("count"))
+    )
+
+
+# Signal receivers
+def post_save_rollup(sender, instance, created, raw=False, **kwargs) -> None:
+    if created and not raw:
+        add_counts(sender, [instance])
+
+
+def pre_delete_issue_rollup(sender, instance: Issue, **kwargs) -> None:
+    # The series may be deleted along with the issue, so its publisher is looked up first.
+    instance._rollup_publisher_id = (
+        Series.objects.filter(pk=instance.series_id)
+        .values_list("publisher_id", flat=True)
+        .first()
+    )
+
+
+def post_delete_rollup(sender, instance, origin=None, **kwargs) -> None:
+    # The rollups of a deleted publisher are deleted along with it, before its issues, so
+    # decrementing them would recreate rows pointing to it.
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if sender is Issue and origin_model is Publisher:
+        return
+    add_counts(sender, [instance], -1)
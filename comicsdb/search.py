@@ -0,0 +1,141 @@
+"""
+Full-text search over the names of the catalogue entities.
+
+Searchable models have a generated `search_vector` column, holding the tsvector of their
+unaccented name (and aliases) with the `simple` configuration, so that no stemming or
+stop words get in the way of matching names. The column has a GIN index, and every word
+of a query is matched as a prefix of a word of the name.
+
+For substring matching, the unaccented & upper-cased names (and joined aliases) have
+pg_trgm GIN indexes, built from the `trigram_text` expressions. The `search_contains`
+lookup matches against those, for any text or array of text field.
+"""
+
+import re
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db.models import (
+    CharField,
+    F,
+    Func,
+    GeneratedField,
+    Lookup,
+    QuerySet,
+    TextField,
+    Transform,
+    Value,
+)
+from django.db.models.functions import Upper
+
+SEARCH_CONFIG = "simple"
+# Letters & digits; everything else separates words, as it does in the tsvector.
+WORD_RE = re.compile(r"[^\W_]+")
+
+
+class ImmutableUnaccent(Func):
+    """
+    `unaccent()` through an immutable wrapper function, as only immutable functions can
+    be used in generated columns and index expressions.
+    """
+
+    function = "immutable_unaccent"
+    output_field = TextField()
+
+
+class ImmutableArrayToString(Func):
+    function = "immutable_array_to_string"
+    template = "%(function)s(%(expressions)s::text[], ' ')"
+    output_field = TextField()
+
+
+def search_vector_field(*fields: str, array_fields: tuple[str, ...] = ()) -> GeneratedField:
+    expressions = [ImmutableUnaccent(field) for field in fields]
+    expressions += [ImmutableUnaccent(ImmutableArrayToString(field)) for field in array_fields]
+    return GeneratedField(
+        expression=SearchVector(*expressions, config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+
+def trigram_text(field: str, *, array: bool = False) -> Upper:
+    """Expression of the text of a field that substring searches are matched against."""
+    return Upper(ImmutableUnaccent(ImmutableArrayToString(field) if array else F(field)))
+
+
+def trigram_index(field: str, name: str, *, array: bool = False) -> GinIndex:
+    return GinIndex(OpClass(trigram_text(field, array=array), name="gin_trgm_ops"), name=name)
+
+
+class SearchText(Transform):
+    """The text of a field as `trigram_text` indexes it (`<field>__search_text`)."""
+
+    lookup_name = "search_text"
+    output_field = TextField()
+
+    def as_sql(self, compiler, connection):
+        expression = self.lhs
+        if isinstance(self.lhs.output_field, ArrayField):
+            expression = ImmutableArrayToString(expression)
+        return compiler.compile(Upper(ImmutableUnaccent(expression)))
+
+
+class SearchContains(Lookup):
+    """
+    Unaccented & case-insensitive substring match (`<field>__search_contains`). Unlike
+    `unaccent__icontains`, it can use the trigram index of the field.
+    """
+
+    lookup_name = "search_contains"
+    prepare_rhs = False
+
+    def get_db_prep_lookup(self, value, connection):
+        return "%s", [connection.ops.prep_for_like_query(value)]
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = compiler.compile(SearchText(self.lhs))
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return (
+            f"{lhs} LIKE '%%' || UPPER(immutable_unaccent({rhs})) || '%%'",
+            [*lhs_params, *rhs_params],
+        )
+
+
+for field_class in (CharField, TextField, ArrayField):
+    field_class.register_lookup(SearchText)
+    field_class.register_lookup(SearchContains)
+
+
+def prefix_query(value: str) -> SearchQuery | None:
+    """Return a query matching every word of the value as a prefix, if it has any words."""
+    words = WORD_RE.findall(value)
+    if not words:
+        return None
+    raw = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(ImmutableUnaccent(Value(raw)), search_type="raw", config=SEARCH_CONFIG)
+
+
+def search(
+    queryset: QuerySet, value: str, field: str = "search_vector", *, rank: bool = False
+) -> QuerySet:
+    """
+    Filter the queryset to the objects matching the value. With `rank`, the best matches
+    come first, followed by the usual ordering of the queryset.
+    """
+    query = prefix_query(value)
+    if query is None:
+        return queryset.none()
+    queryset = queryset.filter(**{field: query})
+    if rank:
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        queryset = queryset.annotate(search_rank=SearchRank(F(field), query)).order_by(
+            "-search_rank", *ordering
+        )
+    return queryset
@@ -0,0 +1,185 @@
+"""
+Maintenance & querying of the `SearchEntry` table behind the site-wide search.
+
+Every searchable object has an entry holding its display name, slug & the text it's found
+by. The entries are written from the signal receivers connected in
+`ComicsdbConfig.ready()`, and for every object by the `rebuild_search_index` command, to
+backfill the table or reconcile it after bulk updates that don't send signals.
+"""
+
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchRank
+from django.db.models import Count, F, Model, QuerySet, Window
+from django.db.models.functions import RowNumber
+
+from comicsdb.bulk import BATCH_SIZE
+from comicsdb.models import (
+    Arc,
+    Character,
+    Creator,
+    Imprint,
+    Issue,
+    Publisher,
+    SearchEntry,
+    Series,
+    Team,
+    Universe,
+)
+from comicsdb.search import prefix_query
+
+# Default & maximum number of results returned for each type.
+SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
+
+class Searchable(NamedTuple):
+    queryset: QuerySet
+    document: Callable[[Model], str]
+
+
+def join(*values) -> str:
+    return " ".join(str(value) for value in values if value)
+
+
+def issue_document(issue: Issue) -> str:
+    return join(issue.series.name, issue.number, issue.title, *(issue.name or []))
+
+
+# Searchable models, in the order the results are grouped in.
+SEARCH_MODELS: dict[type[Model], Searchable] = {
+    Publisher: Searchable(Publisher.objects.all(), lambda obj: obj.name),
+    Imprint: Searchable(Imprint.objects.all(), lambda obj: obj.name),
+    Series: Searchable(
+        Series.objects.select_related("series_type"),
+        lambda obj: join(obj.name, obj.year_began),
+    ),
+    Issue: Searchable(
+        Issue.objects.select_related("series", "series__series_type"), issue_document
+    ),
+    Creator: Searchable(Creator.objects.all(), lambda obj: join(obj.name, *(obj.alias or []))),
+    Character: Searchable(
+        Character.objects.all(), lambda obj: join(obj.name, *(obj.alias or []))
+    ),
+    Team: Searchable(Team.objects.all(), lambda obj: obj.name),
+    Arc: Searchable(Arc.objects.all(), lambda obj: obj.name),
+    Universe: Searchable(Universe.objects.all(), lambda obj: join(obj.name, obj.designation)),
+}
+SEARCH_TYPES = {model._meta.model_name: model for model in SEARCH_MODELS}
+
+
+def index_objects(model: type[Model], objects: Iterable[Model]) -> int:
+    """Create or update the entries of the objects of the model. Returns their number."""
+    content_type = ContentType.objects.get_for_model(model)
+    document = SEARCH_MODELS[model].document
+    entries = [
+        SearchEntry(
+            content_type=content_type,
+            object_id=obj.pk,
+            name=str(obj)[:255],
+            slug=obj.slug,
+            document=document(obj),
+        )
+        for obj in objects
+    ]
+    SearchEntry.objects.bulk_create(
+        entries,
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["name", "slug", "document"],
+    )
+    return len(entries)
+
+
+def update_entries(model: type[Model], pks) -> int:
+    """Reindex the given objects of the model, or all of them if no keys are given."""
+    objects = SEARCH_MODELS[model].queryset
+    if pks is not None:
+        objects = objects.filter(pk__in=pks)
+    count = 0
+    batch = []
+    for obj in objects.iterator(chunk_size=BATCH_SIZE):
+        batch.append(obj)
+        if len(batch) == BATCH_SIZE:
+            count += index_objects(model, batch)
+            batch = []
+    return count + index_objects(model, batch)
+
+
+def delete_orphan_entries(model: type[Model]) -> int:
+    """Delete the entries of the objects of the model that no longer exist."""
+    deleted, _ = (
+        SearchEntry.objects.filter(content_type=ContentType.objects.get_for_model(model))
+        .exclude(object_id__in=model.objects.values("pk"))
+        .delete()
+    )
+    return deleted
+
+
+def search_entries(value: str, types=None, limit: int = SEARCH_LIMIT) -> dict[str, dict]:
+    """
+    Search the entries of the given types (all of them by default), returning the number
+    of matches & the best ranked entries for each type with any, by type name.
+    """
+    query = prefix_query(value)
+    if query is None:
+        return {}
+    models = [SEARCH_TYPES[name] for name in types] if types else list(SEARCH_MODELS)
+    content_types = ContentType.objects.get_for_models(*models)
+    entries = SearchEntry.objects.filter(
+        search_vector=query, content_type__in=content_types.values()
+    )
+
+    counts = dict(entries.order_by().values_list("content_type").annotate(count=Count("*")))
+    rank = SearchRank(F("search_vector"), query)
+    ranked = (
+        entries.annotate(
+            row=Window(
+                RowNumber(),
+                partition_by=F("content_type"),
+                order_by=[rank.desc(), F("name").asc()],
+            )
+        )
+        .filter(row__lte=limit)
+        .order_by("content_type", "row")
+    )
+    results = {content_type.pk: [] for content_type in content_types.values()}
+    for entry in ranked:
+        results[entry.content_type_id].append(entry)
+
+    return {
+        model._meta.model_name: {
+            "count": counts[content_types[model].pk],
+            "results": results[content_types[model].pk],
+        }
+        for model in models
+        if counts.get(content_types[model].pk)
+    }
+
+
+# Signal receivers
+def post_save_search_entry(sender, instance, raw=False, **kwargs) -> None:
+    # Objects loaded from fixtures are indexed by the rebuild command.
+    if not raw:
+        index_objects(sender, [instance])
+
+
+def post_delete_search_entry(sender, instance, **kwargs) -> None:
+    SearchEntry.objects.filter(
+        content_type=ContentType.objects.get_for_model(sender), object_id=instance.pk
+    ).delete()
+
+
+def pre_save_series_search_entry(sender, instance: Series, **kwargs) -> None:
+    # The name of the issues is made from the series, so they're reindexed when it changes.
+    instance._reindex_issues = not instance._state.adding and any(
+        instance.has_changed(name) for name in ("name", "year_began", "series_type")
+    )
+
+
+def post_save_series_search_entry(sender, instance: Series, created, **kwargs) -> None:
+    if getattr(instance, "_reindex_issues", False):
+        update_entries(Issue, instance.issues.values("pk"))
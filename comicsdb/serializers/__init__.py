@@ -4,6 +4,7 @@ from comicsdb.serializers.publisher import (  # noqa: I001
     PublisherSerializer,
 )
 from comicsdb.serializers.arc import ArcListSerializer, ArcSerializer
+from comicsdb.serializers.change import ChangeSerializer
 from comicsdb.serializers.character import (
     CharacterListSerializer,
     CharacterReadSerializer,
@@ -18,15 +19,20 @@ from comicsdb.serializers.creator import (
 )
 from comicsdb.serializers.genre import GenreSerializer
 from comicsdb.serializers.issue import (
+    BarcodeIssueSerializer,
+    CoverSearchSerializer,
     IssueListSerializer,
     IssueListSeriesSerializer,
     IssueReadSerializer,
     IssueSerializer,
     IssueSeriesSerializer,
     ReprintSerializer,
+    SimilarIssueSerializer,
     VariantsIssueSerializer,
 )
+from comicsdb.serializers.lookup import BarcodeSerializer, LookupSerializer
 from comicsdb.serializers.rating import RatingSerializer
+from comicsdb.serializers.search import SearchEntrySerializer, SiteSearchSerializer
 from comicsdb.serializers.series import (
     AssociatedSeriesSerializer,
     SeriesListSerializer,
@@ -50,15 +56,19 @@ from comicsdb.serializers.imprint import (
 )
 
 __all__ = [
+    "BarcodeIssueSerializer",
+    "BarcodeSerializer",
     "BasicImprintSerializer",
     "BasicPublisherSerializer",
     "UniverseReadSerializer",
     "ArcListSerializer",
     "ArcSerializer",
+    "ChangeSerializer",
     "CharacterListSerializer",
     "CharacterSerializer",
     "CharacterReadSerializer",
     "CreatorListSerializer",
+    "CoverSearchSerializer",
     "CreatorSerializer",
     "RoleSerializer",
     "CreditSerializer",
@@ -73,12 +83,16 @@ __all__ = [
     "ReprintSerializer",
     "IssueSerializer",
     "IssueReadSerializer",
+    "LookupSerializer",
     "VariantsIssueSerializer",
     "PublisherListSerializer",
     "PublisherSerializer",
     "RatingSerializer",
+    "SearchEntrySerializer",
     "SeriesListSerializer",
     "SeriesTypeSerializer",
+    "SimilarIssueSerializer",
+    "SiteSearchSerializer",
     "AssociatedSeriesSerializer",
     "SeriesSerializer",
     "SeriesReadSerializer",
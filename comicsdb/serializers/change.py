@@ -0,0 +1,14 @@
+from rest_framework import serializers
+
+from comicsdb.models import Change
+
+
+class ChangeSerializer(serializers.ModelSerializer):
+    token = serializers.IntegerField(source="id", read_only=True)
+    entity_type = serializers.CharField(source="content_type.model", read_only=True)
+    id = serializers.IntegerField(source="object_id", read_only=True)
+    operation = serializers.CharField(source="get_operation_display", read_only=True)
+
+    class Meta:
+        model = Change
+        fields = ("token", "entity_type", "id", "operation", "modified")
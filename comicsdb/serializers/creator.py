@@ -1,6 +1,12 @@
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
+from rest_framework.validators import UniqueTogetherValidator
 
+from comicsdb.bulk import BATCH_SIZE, bulk_add_m2m
+from comicsdb.issue_edits import credits_written
 from comicsdb.models import Creator, Credits, Role
+from comicsdb.serializers.fields import CachedPrimaryKeyRelatedField, load_related_objects
 
 
 class CreatorListSerializer(serializers.ModelSerializer):
@@ -58,7 +64,69 @@ class RoleSerializer(serializers.ModelSerializer):
         fields = ("id", "name")
 
 
+class BulkCreditSerializer(serializers.ListSerializer):
+    """
+    List serializer used when adding many credits in one request. The issues, creators
+    & roles are looked up once for the whole batch, and the credits & their roles are
+    written with a bulk insert each inside one transaction. The credit of an issue &
+    creator that already exists, or that's repeated in the batch, is given the roles
+    of every item instead of failing the uniqueness check.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            return super().to_internal_value(data)
+
+        self._context["related_objects"] = load_related_objects(self.child, data)
+        # Duplicated credits are merged by `create()`.
+        self.child.validators = [
+            validator
+            for validator in self.child.validators
+            if not isinstance(validator, UniqueTogetherValidator)
+        ]
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        """
+        Create or update and return the `Credits` instances, given the validated data.
+        """
+        roles = {}
+        for attrs in validated_data:
+            key = (attrs["issue"], attrs["creator"])
+            roles.setdefault(key, set()).update(attrs.get("role") or [])
+        if not roles:
+            return []
+
+        with transaction.atomic():
+            existing = set(
+                Credits.objects.filter(
+                    issue__in={issue for issue, _ in roles},
+                    creator__in={creator for _, creator in roles},
+                ).values_list("issue_id", "creator_id")
+            )
+            credits_ = [Credits(issue=issue, creator=creator) for issue, creator in roles]
+            # The existing credits are only touched, which also sets their primary key.
+            Credits.objects.bulk_create(
+                credits_,
+                batch_size=BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["issue", "creator"],
+                update_fields=["modified"],
+            )
+            bulk_add_m2m(credits_, "role", list(roles.values()))
+
+            credits_written(
+                [c for c in credits_ if (c.issue_id, c.creator_id) not in existing],
+                [c for c in credits_ if (c.issue_id, c.creator_id) in existing],
+            )
+
+        prefetch_related_objects(credits_, "role")
+        return credits_
+
+
 class CreditSerializer(serializers.ModelSerializer):
+    serializer_related_field = CachedPrimaryKeyRelatedField
+
     def create(self, validated_data):
         """
         Create and return a new `Credits` instance, given the validated data.
@@ -82,6 +150,7 @@ class CreditSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Credits
+        list_serializer_class = BulkCreditSerializer
         fields = "__all__"
 
 
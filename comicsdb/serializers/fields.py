@@ -0,0 +1,50 @@
+from collections import defaultdict
+
+from rest_framework import serializers
+
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key related field that resolves its objects from the `related_objects` map
+    a bulk serializer puts in the context, instead of running a query for every value.
+    It falls back to the regular lookup when the map isn't available.
+    """
+
+    def to_internal_value(self, data):
+        related_objects = self.context.get("related_objects", {})
+        model = self.get_queryset().model
+        if model not in related_objects:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return related_objects[model][int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+def load_related_objects(serializer: serializers.Serializer, data) -> dict:
+    """
+    Build the `related_objects` map of the `CachedPrimaryKeyRelatedField`s of a serializer
+    for a batch of items, with one query by related model.
+    """
+    querysets = {}
+    ids = defaultdict(set)
+    for field in serializer.fields.values():
+        relation = getattr(field, "child_relation", field)
+        if field.read_only or not isinstance(relation, CachedPrimaryKeyRelatedField):
+            continue
+        model = relation.get_queryset().model
+        querysets.setdefault(model, relation.get_queryset())
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            values = item.get(field.field_name)
+            for value in values if isinstance(values, list) else [values]:
+                if isinstance(value, int | str) and str(value).isdigit():
+                    ids[model].add(int(value))
+
+    return {model: qs.in_bulk(ids[model]) for model, qs in querysets.items()}
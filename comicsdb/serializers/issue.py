@@ -1,9 +1,21 @@
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
+from rest_framework.validators import UniqueTogetherValidator
 
-from comicsdb.models import Issue, Series, Variant
+from comicsdb.bulk import BATCH_SIZE, bulk_add_m2m
+from comicsdb.cache import invalidate_representations
+from comicsdb.counters import ISSUE_RELATIONS, update_counts, update_issue_relation_counts
+from comicsdb.cover_hash import MAX_DISTANCE, hash_image
+from comicsdb.models import Change, Identifier, Issue, Series, Variant
+from comicsdb.models.common import allocate_slugs
+from comicsdb.models.issue import issue_slug_base
+from comicsdb.rollups import add_counts
+from comicsdb.search_index import index_objects
 from comicsdb.serializers import CreditReadSerializer
 from comicsdb.serializers.arc import ArcListSerializer
 from comicsdb.serializers.character import CharacterListSerializer
+from comicsdb.serializers.fields import CachedPrimaryKeyRelatedField, load_related_objects
 from comicsdb.serializers.genre import GenreSerializer
 from comicsdb.serializers.imprint import BasicImprintSerializer
 from comicsdb.serializers.publisher import BasicPublisherSerializer
@@ -11,6 +23,7 @@ from comicsdb.serializers.rating import RatingSerializer
 from comicsdb.serializers.series import SeriesTypeSerializer
 from comicsdb.serializers.team import TeamListSerializer
 from comicsdb.serializers.universe import UniverseListSerializer
+from comicsdb.signals import invalidate_detail_dependents
 
 
 class VariantsIssueSerializer(serializers.ModelSerializer):
@@ -53,6 +66,37 @@ class IssueListSerializer(serializers.ModelSerializer):
         )
 
 
+class SimilarIssueSerializer(IssueListSerializer):
+    distance = serializers.IntegerField(read_only=True)
+
+    class Meta(IssueListSerializer.Meta):
+        fields = (*IssueListSerializer.Meta.fields, "distance")
+
+
+class BarcodeIssueSerializer(IssueListSerializer):
+    variant = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta(IssueListSerializer.Meta):
+        fields = (*IssueListSerializer.Meta.fields, "variant")
+
+
+class CoverSearchSerializer(serializers.Serializer):
+    cover_hash = serializers.RegexField(r"^[0-9a-fA-F]{16}$", required=False)
+    image = serializers.ImageField(required=False)
+    max_distance = serializers.IntegerField(min_value=0, max_value=MAX_DISTANCE, default=8)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+    def validate(self, attrs):
+        if image := attrs.pop("image", None):
+            try:
+                attrs["cover_hash"] = hash_image(image)
+            except OSError as e:
+                raise serializers.ValidationError({"image": str(e)}) from e
+        elif "cover_hash" not in attrs:
+            raise serializers.ValidationError("Either a cover_hash or an image is required.")
+        return attrs
+
+
 class ReprintSerializer(serializers.ModelSerializer):
     issue = serializers.CharField(source="__str__")
 
@@ -61,9 +105,123 @@ class ReprintSerializer(serializers.ModelSerializer):
         fields = ("id", "issue")
 
 
+class BulkIssueSerializer(serializers.ListSerializer):
+    """
+    List serializer used when creating many issues in one request. Related objects are
+    looked up once for the whole batch, the series / number uniqueness is checked with a
+    single query, and the issues & their many-to-many relations are written with bulk
+    inserts inside one transaction. Errors are reported per item, in the order given.
+    """
+
+    m2m_fields = ("arcs", "characters", "teams", "universes", "reprints")
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            return super().to_internal_value(data)
+
+        self._context["related_objects"] = load_related_objects(self.child, data)
+        # The uniqueness is checked for the whole batch below.
+        self.child.validators = [
+            validator
+            for validator in self.child.validators
+            if not isinstance(validator, UniqueTogetherValidator)
+        ]
+        duplicates = self.find_duplicates(data)
+
+        try:
+            validated_data = super().to_internal_value(data)
+            errors = [{} for _ in data]
+        except serializers.ValidationError as exc:
+            if not isinstance(exc.detail, list):
+                raise
+            validated_data = None
+            errors = exc.detail
+
+        for idx in duplicates:
+            errors[idx] = {
+                **errors[idx],
+                "non_field_errors": [
+                    UniqueTogetherValidator.message.format(field_names="series, number")
+                ],
+            }
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return validated_data
+
+    def find_duplicates(self, data) -> set[int]:
+        keys = {}
+        for idx, item in enumerate(data):
+            if not isinstance(item, dict):
+                continue
+            series, number = item.get("series"), item.get("number")
+            if isinstance(series, int | str) and str(series).isdigit() and number:
+                keys[idx] = (int(series), str(number))
+        if not keys:
+            return set()
+
+        existing = set(
+            Issue.objects.filter(
+                series_id__in={series for series, _ in keys.values()},
+                number__in={number for _, number in keys.values()},
+            ).values_list("series_id", "number")
+        )
+        duplicates = set()
+        seen = {}
+        for idx, key in keys.items():
+            if key in existing:
+                duplicates.add(idx)
+            if key in seen:
+                duplicates.update((idx, seen[key]))
+            seen.setdefault(key, idx)
+        return duplicates
+
+    def create(self, validated_data):
+        """
+        Create and return the new `Issue` instances, given the validated data.
+        """
+        related = {name: [] for name in self.m2m_fields}
+        issues: list[Issue] = []
+        for attrs in validated_data:
+            for name in self.m2m_fields:
+                related[name].append(attrs.pop(name, None) or [])
+            issues.append(Issue(**attrs))
+        # The pre_save signal isn't sent by bulk_create, so the slugs are set here, making
+        # sure they're also unique within the batch.
+        slugs = allocate_slugs(Issue, [issue_slug_base(issue) for issue in issues])
+        for issue, slug in zip(issues, slugs, strict=True):
+            issue.slug = slug
+
+        with transaction.atomic():
+            Issue.objects.bulk_create(issues, batch_size=BATCH_SIZE)
+            for name in self.m2m_fields:
+                bulk_add_m2m(issues, name, related[name])
+            # bulk_create doesn't send the signals that log & index new issues, update
+            # counters and invalidate the detail pages showing them.
+            Change.objects.log(Issue, [issue.pk for issue in issues], Change.Operation.CREATE)
+            index_objects(Issue, issues)
+            Identifier.objects.index(issues)
+            add_counts(Issue, issues)
+            update_counts(Series, {issue.series_id for issue in issues})
+            update_issue_relation_counts(
+                {
+                    name: {obj.pk for objs in related[name] for obj in objs}
+                    for name in ISSUE_RELATIONS
+                }
+            )
+            invalidate_detail_dependents(Issue, {issue.pk for issue in issues})
+            # Reprints are symmetrical, so the reprinted issues now list the new ones too.
+            invalidate_representations(
+                "issue", {obj.pk for objs in related["reprints"] for obj in objs}
+            )
+
+        prefetch_related_objects(issues, *self.m2m_fields)
+        return issues
+
+
 # TODO: Refactor this so reuse Issue serializer for read-only also.
 #       Need to handle variants & credits sets.
 class IssueSerializer(serializers.ModelSerializer):
+    serializer_related_field = CachedPrimaryKeyRelatedField
     resource_url = serializers.SerializerMethodField("get_resource_url")
 
     def get_resource_url(self, obj: Issue) -> str:
@@ -127,6 +285,7 @@ class IssueSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Issue
+        list_serializer_class = BulkIssueSerializer
         fields = (
             "id",
             "series",
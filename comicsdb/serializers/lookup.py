@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from comicsdb.identifiers import IDENTIFIER_KEYS, IDENTIFIERS, barcode_keys
+
+LOOKUP_LIMIT = 500
+
+
+class LookupSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=[*IDENTIFIERS, *IDENTIFIER_KEYS])
+    values = serializers.ListField(
+        child=serializers.CharField(max_length=32),
+        allow_empty=False,
+        max_length=LOOKUP_LIMIT,
+    )
+
+    def __init__(self, *args, kinds=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if kinds is not None:
+            self.fields["kind"].choices = kinds
+
+
+class BarcodeSerializer(serializers.Serializer):
+    code = serializers.CharField(max_length=32)
+
+    def validate_code(self, value):
+        if not (keys := barcode_keys(value)):
+            raise serializers.ValidationError("Not a valid UPC or ISBN.")
+        return keys
@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+from comicsdb.models import SearchEntry
+from comicsdb.search_index import MAX_SEARCH_LIMIT, SEARCH_LIMIT, SEARCH_TYPES
+
+
+class SiteSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255)
+    type = serializers.MultipleChoiceField(choices=list(SEARCH_TYPES), required=False)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=MAX_SEARCH_LIMIT, default=SEARCH_LIMIT
+    )
+
+
+class SearchEntrySerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="object_id")
+    resource_url = serializers.SerializerMethodField("get_resource_url")
+
+    def get_resource_url(self, obj: SearchEntry) -> str:
+        return self.context["request"].build_absolute_uri(obj.get_absolute_url())
+
+    class Meta:
+        model = SearchEntry
+        fields = ("id", "name", "resource_url")
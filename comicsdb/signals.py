@@ -2,6 +2,12 @@ import logging
 
 from sorl.thumbnail import delete
 
+from comicsdb.cache import (
+    invalidate_all_representations,
+    invalidate_detail_pages,
+    invalidate_representations,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -12,3 +18,170 @@ def pre_delete_image(sender, instance, **kwargs):
 
 def pre_delete_credit(sender, instance, **kwargs):
     LOGGER.info("Deleting %s credit for %s", instance.creator, instance.issue)
+
+
+# Receivers invalidating the cached API representations of issues.
+def issue_cache(sender, instance, **kwargs):
+    # The reprints of an issue embed its name.
+    ids = [instance.pk, *instance.reprints.values_list("id", flat=True)]
+    invalidate_representations("issue", ids)
+
+
+def issue_child_cache(sender, instance, **kwargs):
+    invalidate_representations("issue", [instance.issue_id])
+
+
+def issue_related_cache(sender, instance, **kwargs):
+    invalidate_representations("issue", instance.issues.values_list("id", flat=True))
+
+
+def reference_cache(sender, **kwargs):
+    if kwargs.get("action", "post_").startswith("post_"):
+        invalidate_all_representations()
+
+
+def linked_pks(sender, instance, model, reverse) -> set:
+    """Keys of the `model` objects linked to `instance` by the many-to-many table `sender`."""
+    owner = model if reverse else type(instance)
+    field = next(f for f in owner._meta.many_to_many if f.remote_field.through is sender)
+    column, linked = field.m2m_field_name(), field.m2m_reverse_field_name()
+    if reverse:
+        column, linked = linked, column
+    return set(sender.objects.filter(**{column: instance.pk}).values_list(linked, flat=True))
+
+
+def m2m_changed_issue_cache(sender, instance, action, **kwargs):
+    if action == "pre_clear":
+        # The cleared keys aren't sent with post_clear, so they are read before.
+        if kwargs["reverse"] or kwargs["model"] is type(instance):
+            instance._cleared_issue_pks = linked_pks(
+                sender, instance, kwargs["model"], kwargs["reverse"]
+            )
+        return
+    if not action.startswith("post_"):
+        return
+    if action == "post_clear":
+        ids = instance.__dict__.pop("_cleared_issue_pks", set())
+    else:
+        ids = set(kwargs["pk_set"] or [])
+    if not kwargs["reverse"]:
+        if kwargs["model"] is not type(instance):
+            ids.clear()
+        ids.add(instance.pk)
+    invalidate_representations("issue", ids)
+
+
+def m2m_changed_credit_cache(sender, instance, action, **kwargs):
+    if action == "pre_clear":
+        if kwargs["reverse"]:
+            credits_ = linked_pks(sender, instance, kwargs["model"], reverse=True)
+            instance._cleared_issue_pks = set(
+                kwargs["model"]
+                .objects.filter(pk__in=credits_)
+                .values_list("issue_id", flat=True)
+            )
+        return
+    if not action.startswith("post_"):
+        return
+    if kwargs["reverse"]:
+        if action == "post_clear":
+            ids = instance.__dict__.pop("_cleared_issue_pks", set())
+        else:
+            credits_ = kwargs["model"].objects.filter(pk__in=kwargs["pk_set"] or [])
+            ids = credits_.values_list("issue_id", flat=True)
+        invalidate_representations("issue", ids)
+    else:
+        invalidate_representations("issue", [instance.issue_id])
+
+
+# Receivers invalidating the cached fragments of the detail pages.
+DETAIL_PAGES = {
+    "arc",
+    "character",
+    "creator",
+    "imprint",
+    "issue",
+    "publisher",
+    "series",
+    "team",
+    "universe",
+}
+# Model name -> (model name, lookup from the model) of the other detail pages showing
+# its objects. The issue pages are also keyed on the version of their series, for the
+# navigation between its issues, and every page on the generation of the reference tables.
+DETAIL_DEPENDENTS = {
+    "arc": [("issue", "issues")],
+    "character": [
+        ("issue", "issues"),
+        ("series", "issues__series"),
+        ("team", "teams"),
+        ("universe", "universes"),
+    ],
+    "creator": [
+        ("issue", "issues"),
+        ("series", "issues__series"),
+        ("character", "characters"),
+        ("team", "teams"),
+    ],
+    "credits": [("issue", "issue"), ("creator", "creator"), ("series", "issue__series")],
+    "issue": [
+        ("issue", "reprints"),
+        ("series", "series"),
+        ("arc", "arcs"),
+        ("character", "characters"),
+        ("creator", "creators"),
+        ("team", "teams"),
+        ("universe", "universes"),
+    ],
+    "imprint": [("publisher", "publisher")],
+    "series": [
+        ("publisher", "publisher"),
+        ("imprint", "imprint"),
+        ("character", "issues__characters"),
+        ("creator", "issues__creators"),
+        ("universe", "issues__universes"),
+    ],
+    "team": [("issue", "issues"), ("character", "characters"), ("universe", "universes")],
+    "universe": [
+        ("publisher", "publisher"),
+        ("issue", "issues"),
+        ("character", "characters"),
+        ("team", "teams"),
+    ],
+    "variant": [("issue", "issue")],
+}
+
+
+def invalidate_detail_dependents(model, pks) -> None:
+    """Invalidate the detail pages of the objects, and the other pages showing them."""
+    pks = list(pks)
+    if not pks:
+        return
+    model_name = model._meta.model_name
+    if model_name in DETAIL_PAGES:
+        invalidate_detail_pages(model_name, pks)
+    for page, lookup in DETAIL_DEPENDENTS.get(model_name, ()):
+        invalidate_detail_pages(
+            page,
+            model.objects.filter(pk__in=pks)
+            .order_by()
+            .values_list(lookup, flat=True)
+            .distinct(),
+        )
+
+
+def detail_page_cache(sender, instance, **kwargs):
+    invalidate_detail_dependents(sender, [instance.pk])
+    # An object moved to another parent is also gone from the page of the previous one.
+    tracked = () if kwargs.get("created") else getattr(instance, "tracked_fields", ())
+    for page, lookup in DETAIL_DEPENDENTS.get(sender._meta.model_name, ()):
+        if lookup in tracked and instance.has_changed(lookup):
+            invalidate_detail_pages(page, [instance.previous(lookup)])
+
+
+def m2m_changed_detail_page_cache(sender, instance, action, **kwargs):
+    # The related objects are looked up before a clear, which doesn't give their keys.
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    invalidate_detail_dependents(type(instance), [instance.pk])
+    invalidate_detail_dependents(kwargs["model"], kwargs["pk_set"] or [])
@@ -0,0 +1,71 @@
+"""
+Pre-generation of the thumbnails shown by the templates, so the first visitor after an
+image is uploaded doesn't pay for downloading, resizing & uploading it again.
+
+`THUMBNAILS` lists the `{% thumbnail %}` geometries & options the templates use for the
+images of each model, which have to be kept in sync with them. They're generated in the
+background once an image is saved, from the receivers connected in `ComicsdbConfig.ready()`,
+and for every image by the `warm_thumbnails` command. Thumbnails that already exist are
+found in sorl's key-value store, so warming them again is cheap.
+"""
+
+import logging
+
+from django.db.models import Model
+from sorl.thumbnail import get_thumbnail
+
+from comicsdb.background import run_after_commit
+from comicsdb.models import (
+    Arc,
+    Character,
+    Creator,
+    Imprint,
+    Issue,
+    Publisher,
+    Team,
+    Universe,
+    Variant,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+THUMBNAIL_FORMAT = "WEBP"
+
+# Geometry & crop of the thumbnails of the lists & detail pages.
+COVER = ("320x480", "center")
+COVER_TOP = ("320x480", "top")
+LARGE_COVER = ("640x960", "center")
+PORTRAIT = ("256x256", "top")
+ICON = ("64x64", "center")
+ICON_TOP = ("64x64", "top")
+
+THUMBNAILS: dict[type[Model], list[tuple[str, str]]] = {
+    Arc: [COVER],
+    Character: [COVER_TOP, ICON, ICON_TOP],
+    Creator: [PORTRAIT, ICON_TOP],
+    Imprint: [COVER, ICON_TOP],
+    Issue: [COVER, LARGE_COVER],
+    Publisher: [COVER],
+    Team: [COVER, ICON],
+    Universe: [COVER, COVER_TOP, ICON, ICON_TOP],
+    Variant: [COVER],
+}
+
+
+def generate_thumbnails(model: type[Model], image) -> int:
+    """Generate the missing thumbnails of an image of the model. Returns their number."""
+    count = 0
+    for geometry, crop in THUMBNAILS[model]:
+        try:
+            get_thumbnail(image, geometry, crop=crop, format=THUMBNAIL_FORMAT)
+        except Exception:
+            LOGGER.exception("Failed to generate the %s thumbnail of %s", geometry, image)
+        else:
+            count += 1
+    return count
+
+
+# Signal receivers
+def post_save_thumbnails(sender, instance, raw=False, **kwargs) -> None:
+    if instance.image and not raw:
+        run_after_commit(generate_thumbnails, sender, instance.image)
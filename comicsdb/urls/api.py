@@ -3,13 +3,16 @@ from rest_framework import routers
 
 from comicsdb.views.viewsets import (
     ArcViewSet,
+    ChangeViewSet,
     CharacterViewSet,
     CreatorViewSet,
     CreditViewset,
+    ExportViewSet,
     ImprintViewSet,
     IssueViewSet,
     PublisherViewSet,
     RoleViewset,
+    SearchViewSet,
     SeriesTypeViewSet,
     SeriesViewSet,
     TeamViewSet,
@@ -19,13 +22,16 @@ from comicsdb.views.viewsets import (
 
 ROUTER = routers.DefaultRouter()
 ROUTER.register("arc", ArcViewSet)
+ROUTER.register("changes", ChangeViewSet)
 ROUTER.register("character", CharacterViewSet)
 ROUTER.register("creator", CreatorViewSet)
 ROUTER.register("credit", CreditViewset)
+ROUTER.register("export", ExportViewSet, basename="export")
 ROUTER.register("imprint", ImprintViewSet)
 ROUTER.register("issue", IssueViewSet)
 ROUTER.register("publisher", PublisherViewSet)
 ROUTER.register("role", RoleViewset)
+ROUTER.register("search", SearchViewSet, basename="search")
 ROUTER.register("series", SeriesViewSet)
 ROUTER.register("series_type", SeriesTypeViewSet)
 ROUTER.register("team", TeamViewSet)
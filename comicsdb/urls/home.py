@@ -1,10 +1,12 @@
 from django.urls import path
 
 from comicsdb.views.home import HomePageView
+from comicsdb.views.search import SearchView
 from comicsdb.views.statistics import statistics
 
 app_name = ""
 urlpatterns = [
     path("", HomePageView.as_view(), name="home"),
+    path("search/", SearchView.as_view(), name="search"),
     path("statistics/", statistics, name="statistics"),
 ]
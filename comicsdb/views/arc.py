@@ -1,13 +1,12 @@
 import logging
-import operator
-from functools import reduce
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Prefetch, Q
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -16,6 +15,8 @@ from comicsdb.forms.attribution import AttributionFormSet
 from comicsdb.models.arc import Arc
 from comicsdb.models.attribution import Attribution
 from comicsdb.models.issue import Issue
+from comicsdb.search import search
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -24,7 +25,6 @@ LOGGER = logging.getLogger(__name__)
 class ArcList(ListView):
     model = Arc
     paginate_by = PAGINATE
-    queryset = Arc.objects.prefetch_related("issues")
 
 
 class ArcIssueList(ListView):
@@ -41,20 +41,20 @@ class ArcIssueList(ListView):
         return context
 
 
-class ArcDetail(DetailView):
+class ArcDetail(CachedDetailMixin, DetailView):
     model = Arc
-    queryset = Arc.objects.select_related("edited_by").prefetch_related(
+    queryset = Arc.objects.select_related("edited_by")
+    detail_prefetch = (
         Prefetch(
             "issues",
             queryset=Issue.objects.order_by(
                 "cover_date", "store_date", "series__sort_name", "number"
             ).select_related("series", "series__series_type"),
-        )
+        ),
     )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        arc = self.get_object()
+    def get_navigation(self):
+        arc = self.object
         try:
             next_arc = Arc.objects.order_by("name").filter(name__gt=arc.name).first()
         except ObjectDoesNotExist:
@@ -65,7 +65,11 @@ class ArcDetail(DetailView):
         except ObjectDoesNotExist:
             previous_arc = None
 
-        context["navigation"] = {"next_arc": next_arc, "previous_arc": previous_arc}
+        return {"next_arc": next_arc, "previous_arc": previous_arc}
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
@@ -73,10 +77,7 @@ class SearchArcList(ArcList):
     def get_queryset(self):
         result = super().get_queryset()
         if query := self.request.GET.get("q"):
-            query_list = query.split()
-            result = result.filter(
-                reduce(operator.and_, (Q(name__icontains=q) for q in query_list))
-            )
+            result = search(result, query, rank=True)
 
         return result
 
@@ -1,13 +1,12 @@
 import logging
-import operator
-from functools import reduce
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, Prefetch
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -15,6 +14,8 @@ from comicsdb.forms.attribution import AttributionFormSet
 from comicsdb.forms.character import CharacterForm
 from comicsdb.models import Character, Issue, Series
 from comicsdb.models.attribution import Attribution
+from comicsdb.search import search
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -36,7 +37,6 @@ class CharacterSeriesList(ListView):
 class CharacterList(ListView):
     model = Character
     paginate_by = PAGINATE
-    queryset = Character.objects.prefetch_related("issues")
 
 
 class CharacterIssueList(ListView):
@@ -53,20 +53,20 @@ class CharacterIssueList(ListView):
         return context
 
 
-class CharacterDetail(DetailView):
+class CharacterDetail(CachedDetailMixin, DetailView):
     model = Character
-    queryset = Character.objects.select_related("edited_by").prefetch_related(
+    queryset = Character.objects.select_related("edited_by")
+    detail_prefetch = (
         Prefetch(
             "issues",
             queryset=Issue.objects.order_by(
                 "series__sort_name", "cover_date", "number"
             ).select_related("series", "series__series_type"),
-        )
+        ),
     )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        character = self.get_object()
+    def get_navigation(self):
+        character = self.object
         qs = Character.objects.order_by("name")
         try:
             next_character = qs.filter(name__gt=character.name).first()
@@ -78,6 +78,14 @@ class CharacterDetail(DetailView):
         except ObjectDoesNotExist:
             previous_character = None
 
+        return {
+            "next_character": next_character,
+            "previous_character": previous_character,
+        }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        character = self.object
         # TODO: Look into improving this queryset
         #
         # Run this context queryset if the issue count is greater than 0.
@@ -97,10 +105,7 @@ class CharacterDetail(DetailView):
         else:
             context["appearances"] = ""
 
-        context["navigation"] = {
-            "next_character": next_character,
-            "previous_character": previous_character,
-        }
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
@@ -108,17 +113,7 @@ class SearchCharacterList(CharacterList):
     def get_queryset(self):
         result = super().get_queryset()
         if query := self.request.GET.get("q"):
-            query_list = query.split()
-            result = result.filter(
-                reduce(
-                    operator.and_,
-                    # Unaccent lookup won't work on alias array field.
-                    (
-                        Q(name__unaccent__icontains=q) | Q(alias__icontains=q)
-                        for q in query_list
-                    ),
-                )
-            )
+            result = search(result, query, rank=True)
 
         return result
 
@@ -1,13 +1,12 @@
 import logging
-import operator
-from functools import reduce
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -15,6 +14,8 @@ from comicsdb.forms.attribution import AttributionFormSet
 from comicsdb.forms.creator import CreatorForm
 from comicsdb.models import Creator, Credits, Issue, Series
 from comicsdb.models.attribution import Attribution
+from comicsdb.search import search
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -49,16 +50,14 @@ class CreatorIssueList(ListView):
 class CreatorList(ListView):
     model = Creator
     paginate_by = PAGINATE
-    queryset = Creator.objects.prefetch_related("credits_set")
 
 
-class CreatorDetail(DetailView):
+class CreatorDetail(CachedDetailMixin, DetailView):
     model = Creator
     queryset = Creator.objects.select_related("edited_by")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        creator = self.get_object()
+    def get_navigation(self):
+        creator = self.object
         qs = Creator.objects.order_by("name")
         try:
             next_creator = qs.filter(name__gt=creator.name).first()
@@ -70,13 +69,15 @@ class CreatorDetail(DetailView):
         except ObjectDoesNotExist:
             previous_creator = None
 
-        context["navigation"] = {
+        return {
             "next_creator": next_creator,
             "previous_creator": previous_creator,
         }
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
         series_issues = (
-            Credits.objects.filter(creator=creator)
+            Credits.objects.filter(creator=self.object)
             .values(
                 "issue__series__name",
                 "issue__series__year_began",
@@ -87,7 +88,7 @@ class CreatorDetail(DetailView):
             .order_by("issue__series__sort_name", "issue__series__year_began")
         )
         context["credits"] = series_issues
-
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
@@ -95,17 +96,7 @@ class SearchCreatorList(CreatorList):
     def get_queryset(self):
         result = super().get_queryset()
         if query := self.request.GET.get("q"):
-            query_list = query.split()
-            result = result.filter(
-                reduce(
-                    operator.and_,
-                    (
-                        # Unaccent lookup won't work on alias array field.
-                        Q(name__unaccent__icontains=q) | Q(alias__icontains=q)
-                        for q in query_list
-                    ),
-                )
-            )
+            result = search(result, query, rank=True)
 
         return result
 
@@ -8,11 +8,13 @@ from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import CreateView, DeleteView, DetailView, ListView, UpdateView
 
 from comicsdb.forms.attribution import AttributionFormSet
 from comicsdb.forms.imprint import ImprintForm
 from comicsdb.models import Attribution, Imprint, Series
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -21,7 +23,6 @@ LOGGER = logging.getLogger(__name__)
 class ImprintList(ListView):
     model = Imprint
     paginate_by = PAGINATE
-    queryset = Imprint.objects.prefetch_related("series")
 
 
 class ImprintSeriesList(ListView):
@@ -34,11 +35,7 @@ class ImprintSeriesList(ListView):
 
     def get_queryset(self):
         self.imprint = get_object_or_404(Imprint, slug=self.kwargs["slug"])
-        return (
-            Series.objects.select_related("series_type")
-            .filter(imprint=self.imprint)
-            .prefetch_related("issues")
-        )
+        return Series.objects.select_related("series_type").filter(imprint=self.imprint)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -46,13 +43,13 @@ class ImprintSeriesList(ListView):
         return context
 
 
-class ImprintDetail(DetailView):
+class ImprintDetail(CachedDetailMixin, DetailView):
     model = Imprint
-    queryset = Imprint.objects.select_related("edited_by").prefetch_related("series")
+    queryset = Imprint.objects.select_related("edited_by")
+    detail_prefetch = ("series",)
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        imprint = self.get_object()
+    def get_navigation(self):
+        imprint = self.object
         try:
             next_imprint = (
                 Imprint.objects.order_by("name").filter(name__gt=imprint.name).first()
@@ -67,10 +64,14 @@ class ImprintDetail(DetailView):
         except ObjectDoesNotExist:
             previous_imprint = None
 
-        context["navigation"] = {
+        return {
             "next_imprint": next_imprint,
             "previous_imprint": previous_imprint,
         }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
@@ -6,18 +6,21 @@ from dal import autocomplete
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Prefetch, Q
+from django.db.models import Prefetch
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
+from comicsdb.autocomplete import autocomplete_queryset
 from comicsdb.filters.issue import IssueViewFilter
 from comicsdb.forms.credits import CreditsFormSet
 from comicsdb.forms.issue import IssueForm
 from comicsdb.forms.variant import VariantFormset
 from comicsdb.models import Creator, Credits, Issue, Role, Series
-from comicsdb.models.series import SeriesType
 from comicsdb.models.variant import Variant
+from comicsdb.reference import series_types
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 TOTAL_WEEKS_YEAR = 52
@@ -33,7 +36,7 @@ class SeriesAutocomplete(autocomplete.Select2QuerySetView):
         qs = Series.objects.all()
 
         if self.q:
-            qs = qs.filter(name__icontains=self.q)
+            qs = autocomplete_queryset(qs, "series", ["name__search_contains"], self.q)
 
         return qs
 
@@ -46,9 +49,8 @@ class CreatorAutocomplete(autocomplete.Select2QuerySetView):
         qs = Creator.objects.all()
 
         if self.q:
-            qs = qs.filter(
-                # Unaccent lookup won't work on alias array field.
-                Q(name__unaccent__icontains=self.q) | Q(alias__icontains=self.q)
+            qs = autocomplete_queryset(
+                qs, "creator", ["name__search_contains", "alias__search_contains"], self.q
             )
 
         return qs
@@ -62,87 +64,87 @@ class IssueList(ListView):
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context["series_type"] = SeriesType.objects.values("id", "name")
+        context["series_type"] = series_types()
         return context
 
 
-class IssueDetail(DetailView):
+class IssueDetail(CachedDetailMixin, DetailView):
     model = Issue
-    queryset = (
-        Issue.objects.select_related(
-            "series", "series__publisher", "series__series_type", "rating"
-        )
-        .defer(
-            "created_on",
-            "cover_hash",
-            "series__desc",
-            "series__modified",
-            "series__created_on",
-            "series__publisher__desc",
-            "series__publisher__modified",
-            "series__publisher__image",
-            "series__publisher__founded",
-            "series__publisher__created_on",
-            "series__series_type__notes",
-            "series__series_type__modified",
-            "rating__description",
-        )
-        .prefetch_related(
-            Prefetch(
-                "credits_set",
-                queryset=Credits.objects.select_related("creator")
-                .defer(
-                    "modified",
-                    "creator__desc",
-                    "creator__cv_id",
-                    "creator__modified",
-                    "creator__created_on",
-                    "creator__birth",
-                    "creator__death",
-                    "creator__alias",
-                )
-                .order_by("creator__name")
-                .distinct("creator__name")
-                .prefetch_related(
-                    Prefetch("role", queryset=Role.objects.defer("order", "notes", "modified"))
-                ),
-            ),
-            Prefetch(
-                "reprints",
-                queryset=Issue.objects.select_related("series", "series__series_type")
-                .defer(
-                    "title",
-                    "desc",
-                    "modified",
-                    "name",
-                    "price",
-                    "rating",
-                    "store_date",
-                    "sku",
-                    "isbn",
-                    "upc",
-                    "page",
-                    "image",
-                    "cover_hash",
-                    "cv_id",
-                    "created_by_id",
-                    "edited_by_id",
-                    "series__desc",
-                    "series__cv_id",
-                    "series__modified",
-                    "series__created_on",
-                    "series__year_end",
-                    "series__series_type__notes",
-                    "series__series_type__modified",
-                )
-                .order_by("cover_date", "store_date"),
+    queryset = Issue.objects.select_related(
+        "series", "series__publisher", "series__series_type", "rating"
+    ).defer(
+        "created_on",
+        "cover_hash",
+        "series__desc",
+        "series__modified",
+        "series__created_on",
+        "series__publisher__desc",
+        "series__publisher__modified",
+        "series__publisher__image",
+        "series__publisher__founded",
+        "series__publisher__created_on",
+        "series__series_type__notes",
+        "series__series_type__modified",
+        "rating__description",
+    )
+    detail_prefetch = (
+        Prefetch(
+            "credits_set",
+            queryset=Credits.objects.select_related("creator")
+            .defer(
+                "modified",
+                "creator__desc",
+                "creator__cv_id",
+                "creator__modified",
+                "creator__created_on",
+                "creator__birth",
+                "creator__death",
+                "creator__alias",
+            )
+            .order_by("creator__name")
+            .distinct("creator__name")
+            .prefetch_related(
+                Prefetch("role", queryset=Role.objects.defer("order", "notes", "modified"))
             ),
-        )
+        ),
+        Prefetch(
+            "reprints",
+            queryset=Issue.objects.select_related("series", "series__series_type")
+            .defer(
+                "title",
+                "desc",
+                "modified",
+                "name",
+                "price",
+                "rating",
+                "store_date",
+                "sku",
+                "isbn",
+                "upc",
+                "page",
+                "image",
+                "cover_hash",
+                "cv_id",
+                "created_by_id",
+                "edited_by_id",
+                "series__desc",
+                "series__cv_id",
+                "series__modified",
+                "series__created_on",
+                "series__year_end",
+                "series__series_type__notes",
+                "series__series_type__modified",
+            )
+            .order_by("cover_date", "store_date"),
+        ),
     )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        issue = self.get_object()
+    def get_fragment_dependencies(self, obj):
+        # The navigation between the issues of the series.
+        return [("series", obj.series_id)]
+
+    def get_navigation(self):
+        issue = self.object
         try:
             next_issue = issue.get_next_by_cover_date(series=issue.series)
         except ObjectDoesNotExist:
@@ -153,10 +155,14 @@ class IssueDetail(DetailView):
         except ObjectDoesNotExist:
             previous_issue = None
 
-        context["navigation"] = {
+        return {
             "next_issue": next_issue,
             "previous_issue": previous_issue,
         }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
@@ -293,7 +299,7 @@ class WeekList(ListView):
         context = super().get_context_data(**kwargs)
         context["release_day"] = release_day
         context["future"] = False
-        context["series_type"] = SeriesType.objects.values("id", "name")
+        context["series_type"] = series_types()
         return context
 
 
@@ -321,7 +327,7 @@ class NextWeekList(ListView):
         context = super().get_context_data(**kwargs)
         context["release_day"] = release_day
         context["future"] = False
-        context["series_type"] = SeriesType.objects.values("id", "name")
+        context["series_type"] = series_types()
         return context
 
 
@@ -350,5 +356,5 @@ class FutureList(ListView):
         context = super().get_context_data(**kwargs)
         context["release_day"] = release_day
         context["future"] = True
-        context["series_type"] = SeriesType.objects.values("id", "name")
+        context["series_type"] = series_types()
         return context
@@ -0,0 +1,406 @@
+import hashlib
+import json
+from collections import defaultdict
+from datetime import datetime
+
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import (
+    Count,
+    ForeignObjectRel,
+    Max,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    prefetch_related_objects,
+)
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+
+from comicsdb.cache import (
+    DETAIL_CACHE_TTL,
+    detail_fragment_key,
+    get_cached_representation,
+    set_cached_representation,
+)
+from comicsdb.identifiers import IDENTIFIER_KEYS, IDENTIFIERS
+from comicsdb.models import Identifier
+from comicsdb.serializers import LookupSerializer
+
+
+def embedded_links(model, name: str, owners) -> tuple[QuerySet, str] | None:
+    """
+    Rows linking the `owners` queryset of `model` to the objects of its relation with the
+    field or accessor `name`, and the field of these rows pointing to the objects ("pk"
+    when the rows are the objects), or None if `name` isn't a relation.
+    """
+    for field in model._meta.get_fields():
+        reverse = isinstance(field, ForeignObjectRel)
+        if (
+            field.is_relation
+            and (field.get_accessor_name() if reverse else field.name) == name
+        ):
+            break
+    else:
+        return None
+    related = field.related_model
+    if related is None:
+        return None
+    if field.many_to_many:
+        m2m = field.remote_field if reverse else field
+        source, target = m2m.m2m_field_name(), m2m.m2m_reverse_field_name()
+        if reverse:
+            source, target = target, source
+        through = m2m.remote_field.through
+        return through._base_manager.filter(**{f"{source}__in": owners.values("pk")}), target
+    if reverse:
+        return related._base_manager.filter(
+            **{f"{field.field.name}__in": owners.values("pk")}
+        ), "pk"
+    return related._base_manager.filter(pk__in=owners.values(field.attname)), "pk"
+
+
+def aggregate_subquery(queryset: QuerySet, expression) -> Subquery:
+    """A subquery of an aggregate over every row of the queryset."""
+    return Subquery(
+        queryset.order_by()
+        .annotate(group=Value(1))
+        .values("group")
+        .annotate(value=expression)
+        .values("value")
+    )
+
+
+class ConditionalGetMixin:
+    """
+    Add `ETag` and `Last-Modified` validators to the list and retrieve responses of a
+    viewset. The validators are derived from the latest `modified` timestamp, the count
+    and the sum of the keys of the requested objects and of the relations their
+    representations embed, so a client revalidating unchanged data gets a 304 after a
+    single aggregate query, without the objects being loaded.
+
+    A list's validators cover its whole filtered queryset, and its ETag the query
+    parameters, so they also change with the page's counts & links.
+    """
+
+    def list(self, request, *args, **kwargs):
+        last_modified, version = self.get_validators(self.filter_queryset(self.get_queryset()))
+        return self.conditional_response(
+            request, last_modified, version, super().list, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            last_modified, version = self.get_validators(
+                self.filter_queryset(self.get_queryset()).filter(
+                    **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+                )
+            )
+        except (TypeError, ValueError, ValidationError):
+            last_modified = None
+        if last_modified is None:
+            # Let the regular view raise the 404.
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(
+            request, last_modified, version, super().retrieve, *args, **kwargs
+        )
+
+    def get_validators(self, queryset) -> tuple[datetime | None, str]:
+        """
+        The latest `modified` timestamp of the objects & their embedded relations, and the
+        counts & key sums of both. Adding, removing or editing an embedded object doesn't
+        change the object's own `modified`, so the relations are covered separately.
+        """
+        queryset = queryset.order_by().select_related(None).prefetch_related(None)
+        stats = {"modified": Max("modified"), "count": Count("pk"), "keys": Sum("pk")}
+        for name, field in self.get_serializer().fields.items():
+            if not isinstance(field, BaseSerializer):
+                continue
+            found = embedded_links(queryset.model, field.source, queryset)
+            if found is None:
+                continue
+            links, key = found
+            stats[f"{name}_count"] = aggregate_subquery(links, Count("pk"))
+            stats[f"{name}_keys"] = aggregate_subquery(links, Sum(key))
+            related = (
+                links.model if key == "pk" else links.model._meta.get_field(key).related_model
+            )
+            if any(column.name == "modified" for column in related._meta.concrete_fields):
+                modified = "modified" if key == "pk" else f"{key}__modified"
+                stats[f"{name}_modified"] = aggregate_subquery(links, Max(modified))
+        values = queryset.annotate(group=Value(1)).values("group").annotate(**stats).get()
+        timestamps = [value for name, value in values.items() if name.endswith("modified")]
+        return max(filter(None, timestamps), default=None), repr(sorted(values.items()))
+
+    def conditional_response(self, request, last_modified, version, view, *args, **kwargs):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        etag = self.get_etag(request, last_modified, version)
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = view(request, *args, **kwargs)
+
+        if status.is_success(response.status_code) or (
+            response.status_code == status.HTTP_304_NOT_MODIFIED
+        ):
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
+
+    @staticmethod
+    def get_etag(request, last_modified, version) -> str:
+        # The full path covers the filter, pagination & format query parameters.
+        renderer = getattr(request, "accepted_renderer", None)
+        key = "|".join(
+            [
+                request.get_full_path(),
+                renderer.format if renderer else "",
+                last_modified.isoformat() if last_modified else "",
+                str(version),
+            ]
+        )
+        return quote_etag(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest())
+
+
+class SparseFieldsMixin:
+    """
+    Let clients pick the fields of the read actions with the `fields` or `omit` query
+    parameters (comma separated). Besides trimming the serializer, the columns & prefetched
+    relations that none of the remaining fields use aren't loaded.
+    """
+
+    sparse_actions = ("list", "retrieve", "issue_list", "series_list")
+    # Columns that are always loaded, like the ones cursor pagination reads.
+    sparse_required_fields = ("modified",)
+
+    def get_sparse_fields(self) -> tuple[set[str] | None, set[str]]:
+        if not hasattr(self, "_sparse_fields"):
+            params = self.request.query_params if self.request else {}
+
+            def parse(name):
+                if name not in params:
+                    return None
+                return {field.strip() for field in params[name].split(",") if field.strip()}
+
+            self._sparse_fields = (parse("fields"), parse("omit") or set())
+        return self._sparse_fields
+
+    def is_sparse(self) -> bool:
+        if self.action not in self.sparse_actions or self.request.method != "GET":
+            return False
+        requested, omitted = self.get_sparse_fields()
+        return requested is not None or bool(omitted)
+
+    def keep_field(self, name: str) -> bool:
+        requested, omitted = self.get_sparse_fields()
+        return (requested is None or name in requested) and name not in omitted
+
+    def trim_fields(self, fields) -> None:
+        for name in list(fields):
+            if not self.keep_field(name):
+                fields.pop(name)
+
+    def trim_representation(self, data: dict) -> dict:
+        return {name: value for name, value in data.items() if self.keep_field(name)}
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if self.is_sparse():
+            self.trim_fields(getattr(serializer, "child", serializer).fields)
+        return serializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            queryset = self.sparse_queryset(queryset)
+        return queryset
+
+    def sparse_queryset(self, queryset):
+        """
+        Defer the columns and drop the prefetches that the requested fields don't use. This
+        is skipped when a field isn't read from a model field or relation, like one computed
+        from the whole object or by a property, since it could use any column.
+        """
+        if not self.is_sparse():
+            return queryset
+
+        serializer = self.get_serializer_class()(context=self.get_serializer_context())
+        fields = serializer.fields
+        self.trim_fields(fields)
+        sources = {field.source.split(".")[0] for field in fields.values()}
+        model_fields = {
+            field.get_accessor_name() if isinstance(field, ForeignObjectRel) else field.name
+            for field in queryset.model._meta.get_fields()
+        }
+        if not sources <= model_fields:
+            return queryset
+
+        deferred = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if not (field.primary_key or field.is_relation)
+            and field.name not in sources
+            and field.name not in self.sparse_required_fields
+        ]
+        prefetches = [
+            lookup
+            for lookup in queryset._prefetch_related_lookups
+            if getattr(lookup, "prefetch_through", lookup).split("__")[0] in sources
+        ]
+        return queryset.defer(*deferred).prefetch_related(None).prefetch_related(*prefetches)
+
+
+class CachedRetrieveMixin(SparseFieldsMixin, ConditionalGetMixin):
+    """
+    Serve the retrieve action from a cache of the serialized object, so repeated requests
+    for the same object cost a cache lookup and a query checking the object can still be
+    retrieved. The entries are invalidated by the receivers in `comicsdb.signals` when
+    the object or anything it embeds changes.
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        model_name = self.get_queryset().model._meta.model_name
+        pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        # Image & resource urls are absolute, so only reuse entries made for the same host.
+        base_url = request.build_absolute_uri("/")
+
+        entry, generation = get_cached_representation(model_name, pk)
+        if entry is not None and entry["base_url"] == base_url and "digest" in entry:
+            # An entry is only served if the request could get the object itself.
+            queryset = (
+                self.filter_queryset(self.get_queryset())
+                .select_related(None)
+                .prefetch_related(None)
+                .only("pk")
+            )
+            obj = get_object_or_404(queryset, **{self.lookup_field: pk})
+            self.check_object_permissions(request, obj)
+        else:
+            # Only full representations are cached, so trimmed misses take the regular path.
+            if self.is_sparse():
+                return super().retrieve(request, *args, **kwargs)
+            instance = self.get_object()
+            data = self.get_serializer(instance).data
+            # The entries are invalidated whenever the representation changes, so the
+            # time it was serialized at bounds its last change, and its digest tells it
+            # apart from the previous ones.
+            entry = {
+                "generation": generation,
+                "base_url": base_url,
+                "modified": timezone.now(),
+                "digest": hashlib.md5(
+                    json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True).encode(),
+                    usedforsecurity=False,
+                ).hexdigest(),
+                "data": data,
+            }
+            set_cached_representation(model_name, instance.pk, entry)
+
+        data = self.trim_representation(entry["data"]) if self.is_sparse() else entry["data"]
+        return self.conditional_response(
+            request, entry["modified"], entry["digest"], lambda *args, **kwargs: Response(data)
+        )
+
+
+class CachedDetailMixin:
+    """
+    Let a detail view's template cache its content with a `{% cache %}` tag named
+    `<model name>_detail`, using the `fragment_ttl` & `fragment_key` context variables.
+    The key changes with the object, the objects it depends on & what the user is allowed
+    to do, and the receivers in `comicsdb.signals` invalidate it when anything shown on
+    the page changes.
+
+    The `detail_prefetch` lookups are only done when the fragment isn't cached, so the
+    rest of the context has to be computed lazily too, for a cached page to cost no more
+    than the object's query.
+    """
+
+    detail_prefetch = ()
+
+    def get_fragment_name(self) -> str:
+        # The name given to the `{% cache %}` tag of the template.
+        return f"{self.model._meta.model_name}_detail"
+
+    def get_fragment_dependencies(self, obj) -> list[tuple[str, int]]:
+        """(model name, pk) of the other objects whose changes invalidate the page."""
+        return []
+
+    def get_fragment_variant(self) -> str:
+        # The pages show the edit & delete buttons depending on the user.
+        user = self.request.user
+        if not user.is_authenticated:
+            return "anonymous"
+        if user.has_perm(f"comicsdb.delete_{self.model._meta.model_name}"):
+            return "delete"
+        return "edit"
+
+    def get_object(self, queryset=None):
+        obj = super().get_object(queryset)
+        self.fragment_key = detail_fragment_key(
+            obj, self.get_fragment_dependencies(obj), self.get_fragment_variant()
+        )
+        fragment = make_template_fragment_key(self.get_fragment_name(), [self.fragment_key])
+        if self.detail_prefetch and not cache.has_key(fragment):
+            prefetch_related_objects([obj], *self.detail_prefetch)
+        return obj
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["fragment_ttl"] = DETAIL_CACHE_TTL
+        context["fragment_key"] = self.fragment_key
+        return context
+
+
+class BatchLookupMixin:
+    """
+    Add a `lookup` action resolving many identifiers of one kind with a single query, so
+    clients matching a batch of files don't need a filtered list request for each one.
+    The `upc`, `isbn` & `sku` kinds are matched through the identifiers of the issues &
+    of their variants, like the issue filters and the barcode lookup.
+    """
+
+    batch_lookup_kinds = ("id", "cv_id")
+
+    @action(detail=False, methods=["post"], url_path="lookup", parser_classes=(JSONParser,))
+    def batch_lookup(self, request):
+        """
+        Return the objects matching each of the given `values` of an identifier `kind`,
+        keyed by value. Values without a match have an empty list.
+        """
+        params = LookupSerializer(data=request.data, kinds=self.batch_lookup_kinds)
+        params.is_valid(raise_exception=True)
+        kind = params.validated_data["kind"]
+        values = params.validated_data["values"]
+
+        # Given value -> the values of `field` it matches
+        if kind in IDENTIFIER_KEYS:
+            field = "pk"
+            keys = {value: key for value in values if (key := IDENTIFIER_KEYS[kind](value))}
+            matches = Identifier.objects.match(kind, keys)
+        else:
+            field, normalize = IDENTIFIERS[kind]
+            matches = {value: normalize(value) for value in values}
+
+        results = {value: [] for value in values}
+        keys = {key for matched in matches.values() for key in matched}
+        if keys:
+            objects = list(self.get_queryset().filter(**{f"{field}__in": keys}))
+            serializer = self.get_serializer(objects, many=True)
+            found = defaultdict(list)
+            for obj, data in zip(objects, serializer.data, strict=True):
+                found[getattr(obj, field)].append(data)
+            for value, matched in matches.items():
+                results[value] = [data for key in matched for data in found[key]]
+        return Response({"kind": kind, "results": results})
@@ -1,13 +1,11 @@
 import logging
-import operator
-from functools import reduce
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -16,6 +14,8 @@ from comicsdb.forms.publisher import PublisherForm
 from comicsdb.models.attribution import Attribution
 from comicsdb.models.publisher import Publisher
 from comicsdb.models.series import Series
+from comicsdb.search import search
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -24,7 +24,6 @@ LOGGER = logging.getLogger(__name__)
 class PublisherList(ListView):
     model = Publisher
     paginate_by = PAGINATE
-    queryset = Publisher.objects.prefetch_related("series")
 
 
 class PublisherSeriesList(ListView):
@@ -33,11 +32,7 @@ class PublisherSeriesList(ListView):
 
     def get_queryset(self):
         self.publisher = get_object_or_404(Publisher, slug=self.kwargs["slug"])
-        return (
-            Series.objects.select_related("series_type")
-            .filter(publisher=self.publisher)
-            .prefetch_related("issues")
-        )
+        return Series.objects.select_related("series_type").filter(publisher=self.publisher)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -45,15 +40,13 @@ class PublisherSeriesList(ListView):
         return context
 
 
-class PublisherDetail(DetailView):
+class PublisherDetail(CachedDetailMixin, DetailView):
     model = Publisher
-    queryset = Publisher.objects.select_related("edited_by").prefetch_related(
-        "series", "universes__issues", "imprints__series"
-    )
+    queryset = Publisher.objects.select_related("edited_by")
+    detail_prefetch = ("series", "universes", "imprints")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        publisher = self.get_object()
+    def get_navigation(self):
+        publisher = self.object
         try:
             next_publisher = (
                 Publisher.objects.order_by("name").filter(name__gt=publisher.name).first()
@@ -68,10 +61,14 @@ class PublisherDetail(DetailView):
         except ObjectDoesNotExist:
             previous_publisher = None
 
-        context["navigation"] = {
+        return {
             "next_publisher": next_publisher,
             "previous_publisher": previous_publisher,
         }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
@@ -79,10 +76,7 @@ class SearchPublisherList(PublisherList):
     def get_queryset(self):
         result = super().get_queryset()
         if query := self.request.GET.get("q"):
-            query_list = query.split()
-            result = result.filter(
-                reduce(operator.and_, (Q(name__icontains=q) for q in query_list))
-            )
+            result = search(result, query, rank=True)
 
         return result
 
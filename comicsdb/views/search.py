@@ -0,0 +1,35 @@
+from urllib.parse import urlencode
+
+from django.urls import reverse
+from django.views.generic.base import TemplateView
+
+from comicsdb.models import Issue
+from comicsdb.search_index import SEARCH_TYPES, search_entries
+
+
+class SearchView(TemplateView):
+    template_name = "comicsdb/search.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get("q", "").strip()
+        groups = []
+        for name, group in search_entries(query).items():
+            model = SEARCH_TYPES[name]
+            # The issue search filters by fields rather than by a single query.
+            more_url = (
+                None
+                if model is Issue
+                else f"{reverse(f'{name}:search')}?{urlencode({'q': query})}"
+            )
+            groups.append(
+                {
+                    "name": name,
+                    "title": model._meta.verbose_name_plural.title(),
+                    "more_url": more_url,
+                    **group,
+                }
+            )
+        context["query"] = query
+        context["groups"] = groups
+        return context
@@ -1,13 +1,12 @@
 import logging
-import operator
-from functools import reduce
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -15,6 +14,8 @@ from comicsdb.forms.attribution import AttributionFormSet
 from comicsdb.forms.series import SeriesForm
 from comicsdb.models import Series
 from comicsdb.models.attribution import Attribution
+from comicsdb.search import search
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -23,7 +24,7 @@ LOGGER = logging.getLogger(__name__)
 class SeriesList(ListView):
     model = Series
     paginate_by = PAGINATE
-    queryset = Series.objects.select_related("series_type").prefetch_related("issues")
+    queryset = Series.objects.select_related("series_type")
 
 
 class SeriesIssueList(ListView):
@@ -40,15 +41,14 @@ class SeriesIssueList(ListView):
         return context
 
 
-class SeriesDetail(DetailView):
+class SeriesDetail(CachedDetailMixin, DetailView):
     model = Series
     queryset = Series.objects.select_related(
         "publisher", "imprint", "edited_by", "series_type"
-    ).prefetch_related("issues")
+    )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        series = self.get_object()
+    def get_navigation(self):
+        series = self.object
 
         # Set the initial value for the navigation variables
         next_series = None
@@ -89,6 +89,15 @@ class SeriesDetail(DetailView):
             except ObjectDoesNotExist:
                 previous_series = None
 
+        return {
+            "next_series": next_series,
+            "previous_series": previous_series,
+        }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        series = self.object
+
         # Top 10 creator credits for series. Might be worthwhile to exclude editors, etc.
         creators = (
             series.issues.values("creators__name", "creators__image", "creators__slug")
@@ -107,10 +116,7 @@ class SeriesDetail(DetailView):
             .filter(count__gte=1)[:12]
         )
 
-        context["navigation"] = {
-            "next_series": next_series,
-            "previous_series": previous_series,
-        }
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         context["creators"] = creators
         context["characters"] = characters
         return context
@@ -120,10 +126,7 @@ class SearchSeriesList(SeriesList):
     def get_queryset(self):
         result = super().get_queryset()
         if query := self.request.GET.get("q"):
-            query_list = query.split()
-            result = result.filter(
-                reduce(operator.and_, (Q(name__unaccent__icontains=q) for q in query_list))
-            )
+            result = search(result, query, rank=True)
 
         return result
 
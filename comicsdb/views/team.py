@@ -1,13 +1,11 @@
 import logging
-import operator
-from functools import reduce
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import DetailView, ListView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 
@@ -15,6 +13,8 @@ from comicsdb.forms.attribution import AttributionFormSet
 from comicsdb.forms.team import TeamForm
 from comicsdb.models.attribution import Attribution
 from comicsdb.models.team import Team
+from comicsdb.search import search
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -23,7 +23,6 @@ LOGGER = logging.getLogger(__name__)
 class TeamList(ListView):
     model = Team
     paginate_by = PAGINATE
-    queryset = Team.objects.prefetch_related("issues")
 
 
 class TeamIssueList(ListView):
@@ -40,13 +39,12 @@ class TeamIssueList(ListView):
         return context
 
 
-class TeamDetail(DetailView):
+class TeamDetail(CachedDetailMixin, DetailView):
     model = Team
     queryset = Team.objects.select_related("edited_by")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        team = self.get_object()
+    def get_navigation(self):
+        team = self.object
         try:
             next_team = Team.objects.filter(name__gt=team.name).order_by("name").first()
         except ObjectDoesNotExist:
@@ -57,7 +55,11 @@ class TeamDetail(DetailView):
         except ObjectDoesNotExist:
             previous_team = None
 
-        context["navigation"] = {"next_team": next_team, "previous_team": previous_team}
+        return {"next_team": next_team, "previous_team": previous_team}
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
@@ -65,10 +67,7 @@ class SearchTeamList(TeamList):
     def get_queryset(self):
         result = super().get_queryset()
         if query := self.request.GET.get("q"):
-            query_list = query.split()
-            result = result.filter(
-                reduce(operator.and_, (Q(name__icontains=q) for q in query_list))
-            )
+            result = search(result, query, rank=True)
 
         return result
 
@@ -8,6 +8,7 @@ from django.db import transaction
 from django.db.models import Count, Prefetch, Q
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views.generic import CreateView, DeleteView, DetailView, ListView, UpdateView
 
 from comicsdb.forms.attribution import AttributionFormSet
@@ -16,6 +17,7 @@ from comicsdb.models.attribution import Attribution
 from comicsdb.models.issue import Issue
 from comicsdb.models.series import Series
 from comicsdb.models.universe import Universe
+from comicsdb.views.mixins import CachedDetailMixin
 
 PAGINATE = 28
 LOGGER = logging.getLogger(__name__)
@@ -37,7 +39,6 @@ class UniverseSeriesList(ListView):
 class UniverseList(ListView):
     model = Universe
     paginate_by = PAGINATE
-    queryset = Universe.objects.prefetch_related("issues")
 
 
 class UniverseIssueList(ListView):
@@ -54,20 +55,20 @@ class UniverseIssueList(ListView):
         return context
 
 
-class UniverseDetail(DetailView):
+class UniverseDetail(CachedDetailMixin, DetailView):
     model = Universe
-    queryset = Universe.objects.select_related("edited_by").prefetch_related(
+    queryset = Universe.objects.select_related("edited_by")
+    detail_prefetch = (
         Prefetch(
             "issues",
             queryset=Issue.objects.order_by(
                 "series__sort_name", "cover_date", "number"
             ).select_related("series", "series__series_type"),
-        )
+        ),
     )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        universe = self.get_object()
+    def get_navigation(self):
+        universe = self.object
         try:
             next_universe = (
                 Universe.objects.order_by("name").filter(name__gt=universe.name).first()
@@ -82,6 +83,14 @@ class UniverseDetail(DetailView):
         except ObjectDoesNotExist:
             previous_universe = None
 
+        return {
+            "next_universe": next_universe,
+            "previous_universe": previous_universe,
+        }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        universe = self.object
         # TODO: Look into improving this queryset
         #
         # Run this context queryset if the issue count is greater than 0.
@@ -101,10 +110,7 @@ class UniverseDetail(DetailView):
         else:
             context["appearances"] = ""
 
-        context["navigation"] = {
-            "next_universe": next_universe,
-            "previous_universe": previous_universe,
-        }
+        context["navigation"] = SimpleLazyObject(self.get_navigation)
         return context
 
 
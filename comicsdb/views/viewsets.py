@@ -1,19 +1,30 @@
+from django.core.files.storage import default_storage
 from django.db.models import Prefetch
-from django.http import Http404
+from django.http import Http404, HttpResponseRedirect
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from comicsdb.cover_hash import similar_issues
+from comicsdb.export import get_manifest
+from comicsdb.filters.change import ChangeFilter
 from comicsdb.filters.issue import IssueFilter
-from comicsdb.filters.name import ComicVineFilter, NameFilter, UniverseFilter
+from comicsdb.filters.name import (
+    ComicVineFilter,
+    ComicVineSearchFilter,
+    NameFilter,
+    UniverseFilter,
+)
 from comicsdb.filters.series import SeriesFilter
 from comicsdb.models import (
     Arc,
+    Change,
     Character,
     Creator,
     Credits,
+    Identifier,
     Imprint,
     Issue,
     Publisher,
@@ -24,12 +35,17 @@ from comicsdb.models import (
 )
 from comicsdb.models.series import SeriesType
 from comicsdb.models.variant import Variant
+from comicsdb.search_index import search_entries
 from comicsdb.serializers import (
     ArcListSerializer,
     ArcSerializer,
+    BarcodeIssueSerializer,
+    BarcodeSerializer,
+    ChangeSerializer,
     CharacterListSerializer,
     CharacterReadSerializer,
     CharacterSerializer,
+    CoverSearchSerializer,
     CreatorListSerializer,
     CreatorSerializer,
     CreditSerializer,
@@ -42,10 +58,13 @@ from comicsdb.serializers import (
     PublisherListSerializer,
     PublisherSerializer,
     RoleSerializer,
+    SearchEntrySerializer,
     SeriesListSerializer,
     SeriesReadSerializer,
     SeriesSerializer,
     SeriesTypeSerializer,
+    SimilarIssueSerializer,
+    SiteSearchSerializer,
     TeamListSerializer,
     TeamReadSerializer,
     TeamSerializer,
@@ -54,10 +73,21 @@ from comicsdb.serializers import (
     UniverseSerializer,
     VariantSerializer,
 )
+from comicsdb.views.mixins import (
+    BatchLookupMixin,
+    CachedRetrieveMixin,
+    ConditionalGetMixin,
+    SparseFieldsMixin,
+)
+from metron.pagination import ChangeFeedPagination, OptionalCursorPagination
 from metron.throttle import GetUserRateThrottle, PostUserRateThrottle
 
+BULK_CREATE_LIMIT = 500
+
 
-class ArcViewSet(viewsets.ModelViewSet):
+class ArcViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Returns a list of all the story arcs.
@@ -67,7 +97,7 @@ class ArcViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Arc.objects.all()
-    filterset_class = ComicVineFilter
+    filterset_class = ComicVineSearchFilter
     parser_classes = (MultiPartParser, FormParser)
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
@@ -82,7 +112,7 @@ class ArcViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list", "issue_list"]:
+        if self.action in ["retrieve", "list", "batch_lookup", "issue_list"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -97,7 +127,7 @@ class ArcViewSet(viewsets.ModelViewSet):
         serializer.save(edited_by=self.request.user)
         return super().perform_update(serializer)
 
-    @action(detail=True)
+    @action(detail=True, pagination_class=OptionalCursorPagination)
     def issue_list(self, request, pk=None):
         """
         Returns a list of issues for a story arc.
@@ -106,14 +136,35 @@ class ArcViewSet(viewsets.ModelViewSet):
         queryset = arc.issues.select_related("series", "series__series_type").order_by(
             "cover_date", "series", "number"
         )
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(self.sparse_queryset(queryset))
         if page is not None:
-            serializer = IssueListSerializer(page, many=True, context={"request": request})
+            serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         raise Http404
 
 
-class CharacterViewSet(viewsets.ModelViewSet):
+class ChangeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    list:
+    Returns the changes to arcs, characters, creators, credits, imprints, issues,
+    publishers, series, teams & universes, in the order they were made.
+
+    Pass the `token` of the last response as `since` to only get the newer changes.
+    Deleted objects are returned with a `delete` operation. Changes are listed five
+    minutes after they were made, once every earlier change is guaranteed to be listed.
+    """
+
+    queryset = Change.objects.select_related("content_type")
+    serializer_class = ChangeSerializer
+    filterset_class = ChangeFilter
+    pagination_class = ChangeFeedPagination
+    permission_classes = (IsAuthenticated,)
+    throttle_classes = (GetUserRateThrottle,)
+
+
+class CharacterViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Return a list of all the characters.
@@ -123,7 +174,7 @@ class CharacterViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Character.objects.all()
-    filterset_class = ComicVineFilter
+    filterset_class = ComicVineSearchFilter
     parser_classes = (MultiPartParser, FormParser)
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
@@ -133,14 +184,14 @@ class CharacterViewSet(viewsets.ModelViewSet):
                 return CharacterListSerializer
             case "issue_list":
                 return IssueListSerializer
-            case "retrieve":
+            case "retrieve" | "batch_lookup":
                 return CharacterReadSerializer
             case _:
                 return CharacterSerializer
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list", "issue_list"]:
+        if self.action in ["retrieve", "list", "batch_lookup", "issue_list"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -154,7 +205,7 @@ class CharacterViewSet(viewsets.ModelViewSet):
         serializer.save(edited_by=self.request.user)
         return super().perform_update(serializer)
 
-    @action(detail=True)
+    @action(detail=True, pagination_class=OptionalCursorPagination)
     def issue_list(self, request, pk=None):
         """
         Returns a list of issues for a character.
@@ -163,14 +214,16 @@ class CharacterViewSet(viewsets.ModelViewSet):
         queryset = character.issues.select_related("series", "series__series_type").order_by(
             "cover_date", "series", "number"
         )
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(self.sparse_queryset(queryset))
         if page is not None:
-            serializer = IssueListSerializer(page, many=True, context={"request": request})
+            serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         raise Http404
 
 
-class CreatorViewSet(viewsets.ModelViewSet):
+class CreatorViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Return a list of all the creators.
@@ -180,7 +233,7 @@ class CreatorViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Creator.objects.all()
-    filterset_class = ComicVineFilter
+    filterset_class = ComicVineSearchFilter
     parser_classes = (MultiPartParser, FormParser)
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
@@ -193,7 +246,7 @@ class CreatorViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list"]:
+        if self.action in ["retrieve", "list", "batch_lookup"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -216,7 +269,7 @@ class CreditViewset(
 ):
     """
     create:
-    Add a new Credit.
+    Add a list of new Credits. The roles of a Credit that already exists are added to it.
 
     update:
     Update a Credit's data."""
@@ -241,7 +294,45 @@ class CreditViewset(
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
-class ImprintViewSet(viewsets.ModelViewSet):
+class ExportViewSet(viewsets.ViewSet):
+    """
+    list:
+    Returns the manifest of the latest full database export, with the download link,
+    row count, size and checksum of each file.
+
+    retrieve:
+    Redirects to the gzip-compressed NDJSON file of an entity of the latest export.
+    """
+
+    permission_classes = (IsAuthenticated,)
+    throttle_classes = (GetUserRateThrottle,)
+
+    def get_manifest(self) -> dict:
+        if (manifest := get_manifest()) is None:
+            raise Http404
+        return manifest
+
+    def get_file_url(self, request, path: str) -> str:
+        return request.build_absolute_uri(default_storage.url(path))
+
+    def list(self, request):
+        manifest = self.get_manifest()
+        files = {
+            name: {**info, "url": self.get_file_url(request, info["path"])}
+            for name, info in manifest["files"].items()
+        }
+        return Response({**manifest, "files": files})
+
+    def retrieve(self, request, pk=None):
+        manifest = self.get_manifest()
+        if pk not in manifest["files"]:
+            raise Http404
+        return HttpResponseRedirect(self.get_file_url(request, manifest["files"][pk]["path"]))
+
+
+class ImprintViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Returns a list of all imprints.
@@ -265,13 +356,13 @@ class ImprintViewSet(viewsets.ModelViewSet):
         match self.action:
             case "list":
                 return ImprintListSerializer
-            case "retrieve":
+            case "retrieve" | "batch_lookup":
                 return ImprintReadSerializer
             case _:
                 return ImprintSerializer
 
     def get_permissions(self):
-        if self.action in ["retrieve", "list"]:
+        if self.action in ["retrieve", "list", "batch_lookup"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -286,7 +377,7 @@ class ImprintViewSet(viewsets.ModelViewSet):
         return super().perform_update(serializer)
 
 
-class IssueViewSet(viewsets.ModelViewSet):
+class IssueViewSet(BatchLookupMixin, CachedRetrieveMixin, viewsets.ModelViewSet):
     """
     list:
     Return a list of all the issues.
@@ -296,6 +387,24 @@ class IssueViewSet(viewsets.ModelViewSet):
 
     Note: cover_hash is a Perceptual hashing created with
     ImageHash. https://github.com/JohannesBuchner/imagehash
+
+    Passing an empty `cursor` parameter switches to cursor pagination ordered by
+    modification time, which returns `next` / `previous` cursors and accepts a
+    `page_size` of up to 500.
+
+    bulk:
+    Add up to 500 new issues, given as a JSON list, in one request.
+
+    similar:
+    Returns the issues with the covers closest to a `cover_hash`, or to an uploaded
+    `image`, within `max_distance` bits.
+
+    lookup:
+    Returns the issues matching up to 500 identifiers of one `kind` (`id`, `cv_id`,
+    `upc`, `isbn` or `sku`), keyed by identifier.
+
+    barcode:
+    Returns the issues, or variants, with the UPC or ISBN `code` scanned from a cover.
     """
 
     queryset = Issue.objects.select_related(
@@ -314,21 +423,27 @@ class IssueViewSet(viewsets.ModelViewSet):
         ),
     )
     filterset_class = IssueFilter
+    pagination_class = OptionalCursorPagination
     parser_classes = (MultiPartParser, FormParser)
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
+    batch_lookup_kinds = ("id", "cv_id", "upc", "isbn", "sku")
 
     def get_serializer_class(self):
         match self.action:
             case "list":
                 return IssueListSerializer
-            case "retrieve":
+            case "retrieve" | "batch_lookup":
                 return IssueReadSerializer
+            case "similar":
+                return SimilarIssueSerializer
+            case "barcode":
+                return BarcodeIssueSerializer
             case _:
                 return IssueSerializer
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list"]:
+        if self.action in ["retrieve", "list", "batch_lookup", "similar", "barcode"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -342,8 +457,61 @@ class IssueViewSet(viewsets.ModelViewSet):
         serializer.save(edited_by=self.request.user)
         return super().perform_update(serializer)
 
+    @action(detail=False, methods=["post"], url_path="bulk", parser_classes=(JSONParser,))
+    def bulk_create(self, request):
+        """
+        Add a list of new issues. Either all of them are created, or none are and the
+        errors are returned for each issue, in the order they were given.
+        """
+        serializer = self.get_serializer(
+            data=request.data, many=True, allow_empty=False, max_length=BULK_CREATE_LIMIT
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(edited_by=request.user, created_by=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-class PublisherViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=["get", "post"])
+    def similar(self, request):
+        """
+        Returns the issues with the most similar covers, closest first. The cover is given
+        either as a `cover_hash` or as an uploaded `image`.
+        """
+        data = request.data if request.method == "POST" else request.query_params
+        params = CoverSearchSerializer(data=data)
+        params.is_valid(raise_exception=True)
+        issues = similar_issues(
+            Issue.objects.select_related("series", "series__series_type"),
+            params.validated_data["cover_hash"],
+            params.validated_data["max_distance"],
+            params.validated_data["limit"],
+        )
+        serializer = self.get_serializer(issues, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def barcode(self, request):
+        """
+        Returns the issues with a scanned UPC or ISBN, along with the name of the variant
+        the barcode is from, if any. A UPC without its add-on matches every add-on.
+        """
+        params = BarcodeSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        identifiers = Identifier.objects.lookup_keys(
+            params.validated_data["code"]
+        ).select_related("issue__series__series_type", "variant")
+        # A book's barcode can match both its ISBN & its UPC.
+        issues = {}
+        for identifier in identifiers:
+            issue = identifier.issue
+            issue.variant = identifier.variant.name if identifier.variant else None
+            issues.setdefault((issue.pk, identifier.variant_id), issue)
+        serializer = self.get_serializer(list(issues.values()), many=True)
+        return Response(serializer.data)
+
+
+class PublisherViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Returns a list of all publishers.
@@ -359,7 +527,7 @@ class PublisherViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Publisher.objects.prefetch_related("series")
-    filterset_class = ComicVineFilter
+    filterset_class = ComicVineSearchFilter
     parser_classes = (MultiPartParser, FormParser)
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
@@ -374,7 +542,7 @@ class PublisherViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list", "series_list"]:
+        if self.action in ["retrieve", "list", "batch_lookup", "series_list"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -394,15 +562,17 @@ class PublisherViewSet(viewsets.ModelViewSet):
         Returns a list of series for a publisher.
         """
         publisher = self.get_object()
-        queryset = publisher.series.select_related("series_type").prefetch_related("issues")
-        page = self.paginate_queryset(queryset)
+        queryset = publisher.series.select_related("series_type")
+        page = self.paginate_queryset(self.sparse_queryset(queryset))
         if page is not None:
-            serializer = SeriesListSerializer(page, many=True, context={"request": request})
+            serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         raise Http404
 
 
-class RoleViewset(mixins.ListModelMixin, viewsets.GenericViewSet):
+class RoleViewset(
+    SparseFieldsMixin, ConditionalGetMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """
     list:
     Returns a list of all the creator roles.
@@ -414,7 +584,42 @@ class RoleViewset(mixins.ListModelMixin, viewsets.GenericViewSet):
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
 
-class SeriesViewSet(viewsets.ModelViewSet):
+class SearchViewSet(viewsets.ViewSet):
+    """
+    list:
+    Returns the publishers, imprints, series, issues, creators, characters, teams, arcs &
+    universes matching `q`, grouped by type with the number of matches of each type and
+    the `limit` best ranked of them. The search can be restricted to some `type`s.
+    """
+
+    permission_classes = (IsAuthenticated,)
+    throttle_classes = (GetUserRateThrottle,)
+
+    def list(self, request):
+        params = SiteSearchSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        groups = search_entries(
+            params.validated_data["q"],
+            params.validated_data.get("type"),
+            params.validated_data["limit"],
+        )
+        context = {"request": request}
+        return Response(
+            {
+                name: {
+                    "count": group["count"],
+                    "results": SearchEntrySerializer(
+                        group["results"], many=True, context=context
+                    ).data,
+                }
+                for name, group in groups.items()
+            }
+        )
+
+
+class SeriesViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Returns a list of all the comic series.
@@ -427,11 +632,16 @@ class SeriesViewSet(viewsets.ModelViewSet):
 
     update:
     Update a Series information.
+
+    Passing an empty `cursor` parameter switches to cursor pagination ordered by
+    modification time, which returns `next` / `previous` cursors and accepts a
+    `page_size` of up to 500.
     """
 
     queryset = Series.objects.select_related("series_type", "publisher")
     serializer_class = SeriesSerializer
     filterset_class = SeriesFilter
+    pagination_class = OptionalCursorPagination
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
     def get_serializer_class(self):
@@ -440,26 +650,23 @@ class SeriesViewSet(viewsets.ModelViewSet):
                 return SeriesListSerializer
             case "issue_list":
                 return IssueListSerializer
-            case "retrieve":
+            case "retrieve" | "batch_lookup":
                 return SeriesReadSerializer
             case _:
                 return SeriesSerializer
 
     def get_serializer(self, *args, **kwargs):
-        serializer_class = self.get_serializer_class()
-        kwargs["context"] = self.get_serializer_context()
-
-        if self.request.method in {"POST", "PUT", "PATCH"} and not self.request.data.get(
+        if self.action in {"create", "update", "partial_update"} and not self.request.data.get(
             "imprint"
         ):
             series_request_data = self.request.data.copy()
             series_request_data["imprint"] = None
             kwargs["data"] = series_request_data
-        return serializer_class(*args, **kwargs)
+        return super().get_serializer(*args, **kwargs)
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list", "issue_list"]:
+        if self.action in ["retrieve", "list", "batch_lookup", "issue_list"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -480,14 +687,16 @@ class SeriesViewSet(viewsets.ModelViewSet):
         """
         series = self.get_object()
         queryset = series.issues.all()
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(self.sparse_queryset(queryset))
         if page is not None:
-            serializer = IssueListSerializer(page, many=True, context={"request": request})
+            serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         raise Http404
 
 
-class SeriesTypeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class SeriesTypeViewSet(
+    SparseFieldsMixin, ConditionalGetMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """
     list:
     Returns a list of the Series Types available.
@@ -499,7 +708,9 @@ class SeriesTypeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
 
-class TeamViewSet(viewsets.ModelViewSet):
+class TeamViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Return a list of all the teams.
@@ -509,7 +720,7 @@ class TeamViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Team.objects.all()
-    filterset_class = ComicVineFilter
+    filterset_class = ComicVineSearchFilter
     parser_classes = (MultiPartParser, FormParser)
     throttle_classes = (GetUserRateThrottle, PostUserRateThrottle)
 
@@ -519,14 +730,14 @@ class TeamViewSet(viewsets.ModelViewSet):
                 return TeamListSerializer
             case "issue_list":
                 return IssueListSerializer
-            case "retrieve":
+            case "retrieve" | "batch_lookup":
                 return TeamReadSerializer
             case _:
                 return TeamSerializer
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list", "issue_list"]:
+        if self.action in ["retrieve", "list", "batch_lookup", "issue_list"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
@@ -540,7 +751,7 @@ class TeamViewSet(viewsets.ModelViewSet):
         serializer.save(edited_by=self.request.user)
         return super().perform_update(serializer)
 
-    @action(detail=True)
+    @action(detail=True, pagination_class=OptionalCursorPagination)
     def issue_list(self, request, pk=None):
         """
         Returns a list of issues for a character.
@@ -549,14 +760,16 @@ class TeamViewSet(viewsets.ModelViewSet):
         queryset = team.issues.select_related("series", "series__series_type").order_by(
             "cover_date", "series", "number"
         )
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(self.sparse_queryset(queryset))
         if page is not None:
-            serializer = IssueListSerializer(page, many=True, context={"request": request})
+            serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         raise Http404
 
 
-class UniverseViewSet(viewsets.ModelViewSet):
+class UniverseViewSet(
+    BatchLookupMixin, SparseFieldsMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     list:
     Return a list of all the universes.
@@ -574,14 +787,14 @@ class UniverseViewSet(viewsets.ModelViewSet):
         match self.action:
             case "list":
                 return UniverseListSerializer
-            case "retrieve":
+            case "retrieve" | "batch_lookup":
                 return UniverseReadSerializer
             case _:
                 return UniverseSerializer
 
     def get_permissions(self):
         permission_classes = []
-        if self.action in ["retrieve", "list"]:
+        if self.action in ["retrieve", "list", "batch_lookup"]:
             permission_classes = [IsAuthenticated]
         else:
             permission_classes = [IsAdminUser]
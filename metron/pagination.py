@@ -0,0 +1,209 @@
+from datetime import datetime, timedelta
+
+from django.db.models import Q
+from django.db.models.functions import Now
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class ModifiedCursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination ordered by the last modified time, with the primary key as the
+    tie-breaker, so that every page costs the same no matter how deep it is. Cursors hold
+    both, so the objects modified at the same time as a page boundary are also found with
+    the (modified, id) index instead of an offset.
+    """
+
+    ordering = ("modified", "id")
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*(f"-{field}" for field in self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self.position_filter(current_position, reverse))
+
+        # Positions are unique, so the offset of the cursors is always 0.
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = results[: self.page_size]
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            following_position = None
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = (current_position is not None) or (offset > 0)
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def position_filter(self, position: str, reverse: bool) -> Q:
+        """The objects after a position, or before it for a reverse cursor."""
+        modified, _, pk = position.rpartition(" ")
+        try:
+            modified, pk = datetime.fromisoformat(modified), int(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message) from None
+        lookup = "lt" if reverse else "gt"
+        return Q(**{f"modified__{lookup}": modified}) | Q(
+            modified=modified, **{f"id__{lookup}": pk}
+        )
+
+    def _get_position_from_instance(self, instance, ordering):
+        if isinstance(instance, dict):
+            modified, pk = instance["modified"], instance["id"]
+        else:
+            modified, pk = instance.modified, instance.pk
+        return f"{modified.isoformat()} {pk}"
+
+
+class OptionalCursorPagination(pagination.PageNumberPagination):
+    """
+    Page number pagination that switches to cursor pagination when the request has a
+    `cursor` query parameter. Clients opt in by requesting the first page with an empty
+    cursor (`?cursor=`) and then following the `next` links.
+    """
+
+    cursor_pagination_class = ModifiedCursorPagination
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def use_cursor(self, request) -> bool:
+        return self.cursor_pagination_class.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_html_context(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_html_context()
+        return super().get_html_context()
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+    @property
+    def display_page_controls(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.display_page_controls
+        return getattr(self, "_display_page_controls", False)
+
+    @display_page_controls.setter
+    def display_page_controls(self, value):
+        self._display_page_controls = value
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.extend(self.cursor_pagination_class().get_schema_operation_parameters(view))
+        return parameters
+
+
+class ChangeFeedPagination(pagination.BasePagination):
+    """
+    Pagination for the change feed. Each page holds the changes after the `since` token,
+    and the response includes the token of its last change, which clients keep as their
+    high-water mark and pass back as `since` on the next poll.
+
+    The tokens are allocated when the changes are logged, not when their transactions
+    commit, so a change can become visible after a later one was already served. To keep
+    the high-water mark from skipping it, changes are only served once they are older
+    than `lag`: no change is missed as long as the transactions logging them commit
+    within `lag` of logging them.
+    """
+
+    page_size = 500
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    since_query_param = "since"
+    lag = timedelta(minutes=5)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        # The changes are timestamped by the database when they're logged.
+        queryset = queryset.filter(modified__lt=Now() - self.lag)
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if self.page:
+            self.token = self.page[-1].pk
+        else:
+            since = request.query_params.get(self.since_query_param, "")
+            self.token = int(since) if since.isdigit() else None
+        return self.page
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.since_query_param, self.token)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "token": self.token, "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["token", "results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "token": {"type": "integer", "nullable": True},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of changes to return per page.",
+                "schema": {"type": "integer"},
+            }
+        ]
@@ -2,6 +2,7 @@ import uuid
 from datetime import date, datetime
 
 import pytest
+from django.core.cache import caches
 from django.core.management import call_command
 from django.utils import timezone
 
@@ -14,11 +15,30 @@ from comicsdb.models.issue import Issue
 from comicsdb.models.publisher import Publisher
 from comicsdb.models.series import Series, SeriesType
 from comicsdb.models.team import Team
+from comicsdb.reference import clear_tables
 from users.models import CustomUser
 
 NUMBER_OF_ISSUES = 35
 
 
+@pytest.fixture(autouse=True)
+def _clear_reference_tables():
+    # The reference tables are cached in the process, while the tests' data is rolled back.
+    clear_tables()
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # The tests' data is rolled back without running the on_commit invalidations, so each
+    # test gets its own empty caches instead of sharing them with other tests & workers.
+    backend = "django.core.cache.backends.locmem.LocMemCache"
+    settings.CACHES = {
+        alias: {"BACKEND": backend, "LOCATION": alias} for alias in ("default", "select2")
+    }
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
 @pytest.fixture()
 def test_password():
     return "strong-test-pass"
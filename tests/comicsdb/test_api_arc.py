@@ -70,6 +70,12 @@ def test_unauthorized_view_url(api_client, fc_arc, wwh_arc):
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+def test_list_is_paged_by_number(api_client_with_credentials, fc_arc, wwh_arc):
+    resp = api_client_with_credentials.get(reverse("api:arc-list"), {"cursor": ""})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["count"] == 2
+
+
 def test_get_valid_single_arc(api_client_with_credentials, wwh_arc):
     resp = api_client_with_credentials.get(
         reverse("api:arc-detail", kwargs={"pk": wwh_arc.pk})
@@ -0,0 +1,55 @@
+from django.db.models import F
+from django.urls import reverse
+from rest_framework import status
+
+from comicsdb.models import Arc, Change
+from metron.pagination import ChangeFeedPagination
+
+
+def settle_changes():
+    # The feed only serves the changes older than its lag.
+    Change.objects.update(modified=F("modified") - ChangeFeedPagination.lag)
+
+
+def test_unauthorized_view_url(api_client):
+    resp = api_client.get(reverse("api:change-list"))
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_change_feed(api_client_with_credentials, fc_arc):
+    url = reverse("api:change-list")
+    settle_changes()
+    resp = api_client_with_credentials.get(url, {"entity_type": "arc"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["next"] is None
+    assert [(c["id"], c["operation"]) for c in resp.data["results"]] == [(fc_arc.id, "create")]
+
+    token = resp.data["token"]
+    arc_id = fc_arc.id
+    fc_arc.desc = "Updated"
+    fc_arc.save()
+    fc_arc.delete()
+    resp = api_client_with_credentials.get(url, {"entity_type": "arc", "since": token})
+    assert resp.data["results"] == []
+    assert resp.data["token"] == token
+
+    settle_changes()
+    resp = api_client_with_credentials.get(url, {"entity_type": "arc", "since": token})
+    assert [(c["id"], c["operation"]) for c in resp.data["results"]] == [
+        (arc_id, "update"),
+        (arc_id, "delete"),
+    ]
+    assert resp.data["token"] > token
+    assert not Arc.objects.filter(id=arc_id).exists()
+
+
+def test_change_feed_pages(api_client_with_credentials, list_of_issues):
+    url = reverse("api:change-list")
+    settle_changes()
+    resp = api_client_with_credentials.get(url, {"entity_type": "issue", "page_size": 20})
+    assert len(resp.data["results"]) == 20
+    assert resp.data["next"] is not None
+
+    resp = api_client_with_credentials.get(resp.data["next"])
+    assert len(resp.data["results"]) == 15
+    assert resp.data["next"] is None
@@ -92,6 +92,19 @@ def test_get_valid_single_character(api_client_with_credentials, batman):
     assert resp.status_code == status.HTTP_200_OK
 
 
+def test_conditional_get_embedded_changes(api_client_with_credentials, batman, teen_titans):
+    url = reverse("api:character-detail", kwargs={"pk": batman.pk})
+    etag = api_client_with_credentials.get(url)["ETag"]
+
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+    batman.teams.add(teen_titans)
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["ETag"] != etag
+
+
 def test_get_invalid_single_character(api_client_with_credentials):
     response = api_client_with_credentials.get(
         reverse("api:character-detail", kwargs={"pk": "10"})
@@ -42,6 +42,26 @@ def test_group_user_post_url(db, api_client_with_staff_credentials, create_data)
     assert resp.status_code == status.HTTP_201_CREATED
 
 
+def test_group_user_bulk_post_url(
+    api_client_with_staff_credentials, issue_credit, issue_with_arc, john_byrne, writer
+):
+    artist = Role.objects.create(name="Artist", order=30)
+    data = [
+        {"issue": issue_with_arc.id, "creator": issue_credit.creator_id, "role": [artist.id]},
+        {"issue": issue_with_arc.id, "creator": john_byrne.id, "role": [writer.id]},
+        {"issue": issue_with_arc.id, "creator": john_byrne.id, "role": [artist.id]},
+    ]
+    resp = api_client_with_staff_credentials.post(
+        reverse("api:credits-list"), data=data, format="json"
+    )
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert len(resp.data) == 2
+    assert resp.data[0]["id"] == issue_credit.pk
+    assert set(issue_credit.role.values_list("id", flat=True)) == {writer.id, artist.id}
+    byrne = Credits.objects.get(issue=issue_with_arc, creator=john_byrne)
+    assert set(byrne.role.values_list("id", flat=True)) == {writer.id, artist.id}
+
+
 # Put Tests
 def test_unauthorized_put_url(db, api_client, issue_credit, create_put_data):
     resp = api_client.put(
@@ -2,12 +2,21 @@ from datetime import date
 from decimal import Decimal
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 
+from comicsdb.cache import detail_version_key, get_cached_representation
+from comicsdb.cover_hash import hash_to_int
 from comicsdb.models.arc import Arc
+from comicsdb.models.identifier import Identifier
+from comicsdb.models.issue import Issue
 from comicsdb.models.series import Series
 from comicsdb.models.universe import Universe
+from comicsdb.models.variant import Variant
 
 
 @pytest.fixture()
@@ -54,6 +63,74 @@ def test_user_post_url(api_client_with_credentials, create_issue_data):
 #     assert resp.status_code == status.HTTP_201_CREATED
 
 
+def test_user_bulk_post_url(api_client_with_credentials, create_issue_data):
+    resp = api_client_with_credentials.post(
+        reverse("api:issue-bulk-create"), data=[create_issue_data], format="json"
+    )
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_staff_user_bulk_post_url(
+    api_client_with_staff_credentials, create_issue_data, fc_arc, earth_2_universe
+):
+    data = [create_issue_data, {**create_issue_data, "number": "2"}]
+    resp = api_client_with_staff_credentials.post(
+        reverse("api:issue-bulk-create"), data=data, format="json"
+    )
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert [issue["number"] for issue in resp.data] == ["1", "2"]
+    assert fc_arc.issues.count() == 2
+    assert earth_2_universe.issues.count() == 2
+
+
+def test_bulk_post_invalidates_detail_pages(
+    django_capture_on_commit_callbacks,
+    api_client_with_staff_credentials,
+    create_issue_data,
+    fc_series,
+    fc_arc,
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = api_client_with_staff_credentials.post(
+            reverse("api:issue-bulk-create"), data=[create_issue_data], format="json"
+        )
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert cache.get(detail_version_key("series", fc_series.pk)) is not None
+    assert cache.get(detail_version_key("arc", fc_arc.pk)) is not None
+
+
+def test_bulk_post_invalidates_reprinted_issues(
+    django_capture_on_commit_callbacks,
+    api_client_with_staff_credentials,
+    create_issue_data,
+    issue_with_arc,
+):
+    api_client_with_staff_credentials.get(
+        reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk})
+    )
+    assert get_cached_representation("issue", issue_with_arc.pk)[0] is not None
+
+    data = {**create_issue_data, "number": "2", "reprints": [issue_with_arc.pk]}
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = api_client_with_staff_credentials.post(
+            reverse("api:issue-bulk-create"), data=[data], format="json"
+        )
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert get_cached_representation("issue", issue_with_arc.pk)[0] is None
+
+
+def test_staff_user_bulk_post_errors(api_client_with_staff_credentials, create_issue_data):
+    data = [create_issue_data, {**create_issue_data, "arcs": [0]}, create_issue_data]
+    resp = api_client_with_staff_credentials.post(
+        reverse("api:issue-bulk-create"), data=data, format="json"
+    )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert "non_field_errors" in resp.data[0]
+    assert "arcs" in resp.data[1]
+    assert "non_field_errors" in resp.data[2]
+    assert not Issue.objects.exists()
+
+
 # Put Tests
 def test_unauthorized_put_url(db, api_client, issue_with_arc, create_put_data):
     resp = api_client.put(
@@ -105,3 +182,221 @@ def test_get_invalid_single_arc(api_client_with_credentials):
 def test_unauthorized_detail_view_url(api_client, issue_with_arc):
     resp = api_client.get(reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk}))
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_cursor_pagination(api_client_with_credentials, list_of_issues):
+    resp = api_client_with_credentials.get(
+        reverse("api:issue-list"), {"cursor": "", "page_size": 20}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert "count" not in resp.data
+    assert len(resp.data["results"]) == 20
+    assert resp.data["previous"] is None
+
+    resp = api_client_with_credentials.get(resp.data["next"])
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(resp.data["results"]) == 15
+    assert resp.data["next"] is None
+
+
+def test_cursor_pagination_ties(api_client_with_credentials, list_of_issues):
+    # The issues modified at the same time are paged by their id.
+    Issue.objects.update(modified=timezone.now())
+    url = reverse("api:issue-list")
+    resp = api_client_with_credentials.get(url, {"cursor": "", "page_size": 10})
+    ids = [i["id"] for i in resp.data["results"]]
+    while resp.data["next"]:
+        resp = api_client_with_credentials.get(resp.data["next"])
+        ids += [i["id"] for i in resp.data["results"]]
+    assert ids == sorted(Issue.objects.values_list("pk", flat=True))
+
+    resp = api_client_with_credentials.get(resp.data["previous"])
+    assert [i["id"] for i in resp.data["results"]] == ids[20:30]
+
+
+def test_invalid_cursor(api_client_with_credentials, list_of_issues):
+    resp = api_client_with_credentials.get(reverse("api:issue-list"), {"cursor": "invalid"})
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_conditional_get_detail(api_client_with_credentials, issue_with_arc):
+    url = reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk})
+    resp = api_client_with_credentials.get(url)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.has_header("Last-Modified")
+
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=resp["ETag"])
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_conditional_get_list_changes(api_client_with_credentials, list_of_issues):
+    url = reverse("api:issue-list")
+    etag = api_client_with_credentials.get(url)["ETag"]
+
+    issue = Issue.objects.first()
+    issue.desc = "Updated"
+    issue.save()
+
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["ETag"] != etag
+
+
+def test_conditional_get_list_embedded_changes(
+    api_client_with_credentials, list_of_issues, fc_series
+):
+    url = reverse("api:issue-list")
+    etag = api_client_with_credentials.get(url)["ETag"]
+
+    # The issues are revalidated with a single aggregate query, without loading them.
+    with CaptureQueriesContext(connection) as queries:
+        resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert len([q for q in queries if '"comicsdb_issue"' in q["sql"]]) == 1
+
+    fc_series.desc = "Updated"
+    fc_series.save()
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["ETag"] != etag
+
+
+def test_similar_covers(api_client_with_credentials, list_of_issues):
+    issues = list(Issue.objects.order_by("id")[:3])
+    for issue, cover_hash in zip(
+        issues, ["ffffffffffffffff", "fffffffffffffff0", "0000000000000000"], strict=True
+    ):
+        Issue.objects.filter(pk=issue.pk).update(
+            cover_hash=cover_hash, cover_hash_value=hash_to_int(cover_hash)
+        )
+
+    resp = api_client_with_credentials.get(
+        reverse("api:issue-similar"), {"cover_hash": "fffffffffffffffe", "max_distance": 4}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert [(i["id"], i["distance"]) for i in resp.data] == [
+        (issues[0].id, 1),
+        (issues[1].id, 3),
+    ]
+
+
+def test_similar_covers_requires_hash(api_client_with_credentials):
+    resp = api_client_with_credentials.get(reverse("api:issue-similar"))
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_cached_detail_invalidation(
+    api_client_with_credentials, issue_with_arc, django_capture_on_commit_callbacks
+):
+    url = reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk})
+    resp = api_client_with_credentials.get(url)
+    assert len(resp.data["arcs"]) == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        issue_with_arc.arcs.clear()
+
+    resp = api_client_with_credentials.get(url)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["arcs"] == []
+
+
+def test_sparse_fieldsets(api_client_with_credentials, issue_with_arc):
+    resp = api_client_with_credentials.get(reverse("api:issue-list"), {"fields": "id,number"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert set(resp.data["results"][0]) == {"id", "number"}
+
+    url = reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk})
+    resp = api_client_with_credentials.get(url, {"omit": "arcs,credits"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert "arcs" not in resp.data
+    assert "credits" not in resp.data
+    assert resp.data["id"] == issue_with_arc.pk
+
+
+def test_batch_lookup(api_client_with_credentials, issue_with_arc):
+    issue_with_arc.upc = "76194137738400111"
+    issue_with_arc.sku = "abc123"
+    issue_with_arc.save()
+    Variant.objects.create(
+        issue=issue_with_arc,
+        image="variants/cover.jpg",
+        name="Cover B",
+        upc="76194137738400121",
+    )
+    url = reverse("api:issue-batch-lookup")
+
+    values = ["76194-13773-8400111", "761941377384 00121", "761941377384", "123"]
+    resp = api_client_with_credentials.post(
+        url, data={"kind": "upc", "values": values}, format="json"
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    results = resp.data["results"]
+    for value in values[:3]:
+        assert [i["id"] for i in results[value]] == [issue_with_arc.pk]
+    assert results["123"] == []
+
+    resp = api_client_with_credentials.post(
+        url, data={"kind": "sku", "values": ["ABC123"]}, format="json"
+    )
+    assert [i["id"] for i in resp.data["results"]["ABC123"]] == [issue_with_arc.pk]
+
+
+def test_barcode_lookup(api_client_with_credentials, issue_with_arc):
+    issue_with_arc.upc = "76194137738400111"
+    issue_with_arc.save()
+    Variant.objects.create(
+        issue=issue_with_arc,
+        image="variants/cover.jpg",
+        name="Cover B",
+        upc="76194137738400121",
+    )
+    url = reverse("api:issue-barcode")
+
+    resp = api_client_with_credentials.get(url, {"code": "76194137738400121"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [(i["id"], i["variant"]) for i in resp.data] == [(issue_with_arc.pk, "Cover B")]
+
+    resp = api_client_with_credentials.get(url, {"code": "0761941377384"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert sorted(i["variant"] or "" for i in resp.data) == ["", "Cover B"]
+
+    for code in ("not a barcode", "12"):
+        resp = api_client_with_credentials.get(url, {"code": code})
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_book_barcode_lookup(api_client_with_credentials, issue_with_arc):
+    issue_with_arc.isbn = "1401225233"
+    issue_with_arc.save()
+    url = reverse("api:issue-barcode")
+
+    # The barcode of a book, with its price add-on.
+    resp = api_client_with_credentials.get(url, {"code": "9781401225230 51999"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [i["id"] for i in resp.data] == [issue_with_arc.pk]
+
+
+def test_identifiers_are_replaced_when_a_code_changes(issue_with_arc):
+    issue_with_arc.upc = "76194137738400111"
+    issue_with_arc.save()
+    indexed = list(Identifier.objects.filter(issue=issue_with_arc).values_list("pk", "value"))
+
+    issue_with_arc.desc = "Another description"
+    issue_with_arc.save()
+    current = Identifier.objects.filter(issue=issue_with_arc).values_list("pk", "value")
+    assert list(current) == indexed
+
+    issue_with_arc.upc = ""
+    issue_with_arc.sku = "abc123"
+    issue_with_arc.save()
+    current = Identifier.objects.filter(issue=issue_with_arc).values_list("kind", "value")
+    assert list(current) == [("sku", "ABC123")]
+
+
+def test_batch_lookup_invalid_kind(api_client_with_credentials):
+    resp = api_client_with_credentials.post(
+        reverse("api:arc-batch-lookup"),
+        data={"kind": "upc", "values": ["123"]},
+        format="json",
+    )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
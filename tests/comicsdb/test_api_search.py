@@ -0,0 +1,44 @@
+from django.urls import reverse
+from pytest_django.asserts import assertTemplateUsed
+from rest_framework import status
+
+HTML_OK_CODE = 200
+
+
+def test_unauthorized_search(db, api_client):
+    resp = api_client.get(reverse("api:search-list"), {"q": "final"})
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_search_groups_results_by_type(api_client_with_credentials, issue_with_arc):
+    resp = api_client_with_credentials.get(reverse("api:search-list"), {"q": "final cris"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert set(resp.data) == {"series", "issue", "arc"}
+    assert resp.data["issue"]["count"] == 1
+    assert resp.data["issue"]["results"][0]["id"] == issue_with_arc.pk
+    assert resp.data["issue"]["results"][0]["name"] == str(issue_with_arc)
+
+
+def test_search_by_type(api_client_with_credentials, issue_with_arc):
+    resp = api_client_with_credentials.get(
+        reverse("api:search-list"), {"q": "final", "type": "arc"}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert list(resp.data) == ["arc"]
+
+
+def test_search_entries_follow_series_rename(api_client_with_credentials, issue_with_arc):
+    series = issue_with_arc.series
+    series.name = "Infinite Crisis"
+    series.save()
+    resp = api_client_with_credentials.get(reverse("api:search-list"), {"q": "infinite"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["issue"]["results"][0]["name"] == str(series) + " #1"
+
+
+def test_search_view(auto_login_user, fc_arc):
+    client, _ = auto_login_user()
+    resp = client.get(reverse("search"), {"q": "final"})
+    assert resp.status_code == HTML_OK_CODE
+    assertTemplateUsed(resp, "comicsdb/search.html")
+    assert [group["name"] for group in resp.context["groups"]] == ["arc"]
@@ -3,7 +3,9 @@ from functools import reduce
 from urllib.parse import quote_plus
 
 import pytest
+from django.db import connection
 from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
@@ -112,3 +114,20 @@ def test_series_search(api_client_with_credentials, bat_sups_series, fc_series):
     serializer = SeriesListSerializer(expected, many=True)
     assert resp.status_code == status.HTTP_200_OK
     assert resp.data["results"] == serializer.data
+
+
+def test_sparse_property_field(
+    api_client_with_credentials, django_assert_num_queries, fc_series, bat_sups_series
+):
+    # `issue_count` is a property reading `num_issues`, which mustn't be deferred.
+    url = reverse("api:series-list")
+    with CaptureQueriesContext(connection) as queries:
+        resp = api_client_with_credentials.get(
+            url, {"fields": "id,issue_count", "page_size": 1}
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert set(resp.data["results"][0]) == {"id", "issue_count"}
+
+    with django_assert_num_queries(len(queries)):
+        resp = api_client_with_credentials.get(url, {"fields": "id,issue_count"})
+    assert len(resp.data["results"]) == 2
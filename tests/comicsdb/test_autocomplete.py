@@ -0,0 +1,36 @@
+from comicsdb.autocomplete import autocomplete_queryset
+from comicsdb.models.creator import Creator
+
+SEARCH_FIELDS = ["name__search_contains", "alias__search_contains"]
+
+
+def test_autocomplete_matches_unaccented_alias(john_byrne, walter_simonson):
+    john_byrne.alias = ["Jöhn Býrne"]
+    john_byrne.save()
+    qs = autocomplete_queryset(
+        Creator.objects.all(), "test", ["alias__search_contains"], "byrn"
+    )
+    assert list(qs) == [john_byrne]
+
+
+def test_autocomplete_refines_cached_prefix(
+    django_assert_num_queries, john_byrne, walter_simonson
+):
+    with django_assert_num_queries(2):
+        qs = autocomplete_queryset(Creator.objects.all(), "test", SEARCH_FIELDS, "r")
+        assert set(qs) == {john_byrne, walter_simonson}
+
+    # The longer terms are narrowed down from the cached results, so only the final
+    # query loading the objects is made.
+    for term in ("rn", "rne"):
+        with django_assert_num_queries(1):
+            qs = autocomplete_queryset(Creator.objects.all(), "test", SEARCH_FIELDS, term)
+            assert list(qs) == [john_byrne]
+
+
+def test_search_contains_lookup(john_byrne, walter_simonson):
+    john_byrne.alias = ["Jöhn Býrne"]
+    john_byrne.save()
+    assert list(Creator.objects.filter(alias__search_contains="byr")) == [john_byrne]
+    assert list(Creator.objects.filter(name__search_contains="SIMÖN")) == [walter_simonson]
+    assert not Creator.objects.filter(name__search_contains="b%").exists()
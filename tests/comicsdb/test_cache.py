@@ -0,0 +1,103 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from comicsdb.cache import (
+    detail_fragment_key,
+    detail_version_key,
+    get_cached_representation,
+    get_or_refresh,
+    invalidate_detail_pages,
+)
+from comicsdb.models import Issue
+
+
+def test_get_or_refresh_caches_value():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert get_or_refresh("test", compute, 60) == 1
+    assert get_or_refresh("test", compute, 60) == 1
+    assert len(calls) == 1
+
+
+def test_get_or_refresh_serves_stale_value_while_refreshing():
+    get_or_refresh("test", lambda: "stale", -1)
+    # Another request holds the lock, refreshing the expired value.
+    cache.add("test:refresh", True, 60)
+    assert get_or_refresh("test", lambda: "fresh", 60) == "stale"
+    cache.delete("test:refresh")
+    assert get_or_refresh("test", lambda: "fresh", 60) == "fresh"
+
+
+@pytest.mark.django_db()
+def test_detail_fragment_key_changes_with_dependencies(django_capture_on_commit_callbacks):
+    issue = Issue(pk=1, series_id=2, modified=timezone.now())
+    key = detail_fragment_key(issue, [("series", 2)])
+    assert detail_fragment_key(issue, [("series", 2)]) == key
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_detail_pages("series", [2])
+    assert detail_fragment_key(issue, [("series", 2)]) != key
+
+
+def test_cached_issue_etag_changes_with_embedded_objects(
+    api_client_with_credentials,
+    django_capture_on_commit_callbacks,
+    issue_with_arc,
+    batman,
+):
+    url = reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk})
+    etag = api_client_with_credentials.get(url)["ETag"]
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+    with django_capture_on_commit_callbacks(execute=True):
+        issue_with_arc.characters.add(batman)
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["ETag"] != etag
+
+
+def test_reverse_clear_invalidates_issue_cache(
+    api_client_with_credentials,
+    django_capture_on_commit_callbacks,
+    issue_with_arc,
+    batman,
+):
+    issue_with_arc.characters.add(batman)
+    api_client_with_credentials.get(
+        reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk})
+    )
+    assert get_cached_representation("issue", issue_with_arc.pk)[0] is not None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        batman.issues.clear()
+    assert get_cached_representation("issue", issue_with_arc.pk)[0] is None
+
+
+def test_moved_series_invalidates_both_publisher_pages(
+    django_capture_on_commit_callbacks, fc_series, dc_comics, marvel
+):
+    fc_series.publisher = marvel
+    with django_capture_on_commit_callbacks(execute=True):
+        fc_series.save()
+    assert cache.get(detail_version_key("publisher", dc_comics.pk)) is not None
+    assert cache.get(detail_version_key("publisher", marvel.pk)) is not None
+
+
+def test_cached_issue_is_only_served_if_it_can_be_retrieved(
+    api_client_with_credentials, issue_with_arc
+):
+    url = reverse("api:issue-detail", kwargs={"pk": issue_with_arc.pk})
+    api_client_with_credentials.get(url)
+    assert get_cached_representation("issue", issue_with_arc.pk)[0] is not None
+
+    # The entry is invalidated once the deletion commits, which it doesn't in the test.
+    Issue.objects.filter(pk=issue_with_arc.pk).delete()
+    resp = api_client_with_credentials.get(url)
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
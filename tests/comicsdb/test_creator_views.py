@@ -108,6 +108,18 @@ def test_creator_search_lists_all_creators(auto_login_user, list_of_creators):
     assert len(resp.context["creator_list"]) == PAGINATE_DIFF_VAL
 
 
+def test_creator_search_matches_unaccented_alias(auto_login_user, john_byrne):
+    john_byrne.alias = ["Jöhn Býrne"]
+    john_byrne.save()
+    client, _ = auto_login_user()
+    resp = client.get("/creator/search?q=byr")
+    assert resp.status_code == HTML_OK_CODE
+    assert list(resp.context["creator_list"]) == [john_byrne]
+
+    resp = client.get("/creator/search?q=jöh")
+    assert list(resp.context["creator_list"]) == [john_byrne]
+
+
 # CreatorList
 def test_creator_list_view_url_exists_at_desired_location(auto_login_user):
     client, _ = auto_login_user()
@@ -0,0 +1,110 @@
+import pytest
+from django.urls import reverse
+
+from comicsdb.models.change import Change
+from comicsdb.models.character import Character
+from comicsdb.models.creator import Creator
+from comicsdb.models.credits import Credits, Role
+from comicsdb.models.issue import Issue
+from comicsdb.models.team import Team
+
+
+@pytest.fixture()
+def other_issue(basic_issue: Issue) -> Issue:
+    return Issue.objects.create(
+        series=basic_issue.series,
+        number="2",
+        cover_date=basic_issue.cover_date,
+        edited_by=basic_issue.edited_by,
+        created_by=basic_issue.created_by,
+    )
+
+
+def make_creator(user, name: str, slug: str) -> Creator:
+    return Creator.objects.create(name=name, slug=slug, edited_by=user, created_by=user)
+
+
+def make_roles(*names: str) -> list[Role]:
+    start = Role.objects.count()
+    return [
+        Role.objects.create(name=name, order=order)
+        for order, name in enumerate(names, start=start + 1)
+    ]
+
+
+def run_action(client, action: str, issues: list[Issue]) -> set[tuple[str, int, str]]:
+    """Run an action through the changelist, and return the changes it logged."""
+    last = Change.objects.order_by("id").last()
+    resp = client.post(
+        reverse("admin:comicsdb_issue_changelist"),
+        {"action": action, "_selected_action": [issue.pk for issue in issues]},
+    )
+    assert resp.status_code == 302
+    changes = Change.objects.filter(id__gt=last.id if last else 0)
+    return {
+        (change.content_type.model, change.object_id, change.operation) for change in changes
+    }
+
+
+def credited_roles(issue: Issue) -> dict[str, set[str]]:
+    return {
+        credit.creator.name: {role.name for role in credit.role.all()}
+        for credit in Credits.objects.filter(issue=issue)
+    }
+
+
+def test_add_dc_credits(admin_client, basic_issue: Issue, other_issue: Issue) -> None:
+    user = basic_issue.created_by
+    jim = make_creator(user, "Jim Lee", "jim-lee")
+    marie = make_creator(user, "Marie Javins", "marie-javins")
+    make_roles("Publisher", "Chief Creative Officer", "President", "Editor In Chief")
+    # Existing credits are left as they are.
+    existing = Credits.objects.create(issue=basic_issue, creator=marie)
+    existing.role.add(*make_roles("Writer"))
+
+    changes = run_action(admin_client, "add_dc_credits", [basic_issue, other_issue])
+
+    jim_roles = {"Publisher", "Chief Creative Officer", "President"}
+    assert credited_roles(basic_issue) == {jim.name: jim_roles, marie.name: {"Writer"}}
+    assert credited_roles(other_issue) == {
+        jim.name: jim_roles,
+        marie.name: {"Editor In Chief"},
+    }
+    new = Credits.objects.exclude(pk=existing.pk).values_list("pk", flat=True)
+    assert changes == {("credits", pk, Change.Operation.CREATE) for pk in new}
+
+
+def test_add_marvel_credits(admin_client, basic_issue: Issue, other_issue: Issue) -> None:
+    cb = make_creator(basic_issue.created_by, "C.B. Cebulski", "c-b-cebulski")
+    make_roles("Editor In Chief")
+
+    changes = run_action(admin_client, "add_marvel_credits", [basic_issue, other_issue])
+
+    for issue in (basic_issue, other_issue):
+        assert credited_roles(issue) == {cb.name: {"Editor In Chief"}}
+    new = Credits.objects.values_list("pk", flat=True)
+    assert changes == {("credits", pk, Change.Operation.CREATE) for pk in new}
+
+
+def test_add_reprint_info(
+    admin_client,
+    basic_issue: Issue,
+    other_issue: Issue,
+    superman: Character,
+    teen_titans: Team,
+) -> None:
+    basic_issue.name = ["The Death of Superman"]
+    basic_issue.save()
+    basic_issue.characters.add(superman)
+    basic_issue.teams.add(teen_titans)
+    tpb = other_issue
+    tpb.reprints.add(basic_issue)
+
+    changes = run_action(admin_client, "add_reprint_info", [tpb])
+
+    tpb.refresh_from_db()
+    assert tpb.name == ["The Death of Superman"]
+    assert list(tpb.characters.all()) == [superman]
+    assert list(tpb.teams.all()) == [teen_titans]
+    # The reprinted issue isn't changed.
+    assert changes == {("issue", tpb.pk, Change.Operation.UPDATE)}
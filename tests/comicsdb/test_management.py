@@ -1,13 +1,22 @@
+import gzip
+import json
+
 import pytest
 from django.core.management import call_command
+from PIL import Image
 
+from comicsdb.cover_hash import hash_image, hash_to_int
+from comicsdb.export import get_manifest
 from comicsdb.models.arc import Arc
 from comicsdb.models.attribution import Attribution
+from comicsdb.models.change import Change
 from comicsdb.models.character import Character
 from comicsdb.models.creator import Creator
 from comicsdb.models.credits import Credits, Role
+from comicsdb.models.daily_count import DailyCount
 from comicsdb.models.issue import Issue
 from comicsdb.models.team import Team
+from comicsdb.rollups import issues_by_publisher, totals
 
 FAKE_CVID = 9999
 FAKE_DESC = "Duplicate Object"
@@ -102,3 +111,71 @@ def test_merge_creators(
     assert john_byrne.desc == FAKE_DESC
     assert john_byrne.cv_id == FAKE_CVID
     assert credit_obj.creator == john_byrne
+
+
+def test_export_data(settings, tmp_path, issue_with_arc: Issue) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    call_command("export_data")
+
+    manifest = get_manifest()
+    issues = manifest["files"]["issues"]
+    assert issues["count"] == 1
+    with gzip.open(tmp_path / issues["path"], "rt") as f:
+        data = json.loads(f.readline())
+    assert data["id"] == issue_with_arc.id
+    assert data["arcs"] == list(issue_with_arc.arcs.values_list("id", flat=True))
+
+
+def test_update_daily_counts(issue_with_arc: Issue, dc_comics) -> None:
+    assert totals()[Issue] == 1
+    assert issues_by_publisher() == {dc_comics.name: 1}
+    issue_with_arc.delete()
+    assert totals()[Issue] == 0
+
+    DailyCount.objects.all().delete()
+    call_command("update_daily_counts")
+    assert totals()[Arc] == 1
+    assert totals()[Issue] == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_delete_publisher_with_issues(issue_with_arc: Issue, dc_comics) -> None:
+    # The deferred foreign keys are only checked when the transaction commits.
+    dc_comics.delete()
+    assert not DailyCount.objects.filter(publisher_id=dc_comics.pk).exists()
+    assert totals()[Issue] == 0
+
+
+def test_update_cover_hashes(settings, tmp_path, basic_issue: Issue) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    Image.new("RGB", (320, 480), "red").save(tmp_path / "cover.jpg")
+    Issue.objects.filter(pk=basic_issue.pk).update(image="cover.jpg")
+    updates = Change.objects.filter(
+        object_id=basic_issue.pk, operation=Change.Operation.UPDATE
+    )
+    logged = updates.count()
+
+    call_command("update_cover_hashes")
+    basic_issue.refresh_from_db()
+    assert basic_issue.cover_hash == hash_image(tmp_path / "cover.jpg")
+    assert basic_issue.cover_hash_value == hash_to_int(basic_issue.cover_hash)
+    assert updates.count() == logged + 1
+
+
+def test_dup_credits(issue_with_arc: Issue, john_byrne: Creator, writer: Role) -> None:
+    credit_obj = Credits.objects.create(issue=issue_with_arc, creator=john_byrne)
+    credit_obj.role.add(writer)
+    target = Issue.objects.create(
+        series=issue_with_arc.series,
+        number="2",
+        cover_date=issue_with_arc.cover_date,
+        edited_by=issue_with_arc.edited_by,
+        created_by=issue_with_arc.created_by,
+    )
+
+    call_command("dup_credits", "--from", issue_with_arc.id, "--to", target.id, "--dry-run")
+    assert not Credits.objects.filter(issue=target).exists()
+
+    call_command("dup_credits", "--from", issue_with_arc.id, "--to", target.id)
+    new_credit = Credits.objects.get(issue=target, creator=john_byrne)
+    assert list(new_credit.role.all()) == [writer]
@@ -13,7 +13,7 @@ from comicsdb.models import (
     Team,
     Universe,
 )
-from comicsdb.models.common import generate_slug_from_name
+from comicsdb.models.common import allocate_slugs, generate_slug_from_name
 from comicsdb.models.genre import Genre
 
 HTTP_200_OK = 200
@@ -34,6 +34,11 @@ def test_team_creation(avengers):
     assert new_slug == expected_slug
 
 
+def test_allocate_slugs(avengers):
+    slugs = allocate_slugs(Team, [avengers.slug, "x-men", avengers.slug])
+    assert slugs == [f"{avengers.slug}-1", "x-men", f"{avengers.slug}-2"]
+
+
 def test_team_verbose_name_plural(avengers):
     assert str(avengers._meta.verbose_name_plural) == "teams"
 
@@ -99,6 +104,8 @@ def test_role_verbose_name_plural(writer):
 
 
 def test_publisher_series_count(dc_comics, fc_series):
+    # The counter is updated in the database, so the object is stale until refreshed.
+    dc_comics.refresh_from_db()
     assert dc_comics.series_count == 1
 
 
@@ -117,6 +124,8 @@ def test_publisher_absolute_url(client, dc_comics):
 
 
 def test_imprint_series_count(vertigo_imprint, sandman_series):
+    # The counter is updated in the database, so the object is stale until refreshed.
+    vertigo_imprint.refresh_from_db()
     assert vertigo_imprint.series_count == 1
 
 
@@ -164,10 +173,51 @@ def test_issue_absolute_url(client, issue_with_arc):
 
 # This test should be in the SeriesTest but for now let's leave this here.
 def test_issue_count(issue_with_arc, superman):
+    # The counter is updated in the database, so the object is stale until refreshed.
+    superman.refresh_from_db()
     issue_count = superman.issue_count
     assert issue_count == 1
 
 
+def test_issue_count_updates(issue_with_arc, fc_series, bat_sups_series, superman):
+    fc_series.refresh_from_db()
+    assert fc_series.issue_count == 1
+
+    issue_with_arc.series = bat_sups_series
+    issue_with_arc.save()
+    fc_series.refresh_from_db()
+    bat_sups_series.refresh_from_db()
+    assert fc_series.issue_count == 0
+    assert bat_sups_series.issue_count == 1
+
+    issue_with_arc.delete()
+    bat_sups_series.refresh_from_db()
+    superman.refresh_from_db()
+    assert bat_sups_series.issue_count == 0
+    assert superman.issue_count == 0
+
+
+def test_issue_tracked_fields(issue_with_arc, fc_series, bat_sups_series):
+    issue = Issue.objects.get(pk=issue_with_arc.pk)
+    assert not issue.has_changed("series")
+
+    issue.series = bat_sups_series
+    assert issue.has_changed("series")
+    assert issue.previous("series") == fc_series.pk
+
+    issue.save()
+    assert not issue.has_changed("series")
+    assert issue.previous("series") == bat_sups_series.pk
+
+
+def test_save_keeps_issue_count(issue_with_arc, fc_series):
+    # The series was loaded before its issue was created, so its counter is stale.
+    fc_series.desc = "Another description"
+    fc_series.save()
+    fc_series.refresh_from_db()
+    assert fc_series.issue_count == 1
+
+
 def test_seriestype_creation(single_issue_type):
     assert isinstance(single_issue_type, SeriesType)
     assert str(single_issue_type) == single_issue_type.name
@@ -0,0 +1,17 @@
+import pytest
+
+from comicsdb.models.credits import Role
+from comicsdb.reference import active_announcements, get_role
+
+
+def test_active_announcements(announcement):
+    assert active_announcements() == [announcement]
+
+
+def test_get_role_reloads_changed_roles(writer, django_capture_on_commit_callbacks):
+    assert get_role("WRITER") == writer
+    with pytest.raises(Role.DoesNotExist):
+        get_role("Penciller")
+    with django_capture_on_commit_callbacks(execute=True):
+        penciller = Role.objects.create(name="Penciller", notes="Nothing here.", order=30)
+    assert get_role("penciller") == penciller
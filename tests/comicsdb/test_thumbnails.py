@@ -0,0 +1,84 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from comicsdb import background, thumbnails
+from comicsdb.models.arc import Arc
+from comicsdb.models.issue import Issue
+from comicsdb.thumbnails import COVER, LARGE_COVER, THUMBNAIL_FORMAT, generate_thumbnails
+
+
+@pytest.fixture()
+def generated(monkeypatch) -> list[tuple[str, str, str, str]]:
+    """The (image, geometry, crop, format) of the thumbnails asked to sorl."""
+    calls = []
+
+    def get_thumbnail(image, geometry, crop, format):  # noqa: A002 - sorl's argument name.
+        calls.append((str(image), geometry, crop, format))
+
+    monkeypatch.setattr(thumbnails, "get_thumbnail", get_thumbnail)
+    return calls
+
+
+@pytest.fixture()
+def issue_with_cover(basic_issue: Issue) -> Issue:
+    Issue.objects.filter(pk=basic_issue.pk).update(image="cover.jpg")
+    basic_issue.refresh_from_db()
+    return basic_issue
+
+
+def test_generate_thumbnails(generated, issue_with_cover: Issue) -> None:
+    assert generate_thumbnails(Issue, issue_with_cover.image) == 2
+    assert generated == [
+        ("cover.jpg", *COVER, THUMBNAIL_FORMAT),
+        ("cover.jpg", *LARGE_COVER, THUMBNAIL_FORMAT),
+    ]
+
+
+def test_generate_thumbnails_failure(monkeypatch, caplog, issue_with_cover: Issue) -> None:
+    def get_thumbnail(image, geometry, crop, format):  # noqa: A002 - sorl's argument name.
+        if geometry == LARGE_COVER[0]:
+            raise OSError
+
+    monkeypatch.setattr(thumbnails, "get_thumbnail", get_thumbnail)
+    # The other thumbnails are still generated.
+    assert generate_thumbnails(Issue, issue_with_cover.image) == 1
+    assert "Failed to generate the 640x960 thumbnail of cover.jpg" in caplog.text
+
+
+def test_saved_image_thumbnails(
+    monkeypatch, generated, django_capture_on_commit_callbacks, fc_arc: Arc
+) -> None:
+    monkeypatch.setattr(background, "run_in_background", lambda job, *args: job(*args))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        fc_arc.desc = "No image yet"
+        fc_arc.save()
+    assert generated == []
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        fc_arc.image = "arc/cover.jpg"
+        fc_arc.save()
+        # They're only generated once the image is committed.
+        assert generated == []
+    assert callbacks
+    assert generated == [("arc/cover.jpg", *COVER, THUMBNAIL_FORMAT)]
+
+
+def test_warm_thumbnails(generated, issue_with_cover: Issue) -> None:
+    Issue.objects.create(
+        series=issue_with_cover.series,
+        number="2",
+        cover_date=issue_with_cover.cover_date,
+        edited_by=issue_with_cover.edited_by,
+        created_by=issue_with_cover.created_by,
+    )
+    out = StringIO()
+    call_command("warm_thumbnails", model="issue", stdout=out)
+    assert "Warmed 2 thumbnails of issues" in out.getvalue()
+    # The issues without an image are skipped.
+    assert sorted(generated) == [
+        ("cover.jpg", *COVER, THUMBNAIL_FORMAT),
+        ("cover.jpg", *LARGE_COVER, THUMBNAIL_FORMAT),
+    ]